@@ -2,22 +2,405 @@
 Main entry point for Betway automation
 """
 import asyncio
+import bisect
 import os
 import json
 import random
 import math
 import gc  # Garbage collection for memory management
+import time
+import atexit
+import contextlib
 import traceback  # For detailed error tracebacks
-from itertools import product
+import functools
+import hashlib
+import weakref
+import logging
+import sys
+from collections import Counter, OrderedDict
+from itertools import chain, islice, product
 from playwright.async_api import async_playwright, Page
 from playwright._impl._errors import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 import re
 
+try:
+    import ahocorasick  # Optional (pyahocorasick) - falls back to a single alternation regex
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # Optional - faster progress-file (de)serialization, falls back to json
+except ImportError:
+    orjson = None
+
 # Load environment variables from .env file
 load_dotenv()
 
+# Debug-tier output (retry chatter, DOM dumps) goes through logging so it collapses to a
+# level check unless LOG_LEVEL=DEBUG is set. User-facing status stays on print().
+log = logging.getLogger("betway")
+if not log.handlers:
+    _log_handler = logging.StreamHandler(sys.stdout)
+    _log_handler.setFormatter(logging.Formatter('%(message)s'))
+    log.addHandler(_log_handler)
+    log.propagate = False
+_log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
+if not isinstance(logging.getLevelName(_log_level), int):
+    print(f"⚠️ Unknown LOG_LEVEL '{_log_level}' - using INFO")
+    _log_level = 'INFO'
+log.setLevel(_log_level)
+
+# While main_async runs, stdout is block-buffered even on a terminal: a bet prints a dozen or
+# more status lines, flushed every _STDOUT_FLUSH_INTERVAL seconds instead of one write() per line
+_STDOUT_FLUSH_INTERVAL = 1.0
+
+
+async def flush_stdout_periodically():
+    """Background task: push buffered output to the terminal at most a second late."""
+    while True:
+        await asyncio.sleep(_STDOUT_FLUSH_INTERVAL)
+        sys.stdout.flush()
+
+
+@contextlib.asynccontextmanager
+async def buffered_stdout():
+    """
+    Block-buffer stdout for one run, flushed periodically by flush_stdout_periodically().
+    On the way out - normally, on sys.exit or on an exception - pending lines are flushed
+    before any traceback reaches stderr, and the previous line buffering is restored.
+    """
+    reconfigure = getattr(sys.stdout, 'reconfigure', None)
+    was_line_buffered = getattr(sys.stdout, 'line_buffering', False)
+    if reconfigure:
+        reconfigure(line_buffering=False)
+    flusher = asyncio.create_task(flush_stdout_periodically())
+    try:
+        yield
+    finally:
+        flusher.cancel()
+        sys.stdout.flush()
+        if reconfigure:
+            reconfigure(line_buffering=was_line_buffered)
+
+
+# ============================================================================
+# PRECOMPILED PATTERNS (compiled once, reused on every bet)
+# ============================================================================
+
+# Odds value like "1.85" anywhere in betslip text
+_ODDS_RE = re.compile(r'\d+\.\d{2}')
+# A whole odd as scraped from a price span ("2.45" / "2,45")
+_ODD_TEXT_RE = re.compile(r'^\d+(?:[.,]\d+)?$')
+# Bet button text ("Bet Now" / "Place Bet"), case-insensitive so no .lower() copy is needed
+_BET_BTN_RE = re.compile(r'bet now|place bet', re.IGNORECASE)
+# Return calculation shown once a stake is entered ("Return" or "Total"), single scan
+_RETURN_OR_TOTAL_RE = re.compile(r'Return|Total')
+# Selection odds as shown in the betslip (e.g. "@ 1.85")
+_SLIP_ODDS_RE = re.compile(r'@\s*\d+\.\d{2}')
+# Balance text (e.g. "R 85.51" -> 85.51)
+_BALANCE_RE = re.compile(r'R\s*(\d+(?:[.,]\d+)?)')
+# Match start-time text: future date ("12 Jan") and the HH:MM part
+_FUTURE_DATE_RE = re.compile(r'\d{1,2}\s+\w{3}')
+_HHMM_RE = re.compile(r'(\d{1,2}):(\d{2})')
+# "Live" / "LIVE" / "live" badge in a start-time text, without a .lower() copy
+_LIVE_RE = re.compile('live', re.IGNORECASE)
+# Standalone booking code line (8-12 uppercase alphanumeric chars)
+_STANDALONE_CODE_RE = re.compile(r'^[A-Z0-9]{8,12}$')
+# Booking code / betslip ID patterns on the confirmation modal, tried in order
+_BOOKING_CODE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Booking\s*Code[\s:]*\n?\s*([A-Z0-9-]+)',  # Code may be on next line
+    r'Booking\s*Code[\s:]+([A-Z0-9-]+)',
+    r'Booking[\s:]+([A-Z0-9]{6,})',
+    r'Code[\s:]+([A-Z0-9]{8,})',  # At least 8 chars
+))
+_BETSLIP_ID_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Betslip\s*ID[\s:]*\n?\s*([A-Z0-9-]+)',
+    r'Betslip\s*ID[\s:]+([A-Z0-9-]+)',
+    r'Bet\s*ID[\s:]+([A-Z0-9-]+)',
+    r'Reference[\s:]+([A-Z0-9-]+)',
+))
+# "Loginshare" with any spaces in between - same as checking text.replace(' ', '') without the copy
+_LOGIN_SHARE_RE = re.compile(' *'.join('Loginshare'))
+
+# Lowercase conflict needles checked against the betslip text before placing a bet. The
+# Login/Total/Return/Stake/1X2 checks are case-sensitive and run on the original text instead.
+_BETSLIP_NEEDLES = ('conflict', 'there are', 'revise')
+
+if ahocorasick is not None:
+    _BETSLIP_AUTOMATON = ahocorasick.Automaton()
+    for _needle in _BETSLIP_NEEDLES:
+        _BETSLIP_AUTOMATON.add_word(_needle, _needle)
+    _BETSLIP_AUTOMATON.make_automaton()
+else:
+    _BETSLIP_NEEDLES_RE = re.compile('|'.join(re.escape(n) for n in _BETSLIP_NEEDLES))
+
+
+def scan_betslip_needles(text_l: str) -> dict:
+    """Count every _BETSLIP_NEEDLES occurrence in lowercased betslip text in one pass."""
+    hits = {}
+    if ahocorasick is not None:
+        for _, needle in _BETSLIP_AUTOMATON.iter(text_l):
+            hits[needle] = hits.get(needle, 0) + 1
+    else:
+        for m in _BETSLIP_NEEDLES_RE.finditer(text_l):
+            hits[m.group()] = hits.get(m.group(), 0) + 1
+    return hits
+
+
+# ============================================================================
+# SHARED SELECTOR CONSTANTS (built once at import, not per call)
+# ============================================================================
+
+# Button text that marks account / deposit / login controls - never click these
+_SKIP_KEYWORDS = ('account', 'deposit', 'withdraw', 'profile', 'login', 'sign', 'register')
+
+# Account Options modal markers checked first by close_all_modals()
+_ACCOUNT_OPTIONS_INDICATORS = (
+    'text="Account Options"',
+    'text="Deposit funds"',
+    'text="27614220968"',  # Account number pattern
+    ':has-text("Account Options")',
+)
+
+# Close-only buttons for generic popups (never action buttons)
+_MODAL_CLOSE_SELECTORS = (
+    'svg[id="modal-close-btn"]',  # Betslip and modal close button (specific ID)
+    'button[aria-label="Close"]',  # Exact match for Close button
+    'button[aria-label="close"]',  # Exact match lowercase
+    'button:has-text("×")',  # X button
+    'button:has-text("Close"):not([aria-label*="Account"])',  # Close text but not account related
+    'button:has-text("GOT IT")',  # Common popup dismiss
+    'button:has-text("OK"):not([id*="deposit"]):not([id*="account"])',  # OK button but not deposit/account
+)
+
+# Generic "a modal is open" markers - Escape is only pressed when one is visible
+_MODAL_INDICATORS = (
+    'div[role="dialog"]',
+    'div[class*="modal"]',
+    'div[class*="popup"]',
+    'div[aria-modal="true"]',
+)
+
+# Error / conflict messages inside the betslip
+_BETSLIP_ERROR_SELECTORS = (
+    'div.error-message',
+    'div[class*="error"]',
+    'span[class*="error"]',
+    'div.betslip-error',
+    'div[class*="conflict"]',
+    'span[class*="conflict"]',
+    'div[role="alert"]',
+)
+_BETSLIP_ERROR_UNION = ', '.join(_BETSLIP_ERROR_SELECTORS)
+
+# "Bet Now" button selectors, container-scoped first (sign-up button excluded)
+_BET_BUTTON_SELECTORS = (
+    # First priority: Look inside betslip container with exact ID from HTML
+    'div#betslip-container button#betslip-strike-btn',
+    'button#betslip-strike-btn',
+    '#betslip-strike-btn',
+
+    # Secondary: Look by aria-label INSIDE betslip
+    'div#betslip-container button[aria-label="Bet Now"]',
+    'div#betslip-container-mobile button[aria-label="Bet Now"]',
+    'button[aria-label="Bet Now"]:not(#sign-up-btn)',
+
+    # Tertiary: Look by text content INSIDE betslip container
+    'div#betslip-container button:has-text("Bet Now")',
+    'div#betslip-container-mobile button:has-text("Bet Now")',
+    'button.p-button:has-text("Bet Now"):not(#sign-up-btn)',
+
+    # Quaternary: Look by class combinations from HTML BUT exclude sign-up button
+    'div#betslip-container button.p-button.bg-identity',
+    'div#betslip-container-mobile button.p-button.bg-identity',
+    'button.p-button.bg-identity:not(#sign-up-btn)',
+
+    # Last resort: Any button with Bet in betslip container (explicitly exclude sign-up)
+    'div#betslip-container button:has-text("Bet"):not(#sign-up-btn)',
+    'div#betslip-container-mobile button:has-text("Bet"):not(#sign-up-btn)',
+)
+_BET_BUTTON_UNION_SELECTOR = ', '.join(_BET_BUTTON_SELECTORS)
+
+# The button rank_bet_buttons picks is tagged so the click locator resolves to exactly that
+# element (ids are not CSS-escaped and the union also matches non-betslip buttons)
+_BET_TARGET_TAG_JS = '''el => {
+    document.querySelectorAll('[data-bet-target]').forEach(e => e.removeAttribute('data-bet-target'));
+    el.setAttribute('data-bet-target', '1');
+}'''
+_BET_TARGET_SELECTOR = '[data-bet-target]'
+_BETSLIP_BET_BUTTON_SELECTOR = ', '.join(
+    f'{container} button:not(#sign-up-btn)' for container in ('#betslip-container', '#betslip-container-mobile')
+)
+
+# Elements unique to the bet confirmation modal
+_CONFIRMATION_SELECTORS = (
+    'button#strike-conf-continue-btn',  # "Continue betting" button - most specific
+    'span:has-text("Bet Confirmation")',  # Title of confirmation modal
+    'button:has-text("Continue betting")',  # Text of continue button
+    'div:has-text("Your bet has been placed")',  # Success message
+)
+
+# Generic confirm-style buttons used as a last-resort modal check
+_GENERIC_MODAL_SELECTORS = (
+    'button:has-text("Confirm")',
+    'button:has-text("Place Bet")',
+    'button:has-text("OK")',
+)
+
+# Bet confirmation markers - never close a modal showing these
+_CONFIRMATION_INDICATORS = (
+    'button#strike-conf-continue-btn',  # Continue betting button
+    'text="Bet Confirmation"',
+    'text="Booking Code"',
+    'text="Successful Bets"',
+    'text="Betslip:"',
+)
+
+# Account Options / Deposit modal markers, most reliable first
+_ACCOUNT_MODAL_INDICATORS = (
+    '#deposit-account-nav',  # Most reliable - the deposit nav tab
+    '#withdraw-account-nav',  # Withdraw nav tab
+    '#banking-iframe-deposit',  # Banking iframe
+    '[aria-label="Deposit funds"]',  # Aria label
+    'text="Account Options"',
+    'text="Deposit funds"',
+)
+
+# CSS-only subset of the above, usable as one wait_for_selector union
+_ACCOUNT_MODAL_CSS_UNION = ', '.join(sel for sel in _ACCOUNT_MODAL_INDICATORS if not sel.startswith('text='))
+
+# Growing poll delays (ms) for the post-click balance check - same 500ms budget as the old
+# fixed settle wait, but a fast balance update is seen after 50ms instead of 500ms
+_BALANCE_POLL_DELAYS_MS = (50, 100, 150, 200)
+
+# Welcome popups closed once after login
+_POST_LOGIN_CLOSE_SELECTORS = (
+    'button:has-text("×")',
+    'button:has-text("GOT IT")',
+    'button[aria-label="Close"]',
+    'svg[id="modal-close-btn"]',
+)
+
+# Outcome (1/X/2) button shapes across league page layouts, most specific first
+_OUTCOME_BUTTON_SELECTORS = (
+    'div.grid.p-1 > div.flex.items-center.justify-between.h-12',
+    'div[class*="grid"] > div[class*="flex items-center justify-between h-12"]',
+    'details:has(span:text("1X2")) div.grid > div',
+    'div[price]',
+    'button[data-translate-market-name="Full Time Result"] div[price]',
+    'div[data-translate-market-name="Full Time Result"] div[price]',
+    # Additional fallback selectors for different league structures
+    'div[class*="market"] div[price]',
+    'div[class*="outcome"] div[price]',
+    'div.flex.items-center.justify-between[price]',
+    'button[price]',
+    'div[data-price]',
+    'span[price]',
+    # More generic selectors as last resort
+    'div[class*="selection"]',
+    'div[class*="bet-button"]',
+    'div[class*="odds"]',
+)
+
+# Either shape of a rendered 1X2 outcome grid - what a match page is waited on before probing
+_OUTCOME_GRID_SELECTOR = 'div[price], div.grid.p-1 > div.flex.items-center.justify-between.h-12'
+
+# Match list paginator "Next" button
+_NEXT_PAGE_SELECTORS = (
+    'button[aria-label="Go to next page"]',
+    'button.p-ripple.p-element.p-paginator-next',
+    'button:has-text("Next")',
+    'button[class*="next"]',
+)
+
+# Collapsed-betslip toggles (mobile layout)
+_BETSLIP_TOGGLE_SELECTORS = (
+    'button[aria-label*="Betslip"]',
+    'div#betslip-toggle',
+    'button:has-text("Betslip")',
+    'div.betslip-toggle',
+)
+
+# Stake input shapes, most specific first
+_STAKE_INPUT_SELECTORS = (
+    '#bet-amount-input',
+    'input[placeholder="0.00"]',
+    'input[type="number"][inputmode="decimal"]',
+    'div#betslip-container-mobile input[type="number"]',
+    'div#betslip-container input[type="number"]',
+    'input[id*="bet-amount"]',
+    'input[class*="stake"]',
+    'input[placeholder*="0"]',  # Any placeholder with 0
+)
+# Playwright's :visible pseudo-class keeps hidden early matches from shadowing a visible input
+_STAKE_INPUT_VISIBLE_UNION = ", ".join(f"{sel}:visible" for sel in _STAKE_INPUT_SELECTORS)
+
+# "Continue betting" button on the bet confirmation modal. Selectors are :visible (like
+# _STAKE_INPUT_VISIBLE_UNION) so a hidden first match can't stall the visible wait. A union
+# resolves in DOM order, so it only gates the wait - callers pick a button in priority order.
+_CONTINUE_BETTING_SELECTORS = (
+    'button#strike-conf-continue-btn',  # Primary selector from HTML
+    'button[aria-label="Continue betting"]',
+    'button:has-text("Continue betting")',
+    'button:has-text("Continue")',  # Shorter text match (also covers the p-button variant)
+)
+_CONTINUE_BETTING_VISIBLE = tuple(f'{sel}:visible' for sel in _CONTINUE_BETTING_SELECTORS)
+_CONTINUE_BETTING_UNION = ', '.join(_CONTINUE_BETTING_VISIBLE)
+
+# Buttons that dismiss the bet confirmation modal, Continue betting first
+_CONFIRMATION_CLOSE_SELECTORS = (
+    'button#strike-conf-continue-btn',  # Continue betting button
+    'svg#modal-close-btn',  # Specific modal close button
+    'button[aria-label="Close"]',  # Exact match close button
+)
+_CONFIRMATION_CLOSE_VISIBLE = tuple(f'{sel}:visible' for sel in _CONFIRMATION_CLOSE_SELECTORS)
+_CONFIRMATION_CLOSE_UNION = ', '.join(_CONFIRMATION_CLOSE_VISIBLE)
+
+# Close buttons for the Account Options / Deposit modal
+_ACCOUNT_MODAL_CLOSE_SELECTORS = (
+    'svg[id="modal-close-btn"]',
+    '#modal-close-btn',
+    'button[aria-label="Close"]',
+    'button:has-text("×")',
+    '.modal-close-btn',
+)
+
+
+# ============================================================================
+# JSON FILE OUTPUT
+# ============================================================================
+
+
+def atomic_write(path: str, data: bytes):
+    """
+    Replace `path` with `data` via a temp file and os.replace, so a crash mid-write
+    leaves the previous version in place instead of a truncated file.
+    """
+    tmp = path + '.tmp'
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+def _dump(obj, path: str):
+    """
+    Atomically write `obj` to `path` as indented JSON.
+    Uses orjson when installed; non-serializable values fall back to str() either way.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(obj, default=str,
+                               option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    else:
+        payload = (json.dumps(obj, indent=2, default=str) + '\n').encode('utf-8')
+    atomic_write(path, payload)
+
 
 # ============================================================================
 # ERROR TRACKING SYSTEM WITH PROBLEM DETAILS (RFC 7807/RFC 9457)
@@ -443,8 +826,7 @@ class ErrorTracker:
                 'sessions': existing_sessions
             }
             
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            _dump(data, filename)
             print(f"📁 Problem Details log saved to: {filename} ({len(existing_sessions)} session(s), {total_problems} total problems)")
         except Exception as e:
             print(f"⚠️ Could not save problem log: {e}")
@@ -454,6 +836,246 @@ class ErrorTracker:
 error_tracker = ErrorTracker()
 
 
+# ============================================================================
+# PERSISTENT SELECTOR CACHE (survives script restarts)
+# ============================================================================
+
+SELECTOR_CACHE_FILE = "selector_cache.json"
+SELECTOR_CACHE_TTL_SECONDS = 24 * 60 * 60  # Betway match page DOM is stable for hours
+
+SELECTOR_CACHE_MAX_ENTRIES = 500  # Bounds the in-memory outcome cache on long multi-day runs
+# Identifies the selector lists the cache was built from; editing them for a Betway layout
+# change invalidates every cached entry instead of replaying selectors that no longer match
+_SELECTOR_LAYOUT_FINGERPRINT = hashlib.sha1(
+    '\n'.join(_OUTCOME_BUTTON_SELECTORS + ('',) + _STAKE_INPUT_SELECTORS).encode('utf-8')
+).hexdigest()[:12]
+
+
+class OutcomeButtonCache(OrderedDict):
+    """
+    LRU {match_url: selector} map: lookups refresh an entry, inserts past capacity evict the oldest.
+    Persists across browser restarts - the selectors are strings, not element handles.
+    """
+    
+    def __init__(self, maxsize=SELECTOR_CACHE_MAX_ENTRIES, *args, **kwargs):
+        self.maxsize = maxsize
+        super().__init__(*args, **kwargs)
+    
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+    
+    def __setitem__(self, key, value):
+        if key in self:
+            self.move_to_end(key)
+        super().__setitem__(key, value)
+        if len(self) > self.maxsize:
+            del self[next(iter(self))]
+
+# Last-known-good stake input selector plus (selector, first-seen) timestamps for it and for
+# each cached outcome selector - a timestamp only moves when its selector changes
+selector_cache_state = {'stake_selector': None, 'stake_timestamp': None, 'timestamps': {}, 'last_saved': None}
+
+
+def load_selector_cache(filename=SELECTOR_CACHE_FILE) -> OutcomeButtonCache:
+    """
+    Load the {match_url: selector} outcome-button cache from disk, dropping entries older than the TTL.
+    Also restores the last winning stake input selector.
+    """
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return OutcomeButtonCache()
+    except Exception as e:
+        print(f"⚠️ Could not load selector cache: {e}")
+        return OutcomeButtonCache()
+    
+    if data.get('layout') != _SELECTOR_LAYOUT_FINGERPRINT:
+        print(f"Selector lists changed since {filename} was written - ignoring it")
+        return OutcomeButtonCache()
+    
+    now = time.time()
+    outcome_cache = OutcomeButtonCache()
+    for url, entry in data.get('outcome_buttons', {}).items():
+        if isinstance(entry, dict) and entry.get('sel') and now - entry.get('ts', 0) < SELECTOR_CACHE_TTL_SECONDS:
+            outcome_cache[url] = entry['sel']
+            selector_cache_state['timestamps'][url] = (entry['sel'], entry['ts'])
+    
+    stake_entry = data.get('stake_selector')
+    if isinstance(stake_entry, dict) and now - stake_entry.get('ts', 0) < SELECTOR_CACHE_TTL_SECONDS:
+        selector_cache_state['stake_selector'] = stake_entry.get('sel')
+        selector_cache_state['stake_timestamp'] = (stake_entry.get('sel'), stake_entry['ts'])
+    
+    return outcome_cache
+
+
+def save_selector_cache(outcome_button_cache: dict, filename=SELECTOR_CACHE_FILE):
+    """
+    Write the selector cache to disk atomically (temp file + os.replace).
+    Skips the write if nothing changed since the last save.
+    """
+    now = time.time()
+    timestamps = selector_cache_state['timestamps']
+    outcome_entries = {}
+    for url, sel in outcome_button_cache.items():
+        previous = timestamps.get(url)
+        ts = previous[1] if previous and previous[0] == sel else now
+        timestamps[url] = (sel, ts)
+        outcome_entries[url] = {'sel': sel, 'ts': ts}
+    # Forget timestamps of URLs the LRU has evicted
+    for url in timestamps.keys() - outcome_entries.keys():
+        del timestamps[url]
+    
+    data = {'layout': _SELECTOR_LAYOUT_FINGERPRINT, 'outcome_buttons': outcome_entries}
+    stake = selector_cache_state['stake_selector']
+    if stake:
+        previous = selector_cache_state['stake_timestamp']
+        ts = previous[1] if previous and previous[0] == stake else now
+        selector_cache_state['stake_timestamp'] = (stake, ts)
+        data['stake_selector'] = {'sel': stake, 'ts': ts}
+    
+    # Timestamps follow the selectors, so comparing selectors alone is enough to skip a rewrite
+    snapshot = (tuple(sorted(outcome_button_cache.items())), stake)
+    if snapshot == selector_cache_state['last_saved']:
+        return
+    
+    try:
+        _dump(data, filename)
+        selector_cache_state['last_saved'] = snapshot
+    except Exception as e:
+        print(f"⚠️ Could not save selector cache: {e}")
+
+
+# ============================================================================
+# PROGRESS FILE PERSISTENCE
+# ============================================================================
+
+# The progress file holds the match set, written once per run; every checkpoint only
+# appends its counters as one NDJSON line to <progress file>.log
+_progress_log_handles = {}  # progress file -> open append handle of its .log
+
+
+def _encode_progress(data) -> bytes:
+    """Serialize progress data, with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    # dumps + one write: json.dump streams many small chunk writes through the file object
+    return json.dumps(data, default=str).encode('utf-8')
+
+
+def _decode_progress(raw: bytes):
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _close_progress_log(filename: str):
+    handle = _progress_log_handles.pop(filename, None)
+    if handle is not None:
+        handle.close()
+
+
+def save_progress_snapshot(filename: str, matches: list, fingerprint):
+    """
+    Write the match set atomically and start a fresh .log,
+    since any records already in it belong to the previous match set.
+    """
+    # Timestamped like a checkpoint, so the resume age checks apply before the first bet lands
+    atomic_write(filename, _encode_progress({
+        'matches_data': matches,
+        'match_fingerprint': fingerprint,
+        'timestamp': datetime.now().isoformat(),
+    }))
+    _close_progress_log(filename)
+    if os.path.exists(filename + '.log'):
+        os.remove(filename + '.log')
+
+
+def save_progress(filename: str, data: dict):
+    """
+    Checkpoint progress by appending `data` to the .log as one flushed line,
+    so a per-bet checkpoint costs a small append instead of a full rewrite.
+    """
+    handle = _progress_log_handles.get(filename)
+    if handle is None:
+        handle = _progress_log_handles[filename] = open(filename + '.log', 'ab')
+    handle.write(_encode_progress(data) + b'\n')
+    handle.flush()
+
+
+async def checkpoint_writer(queue: asyncio.Queue, filename: str):
+    """
+    Background task: append each queued checkpoint with save_progress() until cancelled.
+    The write runs in the default executor so a slow disk never stalls the event loop
+    (and with it Playwright's connection to the browser).
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        state = await queue.get()
+        try:
+            await loop.run_in_executor(None, save_progress, filename, state)
+        except Exception as e:
+            print(f"⚠️ Could not save progress: {e}")
+        finally:
+            queue.task_done()
+
+
+class ProgressLogError(Exception):
+    """The progress log exists but holds no readable record - resuming from zero would re-place bets."""
+
+
+# Exit code for a ProgressLogError: retrying can't fix the log, so main_with_auto_retry stops
+EXIT_PROGRESS_UNREADABLE = 3
+
+
+def _last_progress_record(raw: bytes):
+    """Decode the last complete line of an NDJSON chunk, skipping a torn one; None if none decodes."""
+    for line in reversed(raw.splitlines()):
+        try:
+            return _decode_progress(line)
+        except ValueError:
+            continue
+    return None
+
+
+def load_progress(filename: str) -> dict:
+    """
+    Read the progress written by save_progress_snapshot()/save_progress(): the snapshot merged with the last
+    complete .log record. A file from older runs (everything inline, no log) loads as-is.
+    
+    Raises:
+        ProgressLogError: The log is non-empty but not a single line of it decodes
+    """
+    with open(filename, 'rb') as f:
+        data = _decode_progress(f.read())
+    
+    log_file = filename + '.log'
+    if os.path.exists(log_file):
+        with open(log_file, 'rb') as f:
+            # Records are a few counters, so the tail normally holds the last few;
+            # if it holds no complete line, read the whole log rather than guess
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(max(0, size - 65536))
+            record = _last_progress_record(f.read())
+            if record is None and size > 65536:
+                f.seek(0)
+                record = _last_progress_record(f.read())
+        if record is None and size:
+            raise ProgressLogError(f"No readable checkpoint in {log_file} ({size} bytes)")
+        if record is not None:
+            data.update(record)
+    return data
+
+
+def clear_progress(filename: str):
+    """Delete the progress snapshot and its log."""
+    _close_progress_log(filename)
+    for path in (filename, filename + '.log'):
+        if os.path.exists(path):
+            os.remove(path)
+
+
 # ============================================================================
 # TIMEOUT-SAFE NAVIGATION HELPER
 # ============================================================================
@@ -502,6 +1124,23 @@ async def safe_goto(page: Page, url: str, **kwargs):
         raise  # Re-raise to let caller handle it
 
 
+async def prefetch_url(page: Page, url: str):
+    """
+    Hint the browser to fetch the next match page into its HTTP cache while the current
+    one is being worked on, so the following navigation is served mostly from cache.
+    Best-effort: failures are ignored.
+    """
+    try:
+        await page.evaluate('''url => {
+            const link = document.createElement('link');
+            link.rel = 'prefetch';
+            link.href = url;
+            document.head.appendChild(link);
+        }''', url)
+    except Exception:
+        pass
+
+
 async def safe_place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache: dict = None, outcome_button_cache: dict = None, timeout_seconds: int = 360):
     """
     Timeout-protected wrapper for place_bet_slip to prevent individual bets from hanging too long.
@@ -581,7 +1220,7 @@ async def get_current_balance(page: Page) -> float:
                         text = await element.inner_text()
                     
                     # Extract numeric value using regex (e.g., "R 85.51" -> 85.51)
-                    match = re.search(r'R\s*(\d+(?:[.,]\d+)?)', text)
+                    match = _BALANCE_RE.search(text)
                     if match:
                         balance_str = match.group(1).replace(',', '.')
                         return float(balance_str)
@@ -611,7 +1250,7 @@ async def count_betslip_selections(page: Page) -> int:
         
         # Alternative: count selection entries by looking for odds patterns
         # Each selection shows odds like "@ 1.85" or similar
-        odds_matches = re.findall(r'@\s*\d+\.\d{2}', betslip_text)
+        odds_matches = _SLIP_ODDS_RE.findall(betslip_text)
         count_odds = len(odds_matches)
         
         # Return the higher count (more reliable)
@@ -621,120 +1260,483 @@ async def count_betslip_selections(page: Page) -> int:
         return -1
 
 
-async def get_betslip_id_from_confirmation(page: Page) -> dict:
+async def find_first_visible(page: Page, selectors: list):
     """
-    Extract the Betslip ID and/or Booking Code from the Bet Confirmation modal.
-    Returns a dict with 'betslip_id' and 'booking_code' (either may be empty string).
+    Query independent selectors concurrently and return (selector, handle) for the
+    first visible match in priority order, or (None, None) if nothing is visible.
     """
-    result = {'betslip_id': '', 'booking_code': ''}
+    handles = await asyncio.gather(*[page.query_selector(sel) for sel in selectors], return_exceptions=True)
+    found = [(sel, h) for sel, h in zip(selectors, handles) if h and not isinstance(h, Exception)]
+    if not found:
+        return None, None
     
-    try:
-        # Wait a moment for modal to fully render
-        await page.wait_for_timeout(800)
-        
-        # PRIORITY 1: Look specifically for Bet Confirmation modal elements
-        # The modal typically contains "Bet Confirmation" header and the Booking Code
-        bet_confirmation_selectors = [
-            'span:has-text("Bet Confirmation")',  # Modal header
-            'div:has(span:has-text("Bet Confirmation"))',  # Container with header
-            'div[class*="modal"]:has(button#strike-conf-continue-btn)',  # Modal with continue button
-        ]
-        
-        modal_text = ""
-        
-        # First, try to find the specific Bet Confirmation modal
-        for selector in bet_confirmation_selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    # Get the parent modal container for full text
-                    try:
-                        parent = await element.evaluate_handle('el => el.closest("div[class*=modal]") || el.closest("div[role=dialog]") || el.parentElement.parentElement.parentElement')
-                        if parent:
-                            modal_text = await parent.inner_text()
-                    except:
-                        modal_text = await element.inner_text()
-                    
-                    if modal_text and 'Bet Confirmation' in modal_text:
-                        print(f"    ✓ Found Bet Confirmation modal")
-                        break
-            except:
-                continue
-        
-        # PRIORITY 2: Look for the Continue betting button and get its modal container
-        if not modal_text or len(modal_text) < 20:
-            try:
-                continue_btn = await page.query_selector('button#strike-conf-continue-btn')
-                if continue_btn:
-                    # Navigate up to find the modal container
-                    parent = await continue_btn.evaluate_handle('''el => {
-                        let current = el.parentElement;
-                        for (let i = 0; i < 10 && current; i++) {
-                            if (current.className && (current.className.includes('modal') || current.className.includes('dialog'))) {
-                                return current;
-                            }
-                            current = current.parentElement;
-                        }
-                        return el.parentElement.parentElement.parentElement.parentElement;
-                    }''')
-                    if parent:
-                        modal_text = await parent.inner_text()
-            except:
-                pass
-        
-        if modal_text:
-            # Debug: print modal text to identify patterns
-            print(f"    🔍 [DEBUG] Bet Confirmation modal text:")
-            # Print in chunks to see the full structure
-            lines = modal_text.split('\n')
-            for i, line in enumerate(lines[:15]):  # First 15 lines
-                if line.strip():
-                    print(f"         Line {i+1}: {line.strip()[:80]}")
-            
-            # Pattern 1: Look for Booking Code (most common in Betway)
-            # Betway typically shows "Booking Code" followed by the code
-            booking_patterns = [
-                r'Booking\s*Code[\s:]*\n?\s*([A-Z0-9-]+)',  # Code may be on next line
-                r'Booking\s*Code[\s:]+([A-Z0-9-]+)',
-                r'Booking[\s:]+([A-Z0-9]{6,})',
-                r'Code[\s:]+([A-Z0-9]{8,})',  # At least 8 chars
-            ]
+    visible = await asyncio.gather(*[h.is_visible() for _, h in found], return_exceptions=True)
+    for (sel, h), is_vis in zip(found, visible):
+        if is_vis is True:
+            return sel, h
+    return None, None
+
+
+# Per-page Locator memo. Locators are lazy, so one per (page, selector) can be reused for
+# every bet on that page; entries go away with the page when the browser is restarted.
+_page_locator_cache = weakref.WeakKeyDictionary()
+
+
+def get_cached_locator(page: Page, selector: str):
+    """Return the memoized page.locator(selector).first for this page."""
+    per_page = _page_locator_cache.get(page)
+    if per_page is None:
+        per_page = _page_locator_cache[page] = {}
+    loc = per_page.get(selector)
+    if loc is None:
+        loc = per_page[selector] = page.locator(selector).first
+    return loc
+
+
+# Page-side probe for find_visible_index. Plain CSS goes straight to querySelectorAll;
+# the Playwright-only text="..." and :has-text("...") forms are emulated so the shared
+# selector tuples can be checked without a round-trip per selector.
+_FIND_VISIBLE_INDEX_JS = '''(selectors) => {
+    const visible = (e) => !!(e && (e.offsetParent || e.getClientRects().length));
+    const probe = (sel) => {
+        const exact = sel.match(/^text="(.*)"$/);
+        if (exact) {
+            const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+            while (walker.nextNode()) {
+                const node = walker.currentNode;
+                if (node.nodeValue.trim() === exact[1] && visible(node.parentElement)) return true;
+            }
+            return false;
+        }
+        let css = sel, needle = null;
+        const hasText = sel.match(/^(.*?):has-text\\("(.*?)"\\)(.*)$/);
+        if (hasText) {
+            css = (hasText[1] + hasText[3]) || '*';
+            needle = hasText[2].toLowerCase();
+        }
+        return Array.from(document.querySelectorAll(css)).some(e =>
+            visible(e) && (needle === null || (e.innerText || '').toLowerCase().includes(needle)));
+    };
+    return selectors.findIndex(sel => { try { return probe(sel); } catch (e) { return false; } });
+}'''
+
+
+# Debug projection of the first N buttons on the page - one evaluate, no element handles
+_BUTTON_DUMP_JS = '''(limit) => {
+    const all = document.querySelectorAll('button');
+    return {
+        total: all.length,
+        buttons: Array.from(all).slice(0, limit).map(b => ({
+            text: (b.innerText || '').slice(0, 30),
+            id: b.id || null,
+            cls: (b.getAttribute('class') || '').slice(0, 50),
+            visible: !!b.offsetParent,
+        })),
+    };
+}'''
+
+
+# Price-change modal probe: finds the first visible Accept/Confirm button (same shapes the
+# old selector union matched), tags it for a follow-up click and returns its text plus the
+# text of the dialog it sits in - one round-trip instead of count/inner_text/inner_text
+_ACCEPT_PROBE_JS = '''() => {
+    document.querySelectorAll('[data-accept-probe]').forEach(e => e.removeAttribute('data-accept-probe'));
+    const matches = (b) => {
+        const text = (b.innerText || '').toLowerCase();
+        return text.includes('accept') || text.includes('confirm')
+            || (b.getAttribute('aria-label') || '').includes('Accept')
+            || (b.id || '').includes('accept');
+    };
+    const btn = Array.from(document.querySelectorAll('button'))
+        .find(b => (b.offsetParent || b.getClientRects().length) && matches(b));
+    if (!btn) return null;
+    btn.setAttribute('data-accept-probe', '1');
+    const modal = btn.closest('[role="dialog"], div[class*="modal"]')
+        || document.querySelector('div[role="dialog"], div[class*="modal"]');
+    return {text: btn.innerText || '', modalText: modal ? (modal.innerText || '') : ''};
+}'''
+_ACCEPT_PROBE_SELECTOR = 'button[data-accept-probe]'
+_PRICE_CHANGE_KEYWORDS = ('price', 'odds', 'changed', 'new', 'updated', 'different')
+
+
+async def rank_bet_buttons(candidates, verbose: bool = True):
+    """
+    Pick the best clickable Bet Now button from union-selector matches.
+    Returns (handle, label), or (None, None) if no candidate is visible and enabled.
+    """
+    best_btn, best_label = None, None
+    best_score = -1
+    for btn in candidates:
+        try:
+            # All per-button reads in one round-trip
+            info = await btn.evaluate('''el => ({
+                id: el.id || '',
+                text: (el.innerText || '').toLowerCase(),
+                visible: !!el.offsetParent,
+                enabled: !el.disabled,
+                ariaDisabled: el.getAttribute('aria-disabled'),
+                inBetslip: !!el.closest('#betslip-container, #betslip-container-mobile')
+            })''')
+            btn_id = info['id']
+            btn_text = info['text']
             
-            for pattern in booking_patterns:
-                match = re.search(pattern, modal_text, re.IGNORECASE)
-                if match:
-                    result['booking_code'] = match.group(1).strip()
-                    print(f"    ✓ [FOUND] Booking Code: {result['booking_code']}")
-                    break
+            # CRITICAL: Verify this is NOT the sign-up button
+            if btn_id == 'sign-up-btn':
+                if verbose:
+                    print(f"    ⚠️  Skipping sign-up button")
+                continue
             
-            # Pattern 2: Look for Betslip ID
-            betslip_patterns = [
-                r'Betslip\s*ID[\s:]*\n?\s*([A-Z0-9-]+)',
-                r'Betslip\s*ID[\s:]+([A-Z0-9-]+)',
-                r'Bet\s*ID[\s:]+([A-Z0-9-]+)',
-                r'Reference[\s:]+([A-Z0-9-]+)',
-            ]
+            # CRITICAL: Verify button text is not account-related
+            if any(kw in btn_text for kw in _SKIP_KEYWORDS):
+                if verbose:
+                    print(f"    ⚠️  Skipping account-related button: '{btn_text}'")
+                continue
             
-            for pattern in betslip_patterns:
-                match = re.search(pattern, modal_text, re.IGNORECASE)
-                if match:
-                    result['betslip_id'] = match.group(1).strip()
-                    print(f"    ✓ [FOUND] Betslip ID: {result['betslip_id']}")
-                    break
+            if not info['visible']:
+                continue
+            if not info['enabled'] or info['ariaDisabled'] == 'true':
+                if verbose:
+                    print(f"    ⚠️  Button found but disabled: '{btn_text}'")
+                continue
             
-            # Pattern 3: Look for standalone alphanumeric codes if nothing found yet
-            # Betway booking codes are typically 8-12 uppercase alphanumeric
-            if not result['booking_code'] and not result['betslip_id']:
-                # Look for a line that's just a code (common pattern)
-                for line in lines:
-                    line = line.strip()
-                    # Check if line is a standalone code (8-12 alphanumeric chars)
-                    if re.match(r'^[A-Z0-9]{8,12}$', line):
-                        if line not in ['BETCONFIRM', 'SUCCESSFUL', 'CONTINUING']:
-                            result['booking_code'] = line
-                            print(f"    ✓ [FOUND] Standalone Code: {result['booking_code']}")
-                            break
-        else:
+            # Rank: exact strike-button ID > inside betslip container > "Bet Now" text
+            in_betslip = info['inBetslip']
+            score = (4 if btn_id == 'betslip-strike-btn' else 0) + (2 if in_betslip else 0) + (1 if 'bet now' in btn_text else 0)
+            if score > best_score:
+                best_score = score
+                best_btn = btn
+                best_label = f"#{btn_id}" if btn_id else f"button '{btn_text.strip()[:20]}' (score {score})"
+        except Exception:
+            continue
+    return best_btn, best_label
+
+
+# Match list snapshot: for every container on the page, both team names, the first span that
+# reads as a kick-off time, the first span of each 1X2 price div and the event link.
+# The whole page is read in one round-trip; Python only filters the returned rows.
+_MATCH_CONTAINER_SELECTOR = 'div[data-v-206d232b].relative.grid.grid-cols-12'
+_MATCH_ROWS_JS = '''(selector) => {
+    const dayTime = /^(Today|Tomorrow|Mon|Tue|Wed|Thu|Fri|Sat|Sun).*\\d{1,2}:\\d{2}/;
+    const dateTime = /^\\d{1,2}\\s+\\w{3}\\s*-?\\s*\\d{1,2}:\\d{2}/;
+    return Array.from(document.querySelectorAll(selector), el => {
+        const teams = Array.from(el.querySelectorAll('strong.overflow-hidden.text-ellipsis'), s => s.innerText);
+        let startTime = null;
+        for (const span of el.querySelectorAll('span')) {
+            const t = span.innerText;
+            if (t && (dayTime.test(t) || dateTime.test(t))) { startTime = t; break; }
+        }
+        const prices = el.querySelectorAll('div[price]');
+        const odds = prices.length >= 3
+            ? Array.from(prices).slice(0, 3).map(p => { const s = p.querySelector('span'); return s ? s.innerText : null; })
+            : null;
+        const link = el.querySelector('a[href*="/event/soccer/"]');
+        return { teams, startTime, odds, href: link ? link.getAttribute('href') : null };
+    });
+}'''
+
+
+# Stake-input debug projection: first N chars of the betslip HTML plus the first M inputs
+_STAKE_DEBUG_JS = '''([htmlChars, maxInputs]) => {
+    const betslip = document.querySelector('div#betslip-container-mobile')
+        || document.querySelector('div#betslip-container');
+    const inputs = Array.from(document.querySelectorAll('input'));
+    return {
+        betslipHtml: betslip ? betslip.innerHTML.slice(0, htmlChars) : null,
+        inputCount: inputs.length,
+        inputs: inputs.slice(0, maxInputs).map(e => ({
+            id: e.id, type: e.getAttribute('type'), placeholder: e.getAttribute('placeholder'),
+            visible: !!e.offsetParent
+        }))
+    };
+}'''
+
+
+# Betslip text length, read before an outcome click so the wait below can detect growth
+_BETSLIP_TEXT_LEN_JS = '''() => {
+    const el = document.querySelector('#betslip-container-mobile, #betslip-container');
+    return el ? el.innerText.length : 0;
+}'''
+
+# Resolves once the betslip has grown by a selection row that shows odds
+_BETSLIP_GREW_JS = '''prevLen => {
+    const el = document.querySelector('#betslip-container-mobile, #betslip-container');
+    if (!el) return false;
+    const t = el.innerText;
+    return t.length > prevLen + 20 && /\\d+\\.\\d{2}/.test(t);
+}'''
+
+# Set the stake via the DOM (fill() doesn't work with number inputs that have validation),
+# fire the events React listens for and read back what the field actually holds
+_SET_STAKE_JS = '''(el, amount) => {
+    el.focus();
+    el.value = '';
+    el.value = amount;
+    el.dispatchEvent(new Event('input', { bubbles: true }));
+    el.dispatchEvent(new Event('change', { bubbles: true }));
+    el.blur();
+    return el.value;
+}'''
+
+
+# Why-isn't-it-clickable snapshot of the Bet Now button, only evaluated at DEBUG level.
+# Limited to the style fields that explain a dead click - each extra computed-style read costs.
+_BUTTON_STATE_DEBUG_JS = '''el => {
+    const style = window.getComputedStyle(el);
+    return {
+        display: style.display,
+        visibility: style.visibility,
+        opacity: style.opacity,
+        pointerEvents: style.pointerEvents,
+        disabled: el.disabled,
+        ariaDisabled: el.getAttribute('aria-disabled'),
+        id: el.id,
+    };
+}'''
+
+
+async def find_visible_index(page: Page, selectors) -> int:
+    """
+    Return the index of the first selector with a visible match, checked in a single
+    evaluate call, or -1 if none match (or the page could not be queried).
+    """
+    try:
+        return await page.evaluate(_FIND_VISIBLE_INDEX_JS, list(selectors))
+    except Exception:
+        return -1
+
+
+async def modal_needs_clearing(page: Page) -> bool:
+    """
+    Cheap existence probe for close_all_modals(): True if any modal marker or close
+    button is visible. Errs on the side of clearing if the page can't be queried.
+    """
+    if page.is_closed():
+        return False
+    try:
+        hit = await page.evaluate(
+            _FIND_VISIBLE_INDEX_JS,
+            list(_ACCOUNT_OPTIONS_INDICATORS + _MODAL_INDICATORS + _MODAL_CLOSE_SELECTORS),
+        )
+        return hit >= 0
+    except Exception:
+        return True
+
+
+async def wait_for_state(page: Page, selector: str, timeout_ms: int, state: str = 'visible') -> bool:
+    """
+    Event-driven replacement for a fixed sleep before the next interaction: resolves as soon
+    as selector reaches state, and returns False (instead of raising) on timeout.
+    """
+    try:
+        await page.wait_for_selector(selector, state=state, timeout=timeout_ms)
+        return True
+    except Exception:
+        return False
+
+
+async def wait_for_dom_complete(page: Page, timeout_ms: int) -> bool:
+    """Wait up to timeout_ms for document.readyState to reach 'complete'."""
+    try:
+        await page.wait_for_function("document.readyState === 'complete'", timeout=timeout_ms)
+        return True
+    except Exception:
+        return False
+
+
+async def wait_for_page_settled(page: Page, timeout_ms: int) -> bool:
+    """
+    Wait up to timeout_ms for a reloaded page to finish loading and drop its loading
+    indicators, polling every 100ms instead of sleeping a fixed interval.
+    """
+    try:
+        await page.wait_for_function(
+            "() => document.readyState === 'complete' && !document.querySelector('[class*=loading]')",
+            timeout=timeout_ms,
+            polling=100,
+        )
+        return True
+    except Exception:
+        return False
+
+
+async def wait_for_betslip_ready(page: Page, timeout_ms: int) -> bool:
+    """
+    Wait up to timeout_ms for the betslip to show a Bet Now button and a return value.
+    Resolves as soon as it does, so a retry loop only sleeps the full backoff when the
+    betslip genuinely isn't ready yet.
+    """
+    try:
+        await page.wait_for_function('''() => {
+            const el = document.querySelector('#betslip-container-mobile')
+                || document.querySelector('#betslip-container');
+            const t = (el && el.innerText) || '';
+            return t.includes('Bet Now') && /Return[:\\s]*R\\s*\\d/.test(t);
+        }''', timeout=timeout_ms)
+        return True
+    except Exception:
+        return False
+
+
+async def read_betslip_state(page: Page) -> dict:
+    """
+    Read the bet slip text in a single evaluate call and derive the common content flags.
+    Returns a dict with the raw text plus has* flags, or None if no betslip container exists.
+    """
+    try:
+        betslip_text = await page.evaluate('''() => {
+            const el = document.querySelector('#betslip-container-mobile')
+                || document.querySelector('#betslip-container')
+                || document.querySelector('div[class*="betslip"]');
+            return el ? (el.innerText || '') : null;
+        }''')
+        if betslip_text is None:
+            return None
+        
+        return {
+            'text': betslip_text,
+            'len': len(betslip_text),
+            'hasOdds': _ODDS_RE.search(betslip_text) is not None,
+            'hasReturn': 'Return' in betslip_text,
+            'has1X2': '1X2' in betslip_text,
+            'hasBetNow': _BET_BTN_RE.search(betslip_text) is not None,
+            'hasSingle': 'Single' in betslip_text,
+            'hasMulti': 'Multi' in betslip_text,
+        }
+    except Exception as e:
+        print(f"    ⚠️ Error reading betslip state: {e}")
+        return None
+
+
+def parse_return_value(text: str) -> float:
+    """
+    Extract the amount from a "Return:R X.XX" fragment using plain str scanning (no regex).
+    Mirrors Return[:\\s]*R\\s*(\\d+\\.?\\d*) - returns 0.0 if no such fragment is found.
+    """
+    n = len(text)
+    i = text.find('Return')
+    while i >= 0:
+        k = i + 6
+        while k < n and (text[k] == ':' or text[k].isspace()):
+            k += 1
+        if k < n and text[k] == 'R':
+            k += 1
+            while k < n and text[k].isspace():
+                k += 1
+            start = k
+            while k < n and text[k].isdigit():
+                k += 1
+            if k > start:
+                if k < n and text[k] == '.':
+                    k += 1
+                    while k < n and text[k].isdigit():
+                        k += 1
+                try:
+                    return float(text[start:k])
+                except ValueError:
+                    return 0.0
+        i = text.find('Return', i + 6)
+    return 0.0
+
+
+async def get_betslip_id_from_confirmation(page: Page) -> dict:
+    """
+    Extract the Betslip ID and/or Booking Code from the Bet Confirmation modal.
+    Returns a dict with 'betslip_id' and 'booking_code' (either may be empty string).
+    """
+    result = {'betslip_id': '', 'booking_code': ''}
+    
+    try:
+        # Wait a moment for modal to fully render
+        await page.wait_for_timeout(800)
+        
+        # PRIORITY 1: Look specifically for Bet Confirmation modal elements
+        # The modal typically contains "Bet Confirmation" header and the Booking Code
+        bet_confirmation_selectors = [
+            'span:has-text("Bet Confirmation")',  # Modal header
+            'div:has(span:has-text("Bet Confirmation"))',  # Container with header
+            'div[class*="modal"]:has(button#strike-conf-continue-btn)',  # Modal with continue button
+        ]
+        
+        modal_text = ""
+        
+        # First, try to find the specific Bet Confirmation modal
+        for selector in bet_confirmation_selectors:
+            try:
+                element = get_cached_locator(page, selector)
+                if await element.count():
+                    # Get the parent modal container's full text (falls back to the element itself)
+                    modal_text = await element.evaluate('''el => {
+                        let modal = el.closest("div[class*=modal]") || el.closest("div[role=dialog]");
+                        try { modal = modal || el.parentElement.parentElement.parentElement; } catch (e) {}
+                        return (modal || el).innerText;
+                    }''', timeout=2000)
+                    
+                    if modal_text and 'Bet Confirmation' in modal_text:
+                        print(f"    ✓ Found Bet Confirmation modal")
+                        break
+            except:
+                continue
+        
+        # PRIORITY 2: Look for the Continue betting button and get its modal container
+        if not modal_text or len(modal_text) < 20:
+            try:
+                continue_btn = get_cached_locator(page, 'button#strike-conf-continue-btn')
+                if await continue_btn.count():
+                    # Navigate up to find the modal container
+                    parent = await continue_btn.evaluate_handle('''el => {
+                        let current = el.parentElement;
+                        for (let i = 0; i < 10 && current; i++) {
+                            if (current.className && (current.className.includes('modal') || current.className.includes('dialog'))) {
+                                return current;
+                            }
+                            current = current.parentElement;
+                        }
+                        return el.parentElement.parentElement.parentElement.parentElement;
+                    }''')
+                    if parent:
+                        modal_text = await parent.inner_text()
+            except:
+                pass
+        
+        if modal_text:
+            # Debug: print modal text to identify patterns
+            print(f"    🔍 [DEBUG] Bet Confirmation modal text:")
+            # Print in chunks to see the full structure
+            lines = modal_text.split('\n')
+            for i, line in enumerate(lines[:15]):  # First 15 lines
+                if line.strip():
+                    print(f"         Line {i+1}: {line.strip()[:80]}")
+            
+            # Pattern 1: Look for Booking Code (most common in Betway)
+            # Betway typically shows "Booking Code" followed by the code
+            for pattern in _BOOKING_CODE_PATTERNS:
+                match = pattern.search(modal_text)
+                if match:
+                    result['booking_code'] = match.group(1).strip()
+                    print(f"    ✓ [FOUND] Booking Code: {result['booking_code']}")
+                    break
+            
+            # Pattern 2: Look for Betslip ID
+            for pattern in _BETSLIP_ID_PATTERNS:
+                match = pattern.search(modal_text)
+                if match:
+                    result['betslip_id'] = match.group(1).strip()
+                    print(f"    ✓ [FOUND] Betslip ID: {result['betslip_id']}")
+                    break
+            
+            # Pattern 3: Look for standalone alphanumeric codes if nothing found yet
+            # Betway booking codes are typically 8-12 uppercase alphanumeric
+            if not result['booking_code'] and not result['betslip_id']:
+                # Look for a line that's just a code (common pattern)
+                for line in lines:
+                    line = line.strip()
+                    # Check if line is a standalone code (8-12 alphanumeric chars)
+                    if _STANDALONE_CODE_RE.match(line):
+                        if line not in ['BETCONFIRM', 'SUCCESSFUL', 'CONTINUING']:
+                            result['booking_code'] = line
+                            print(f"    ✓ [FOUND] Standalone Code: {result['booking_code']}")
+                            break
+        else:
             print(f"    ⚠️ Could not find Bet Confirmation modal text")
         
         return result
@@ -797,12 +1799,10 @@ async def verify_bet_placement(page: Page, expected_stake: float, balance_before
                 print(f"    ❌ [VERIFY] Balance did NOT decrease: R{balance_before:.2f} → R{balance_after:.2f}")
         
         # 3. Check for "Continue betting" button (indicates success modal is showing)
-        continue_btn = await page.query_selector('button#strike-conf-continue-btn')
-        has_continue_btn = continue_btn and await continue_btn.is_visible()
+        has_continue_btn = await get_cached_locator(page, 'button#strike-conf-continue-btn').is_visible()
         
         # 4. Check for "Bet Confirmation" text
-        bet_conf = await page.query_selector('span:has-text("Bet Confirmation")')
-        has_bet_conf = bet_conf is not None
+        has_bet_conf = await get_cached_locator(page, 'span:has-text("Bet Confirmation")').count() > 0
         
         # Determine confidence and success
         # HIGH: Both code AND balance verification
@@ -1051,18 +2051,12 @@ async def login_to_betway(playwright):
         # Try to get all buttons on the page for debugging
         button_debug_info = []
         try:
-            all_buttons = await page.query_selector_all('button')
-            print(f"\nFound {len(all_buttons)} buttons on page. First 10:")
-            for i, btn in enumerate(all_buttons[:10]):
-                try:
-                    text = await btn.inner_text()
-                    classes = await btn.get_attribute('class')
-                    btn_id = await btn.get_attribute('id')
-                    btn_info = f"text='{text[:30]}', id='{btn_id}'"
-                    button_debug_info.append(btn_info)
-                    print(f"  Button {i+1}: {btn_info}, class='{classes[:50] if classes else ''}'")
-                except:
-                    pass
+            dump = await page.evaluate(_BUTTON_DUMP_JS, 10)
+            print(f"\nFound {dump['total']} buttons on page. First 10:")
+            for i, info in enumerate(dump['buttons']):
+                btn_info = f"text='{info['text']}', id='{info['id']}'"
+                button_debug_info.append(btn_info)
+                print(f"  Button {i+1}: {btn_info}, class='{info['cls']}'")
         except:
             pass
         
@@ -1140,14 +2134,8 @@ async def login_to_betway(playwright):
     
     # Close any welcome modals/popups after login
     print("Checking for post-login modals/popups...")
-    close_selectors = [
-        'button:has-text("×")',
-        'button:has-text("GOT IT")',
-        'button[aria-label="Close"]',
-        'svg[id="modal-close-btn"]',
-    ]
     
-    for selector in close_selectors:
+    for selector in _POST_LOGIN_CLOSE_SELECTORS:
         try:
             close_btns = await page.query_selector_all(selector)
             for btn in close_btns:
@@ -1226,8 +2214,11 @@ async def restart_browser_fresh(playwright, old_browser=None, old_page=None):
     
     # Step 2: Force garbage collection to release memory
     print("  [2/4] Running garbage collection...")
-    gc.collect()
-    gc.collect()  # Run twice to ensure full collection
+    # The first browser's objects were frozen with the setup state - release them to be collected
+    gc.unfreeze()
+    gc.collect(generation=2)
+    # Re-freeze the surviving long-lived state so per-bet collections keep skipping it
+    gc.freeze()
     print("       ✓ Memory cleaned up")
     
     # Step 3: Wait a moment for resources to be released
@@ -1280,6 +2271,44 @@ async def restart_browser_fresh(playwright, old_browser=None, old_page=None):
         return None
 
 
+async def restart_context_fresh(browser, old_context):
+    """
+    Recycle the browser context instead of the whole browser: close the old context
+    (which releases its pages' renderer memory) and open a new one in the same Chromium.
+    Cookies and local storage are carried over, so the session stays logged in.
+    
+    Args:
+        browser: The running browser to open the new context in
+        old_context: The context to close
+    
+    Returns:
+        The new page, or None on failure (the old context may already be closed)
+    """
+    print(f"\n  [CONTEXT RESTART] Recycling browser context...")
+    try:
+        storage_state = await old_context.storage_state()
+        await old_context.close()
+        
+        # The old context's objects die here - same full collection as a browser restart
+        gc.unfreeze()
+        gc.collect(generation=2)
+        gc.freeze()
+        
+        new_context = await browser.new_context(storage_state=storage_state)
+        page = await new_context.new_page()
+        print(f"  [CONTEXT RESTART] ✓ Fresh context ready")
+        return page
+    except Exception as e:
+        print(f"  [CONTEXT RESTART] ❌ Failed: {e}")
+        error_tracker.add_error(
+            error_type='BROWSER_RESTART',
+            error_message=f'Context recycle failed: {str(e)[:150]}',
+            context={'status': 'context_restart_failed'},
+            exception=e
+        )
+        return None
+
+
 async def check_and_relogin(page: Page, browser) -> bool:
     """
     Check if we're still logged in. If not, re-login.
@@ -1469,13 +2498,7 @@ async def close_all_modals(page: Page, max_attempts=3, timeout_seconds=8):
                 # FIRST: Check for and close Account Options modal (Deposit funds tab)
                 # This modal sometimes appears unexpectedly
                 try:
-                    account_modal_indicators = [
-                        'text="Account Options"',
-                        'text="Deposit funds"',
-                        'text="27614220968"',  # Account number pattern
-                        ':has-text("Account Options")',
-                    ]
-                    for indicator in account_modal_indicators:
+                    for indicator in _ACCOUNT_OPTIONS_INDICATORS:
                         try:
                             modal_elem = await page.query_selector(indicator)
                             if modal_elem and await modal_elem.is_visible():
@@ -1499,18 +2522,9 @@ async def close_all_modals(page: Page, max_attempts=3, timeout_seconds=8):
                 
                 # Try various close button selectors (including betslip close from HTML)
                 # IMPORTANT: These selectors are specific to CLOSE buttons only, not action buttons
-                close_selectors = [
-                    'svg[id="modal-close-btn"]',  # Betslip and modal close button (specific ID)
-                    'button[aria-label="Close"]',  # Exact match for Close button
-                    'button[aria-label="close"]',  # Exact match lowercase
-                    'button:has-text("×")',  # X button
-                    'button:has-text("Close"):not([aria-label*="Account"])',  # Close text but not account related
-                    'button:has-text("GOT IT")',  # Common popup dismiss
-                    'button:has-text("OK"):not([id*="deposit"]):not([id*="account"])',  # OK button but not deposit/account
-                ]
                 
                 closed_any = False
-                for selector in close_selectors:
+                for selector in _MODAL_CLOSE_SELECTORS:
                     try:
                         close_buttons = await page.query_selector_all(selector)
                         for btn in close_buttons:
@@ -1522,9 +2536,8 @@ async def close_all_modals(page: Page, max_attempts=3, timeout_seconds=8):
                                     btn_id = await btn.get_attribute('id') or ''
                                     
                                     # Skip if this looks like an account/deposit/profile button
-                                    skip_keywords = ['deposit', 'account', 'profile', 'login', 'sign', 'register', 'withdraw']
                                     combined_text = f"{btn_text} {btn_aria} {btn_id}".lower()
-                                    if any(keyword in combined_text for keyword in skip_keywords):
+                                    if any(keyword in combined_text for keyword in _SKIP_KEYWORDS):
                                         continue
                                 except:
                                     pass
@@ -1540,13 +2553,7 @@ async def close_all_modals(page: Page, max_attempts=3, timeout_seconds=8):
                 try:
                     # Check if there's actually a visible modal before pressing Escape
                     has_modal = False
-                    modal_indicators = [
-                        'div[role="dialog"]',
-                        'div[class*="modal"]',
-                        'div[class*="popup"]',
-                        'div[aria-modal="true"]'
-                    ]
-                    for indicator in modal_indicators:
+                    for indicator in _MODAL_INDICATORS:
                         try:
                             modal_elem = await page.query_selector(indicator)
                             if modal_elem and await modal_elem.is_visible():
@@ -1573,6 +2580,10 @@ async def close_all_modals(page: Page, max_attempts=3, timeout_seconds=8):
                 # Modals might not be present, that's okay
                 pass
     
+    # Most calls find a clean page - skip the per-selector sweep when nothing is visible
+    if not await modal_needs_clearing(page):
+        return
+    
     # Wrap the entire modal closing logic with a timeout
     try:
         await asyncio.wait_for(_close_modals_inner(), timeout=timeout_seconds)
@@ -1588,63 +2599,396 @@ async def close_all_modals(page: Page, max_attempts=3, timeout_seconds=8):
         pass
 
 
-def generate_bet_combinations(matches, num_matches):
-    """Generate all bet combinations for the given matches"""
-    print(f"\nGenerating bet combinations for {num_matches} matches...")
-    
-    if len(matches) < num_matches:
-        print(f"[WARNING] Only {len(matches)} matches available, need {num_matches}")
-        return []
-    
-    selected_matches = matches[:num_matches]
+
+async def close_modals_fast(page: Page, max_attempts=3, timeout_seconds=8):
+    """
+    Single-evaluate modal sweep for hot paths in bet placement.
+    Clicks visible close buttons (skipping account/deposit related ones) in one round-trip and
+    only falls back to the full close_all_modals() scan if a modal still appears to be open.
+    """
+    try:
+        if page.is_closed():
+            return
+        result = await page.evaluate('''() => {
+            // getClientRects, not offsetParent: SVG icons and position:fixed dialogs have no offsetParent
+            const visible = el => !!(el && el.getClientRects().length > 0);
+            const skip = ['deposit', 'account', 'profile', 'login', 'sign', 'register', 'withdraw'];
+            const candidates = document.querySelectorAll(
+                'svg[id="modal-close-btn"], button[aria-label="Close"], button[aria-label="close"], button'
+            );
+            let closed = 0;
+            for (const el of candidates) {
+                if (!visible(el)) continue;
+                const text = (el.innerText || '').trim();
+                const isClose = el.tagName.toLowerCase() === 'svg'
+                    || /^close$/i.test(el.getAttribute('aria-label') || '')
+                    || ['×', 'Close', 'GOT IT', 'OK'].includes(text);
+                if (!isClose) continue;
+                const combined = `${text} ${el.getAttribute('aria-label') || ''} ${el.id || ''}`.toLowerCase();
+                if (skip.some(k => combined.includes(k))) continue;
+                try { el.dispatchEvent(new MouseEvent('click', { bubbles: true })); closed++; } catch (e) {}
+            }
+            const modalOpen = Array.from(document.querySelectorAll(
+                'div[role="dialog"], div[aria-modal="true"], div[class*="modal"], div[class*="popup"]'
+            )).some(visible);
+            const accountModal = document.body.innerText.includes('Account Options');
+            return { closed, modalOpen, accountModal };
+        }''')
+    except Exception:
+        result = None
     
-    outcomes_per_match = []
-    for match in selected_matches:
-        outcomes_per_match.append(match.get("outcomes", ["1", "X", "2"]))
+    # Nothing left open - skip the multi-selector scan entirely
+    if result and not result['modalOpen'] and not result['accountModal']:
+        return
     
-    all_combinations = list(product(*outcomes_per_match))
+    await close_all_modals(page, max_attempts=max_attempts, timeout_seconds=timeout_seconds)
+
+
+# Ordered outcome-selector probe: index and match count of the first selector (from `start`)
+# matching at least minCount elements, in one round-trip. A selector querySelectorAll can't
+# parse (Playwright-only syntax such as :text()) is handed back with native=false.
+_OUTCOME_SELECTOR_PROBE_JS = '''([selectors, start, minCount]) => {
+    for (let i = start; i < selectors.length; i++) {
+        let count;
+        try { count = document.querySelectorAll(selectors[i]).length; }
+        catch (e) { return { index: i, count: 0, native: false }; }
+        if (count >= minCount) return { index: i, count, native: true };
+    }
+    return null;
+}'''
+
+
+async def find_outcome_selector(page: Page, min_count: int = 3):
+    """
+    First of _OUTCOME_BUTTON_SELECTORS matching at least `min_count` elements, keeping their priority.
     
-    print(f"\nGenerating combinations using DIFFERENT selections for the SAME {num_matches} matches:")
-    for i, match in enumerate(selected_matches, 1):
-        print(f"  Match {i}: {match['name']}")
+    Returns:
+        tuple: (selector, count), or (None, 0) when nothing matches
+    """
+    start = 0
+    while start < len(_OUTCOME_BUTTON_SELECTORS):
+        hit = await page.evaluate(_OUTCOME_SELECTOR_PROBE_JS, [list(_OUTCOME_BUTTON_SELECTORS), start, min_count])
+        if hit is None:
+            break
+        selector = _OUTCOME_BUTTON_SELECTORS[hit['index']]
+        if hit['native']:
+            return selector, hit['count']
+        # Playwright selector syntax - count this one through the selector engine
+        try:
+            count = await page.locator(selector).count()
+        except PlaywrightError:
+            count = 0
+        if count >= min_count:
+            return selector, count
+        start = hit['index'] + 1
+    return None, 0
+
+
+# Contexts whose site-wide overlays (cookie banner, geo/promo prompts) were already dismissed.
+# They are context-scoped, so match pages opened later in the same context don't show them again.
+_modals_closed_contexts = weakref.WeakSet()
+
+
+async def close_modals_once(page: Page):
+    """close_all_modals() for the first page of a context; a no-op for the ones after it."""
+    context = page.context
+    if context in _modals_closed_contexts:
+        return
+    await close_all_modals(page)
+    _modals_closed_contexts.add(context)
+
+
+# Concurrent match pages opened while warming the outcome cache - a few more and Chromium memory climbs quickly
+_WARM_CACHE_CONCURRENCY = 4
+
+
+async def warm_cache(page: Page, matches, cache: dict, phase: str = 'pre_caching') -> int:
+    """
+    Probe the outcome-button selector for every match page not already in the cache.
+    Warm entries are skipped without navigating, so a restart with a full cache costs nothing.
+    Cold pages are probed concurrently in a throwaway context that shares the main page's cookies.
     
-    bet_slips = []
+    Returns:
+        int: Number of match pages that had to be probed
+    """
+    cold = [match for match in matches if match.get('url') and match['url'] not in cache]
+    if not cold:
+        return 0
     
-    for i, combination in enumerate(all_combinations, 1):
-        slip = {
-            "slip_number": i,
-            "matches": selected_matches,
-            "selections": combination,
-            "total_combinations": len(all_combinations)
-        }
-        bet_slips.append(slip)
+    try:
+        aux_context = await page.context.browser.new_context(storage_state=await page.context.storage_state())
+        semaphore = asyncio.Semaphore(_WARM_CACHE_CONCURRENCY)
+    except PlaywrightError as e:
+        # Fall back to probing one page at a time on the main tab
+        log.debug("Auxiliary context unavailable, warming sequentially: %s", e)
+        aux_context = None
+        semaphore = asyncio.Semaphore(1)
     
-    print(f"\n✅ Generated {len(bet_slips)} VALID tickets")
+    async def probe(match_idx, match):
+        match_url = match['url']
+        async with semaphore:
+            probe_page = None
+            try:
+                # Created inside the try so a failed new_page() is reported like any other probe error
+                probe_page = await aux_context.new_page() if aux_context else page
+                await probe_page.goto(match_url, wait_until='domcontentloaded', timeout=15000)
+                # Probe as soon as the outcome grid renders instead of after a fixed 2s
+                await asyncio.gather(
+                    close_modals_once(probe_page),
+                    wait_for_state(probe_page, _OUTCOME_GRID_SELECTOR, 8000, state='attached')
+                )
+                
+                # Count in the page - only the selector is cached, so no handles are needed
+                working_selector, button_count = await find_outcome_selector(probe_page)
+                
+                header = f"Match {match_idx}/{len(cold)}: {match['name']} | ⏰ {match.get('start_time', 'Unknown time')}"
+                if working_selector:
+                    cache[match_url] = working_selector
+                    print(f"{header}\n  ✓ [CACHED] Found {button_count} outcome buttons using selector: {working_selector}\n")
+                else:
+                    print(f"{header}\n  ❌ ERROR: Could not find working selector ({match_url})\n")
+                    error_tracker.add_error(
+                        error_type="BET_FAILED",
+                        error_message=f"Could not find outcome button selector for match: {match['name']}",
+                        context={
+                            'match_url': match_url,
+                            'match_name': match['name'],
+                            'phase': phase
+                        }
+                    )
+            
+            except Exception as e:
+                print(f"Match {match_idx}/{len(cold)}: {match['name']}\n  ❌ ERROR caching buttons: {e}\n")
+                error_tracker.add_error(
+                    error_type="EXCEPTION",
+                    error_message=f"Exception during outcome button caching for match: {match['name']}",
+                    context={
+                        'match_url': match_url,
+                        'match_name': match['name'],
+                        'phase': phase
+                    },
+                    exception=e
+                )
+            finally:
+                if aux_context and probe_page is not None:
+                    await probe_page.close()
     
-    # Show dynamic examples based on number of matches
-    if num_matches == 1:
-        print(f"\nEach ticket bets on the SAME match with a DIFFERENT outcome prediction:")
-        print(f"  Ticket 1 = Match1:1 (Home Win)")
-        print(f"  Ticket 2 = Match1:X (Draw)")
-        print(f"  Ticket 3 = Match1:2 (Away Win)")
-        print(f"  This is a SINGLE BET - one of these will always win!")
-    elif num_matches == 2:
-        print(f"\nEach ticket bets on ALL {num_matches} matches with DIFFERENT outcome predictions:")
-        print(f"  Ticket 1 = Match1:1, Match2:1")
-        print(f"  Ticket 2 = Match1:1, Match2:X")
-        print(f"  Ticket 3 = Match1:1, Match2:2")
-        print(f"  ... (9 total combinations)")
-        print(f"  This is a MULTI-BET (accumulator) where ALL selections must win.")
-    else:
-        print(f"\nEach ticket bets on ALL {num_matches} matches with DIFFERENT outcome predictions:")
-        examples = [f"Match{i+1}:1" for i in range(min(num_matches, 3))]
-        if num_matches > 3:
-            examples.append("...")
-        print(f"  Ticket 1 = {', '.join(examples)}")
-        print(f"  ... ({len(bet_slips)} total combinations)")
-        print(f"  This is a MULTI-BET (accumulator) where ALL selections must win.")
+    try:
+        await asyncio.gather(*(probe(match_idx, match) for match_idx, match in enumerate(cold, 1)), return_exceptions=True)
+    finally:
+        if aux_context:
+            await aux_context.close()
     
-    return bet_slips
+    return len(cold)
+
+
+async def recache_outcome_buttons(page: Page, matches, num_matches: int, outcome_button_cache: dict,
+                                  phase: str = 'pre_caching'):
+    """
+    Shared by the initial pre-cache and the memory-error recovery: warm the selector cache for
+    the selected matches, persist it if anything was probed, and land back on the soccer page.
+    
+    Returns:
+        tuple: (pages probed, selected matches now cached)
+    """
+    selected = matches[:num_matches]
+    probed = await warm_cache(page, selected, outcome_button_cache, phase=phase)
+    if probed:
+        save_selector_cache(outcome_button_cache)
+    
+    await page.goto('https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=15000)
+    await wait_for_page_settled(page, 1000)
+    await close_all_modals(page)
+    
+    cached = sum(1 for match in selected if match.get('url') in outcome_button_cache)
+    return probed, cached
+
+
+@functools.lru_cache(maxsize=128)
+def stake_regex(amount) -> re.Pattern:
+    """
+    Compiled union of every way the betslip renders a stake amount: the raw value
+    ("50.0") and, for whole amounts, "R 50" / "R50". Cached since the amount rarely changes.
+    """
+    stake_str = str(amount)
+    if amount == int(amount):
+        # "R 50.0" / "R50.0" already contain stake_str, so the R-forms only need the int
+        return re.compile(f"{re.escape(stake_str)}|R ?{re.escape(str(int(amount)))}")
+    return re.compile(re.escape(stake_str))
+
+
+def classify_start_time(start_time_text: str):
+    """
+    One-pass dispatch on a kick-off text: 'live', 'date' ("12 Jan - 20:00"), 'tomorrow',
+    'today', or None for anything else (weekday names, empty text).
+    """
+    if _LIVE_RE.search(start_time_text):
+        return 'live'
+    if _FUTURE_DATE_RE.search(start_time_text):
+        return 'date'
+    if start_time_text.startswith('Tomorrow'):
+        return 'tomorrow'
+    if start_time_text.startswith('Today'):
+        return 'today'
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_start_minutes(start_time_text: str):
+    """
+    Minutes from today's midnight for a kick-off text ("Today 15:00", "Tomorrow 18:30",
+    "12 Jan - 20:00"), or None. Cached by text since the gap filter and sorts re-ask often.
+    """
+    # Future dates and Tomorrow get a one-day offset, Today counts from midnight
+    kind = classify_start_time(start_time_text)
+    if kind == 'date' or kind == 'tomorrow':
+        day_offset = 1440
+    elif kind == 'today':
+        day_offset = 0
+    else:
+        return None
+    
+    time_match = _HHMM_RE.search(start_time_text)
+    if not time_match:
+        return None
+    return day_offset + int(time_match.group(1)) * 60 + int(time_match.group(2))
+
+
+@functools.lru_cache(maxsize=32)
+def format_ticket_examples(num_matches: int, total: int) -> str:
+    """Pre-render the 'Each ticket bets on...' example block for a given match count"""
+    if num_matches == 1:
+        lines = [
+            f"\nEach ticket bets on the SAME match with a DIFFERENT outcome prediction:",
+            f"  Ticket 1 = Match1:1 (Home Win)",
+            f"  Ticket 2 = Match1:X (Draw)",
+            f"  Ticket 3 = Match1:2 (Away Win)",
+            f"  This is a SINGLE BET - one of these will always win!",
+        ]
+    elif num_matches == 2:
+        lines = [
+            f"\nEach ticket bets on ALL {num_matches} matches with DIFFERENT outcome predictions:",
+            f"  Ticket 1 = Match1:1, Match2:1",
+            f"  Ticket 2 = Match1:1, Match2:X",
+            f"  Ticket 3 = Match1:1, Match2:2",
+            f"  ... (9 total combinations)",
+            f"  This is a MULTI-BET (accumulator) where ALL selections must win.",
+        ]
+    else:
+        examples = "Match1:1, Match2:1, Match3:1, ..." if num_matches > 3 else "Match1:1, Match2:1, Match3:1"
+        lines = [
+            f"\nEach ticket bets on ALL {num_matches} matches with DIFFERENT outcome predictions:",
+            f"  Ticket 1 = {examples}",
+            f"  ... ({total} total combinations)",
+            f"  This is a MULTI-BET (accumulator) where ALL selections must win.",
+        ]
+    return "\n".join(lines)
+
+
+def generate_bet_combinations(matches, num_matches):
+    """
+    Generate all bet combinations for the given matches.
+    Returns (total, slips) where slips yields each slip dict lazily - 3^n slips are never
+    held in memory at once.
+    """
+    print(f"\nGenerating bet combinations for {num_matches} matches...")
+    
+    if len(matches) < num_matches:
+        print(f"[WARNING] Only {len(matches)} matches available, need {num_matches}")
+        return 0, iter(())
+    
+    selected_matches = matches[:num_matches]
+    
+    outcomes_per_match = []
+    for match in selected_matches:
+        outcomes_per_match.append(match.get("outcomes", ["1", "X", "2"]))
+    
+    # Count up front so product() can be consumed lazily (no intermediate list of tuples)
+    total_combinations = math.prod(len(outcomes) for outcomes in outcomes_per_match)
+    
+    print(f"\nGenerating combinations using DIFFERENT selections for the SAME {num_matches} matches:")
+    for i, match in enumerate(selected_matches, 1):
+        print(f"  Match {i}: {match['name']}")
+    
+    bet_slips = (
+        {
+            "slip_number": i,
+            "matches": selected_matches,
+            "selections": combination,
+            "total_combinations": total_combinations
+        }
+        for i, combination in enumerate(product(*outcomes_per_match), 1)
+    )
+    
+    print(f"\n✅ Generated {total_combinations} VALID tickets")
+    
+    # Show dynamic examples based on number of matches
+    print(format_ticket_examples(num_matches, total_combinations))
+    
+    return total_combinations, bet_slips
+
+
+async def run_stake_recovery_step(page: Page, step: int):
+    """
+    Run one recovery action to reveal a collapsed betslip stake input.
+    Steps: 0 = scroll, 1 = click betslip header, 2 = click Single/Multi tabs, 3 = debug dump.
+    Steps 0-2 are run together as one consolidated recovery; step 3 only after the final miss.
+    """
+    if step == 0:
+        await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+    elif step == 1:
+        # Try clicking on the betslip header/panel to expand it
+        try:
+            betslip_header_selectors = [
+                'span:has-text("Betslip")',
+                'div#betslip-container-mobile',
+                'div#betslip-container',
+                'div[class*="betslip"] span',
+            ]
+            header_sel, header = await find_first_visible(page, betslip_header_selectors)
+            if header:
+                await header.click()
+                print(f"    Clicked betslip header to expand")
+                await page.wait_for_timeout(500)
+        except:
+            pass
+        await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+    elif step == 2:
+        # Try clicking on the Single tab in betslip (for single bets)
+        try:
+            single_tab = await page.query_selector('button:has-text("Single")')
+            if single_tab and await single_tab.is_visible():
+                await single_tab.click()
+                print(f"    Clicked 'Single' tab to show stake input")
+                await page.wait_for_timeout(500)
+        except:
+            pass
+        # Also try Multi tab
+        try:
+            multi_tab = await page.query_selector('div#betslip-container-mobile button:has-text("Multi")')
+            if not multi_tab:
+                multi_tab = await page.query_selector('button:has-text("Multi")')
+            if multi_tab and await multi_tab.is_visible():
+                await multi_tab.click()
+                print(f"    Clicked 'Multi' tab to show stake input")
+        except:
+            pass
+    elif step == 3:
+        # Debug: Print what's in the betslip container and list inputs (single round-trip)
+        try:
+            debug_info = await page.evaluate(_STAKE_DEBUG_JS, [500, 5])
+            if debug_info['betslipHtml'] is not None:
+                print(f"    🔍 Debug: Betslip HTML (first 500 chars): {debug_info['betslipHtml']}")
+            else:
+                print(f"    🔍 Debug: No betslip container found!")
+            
+            # Also list all input elements on page
+            print(f"    🔍 Debug: Found {debug_info['inputCount']} input elements on page")
+            for idx, inp in enumerate(debug_info['inputs']):
+                print(f"      Input {idx+1}: id={inp['id'] or 'no-id'}, type={inp['type'] or 'no-type'}, placeholder={inp['placeholder'] or 'no-placeholder'}, visible={inp['visible']}")
+        except Exception as debug_err:
+            print(f"    🔍 Debug error: {debug_err}")
+
 
 async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache: dict = None, outcome_button_cache: dict = None):
     """Place a single bet slip
@@ -1669,22 +3013,17 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
     print(f"Selections: {selections}")
     print(f"Amount: R {amount:.2f}")
     
+    # Locators are lazy and re-resolve on every action, so one per selector serves every bet
+    def cached_locator(selector: str):
+        return get_cached_locator(page, selector)
+    
     try:
         # Ensure we're on a valid page before reloading
         current_url = page.url
         print(f"  Current URL: {current_url}")
         
-        # If we're on a match detail page, navigate to matches list first
-        if '/event/' in current_url:
-            print("  Currently on match detail page - navigating to matches list...")
-            try:
-                await safe_goto(page, 'https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=15000)
-                await page.wait_for_timeout(1000)
-            except asyncio.TimeoutError:
-                print(f"  ⚠️ Navigation timeout - continuing anyway")
-            except Exception as nav_error:
-                print(f"  ⚠️ Navigation failed: {nav_error}")
-                return False
+        # No intermediate navigation off match detail pages - the betslip container is global,
+        # and the first match below navigates directly to where we need to be
         
         # Clear betslip using the "Remove All" button (more reliable than navigation)
         print("  Clearing betslip...")
@@ -1692,13 +3031,12 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
         
         # First, check if betslip has any selections
         try:
-            betslip_check = await page.query_selector('div#betslip-container-mobile, div#betslip-container')
-            if betslip_check:
-                betslip_text = await betslip_check.inner_text()
+            betslip_state = await read_betslip_state(page)
+            if betslip_state:
                 # Check for actual bet selections
-                has_odds_value = bool(re.search(r'\d+\.\d{2}', betslip_text))
-                has_return_value = 'Total Betway Return' in betslip_text or 'Return' in betslip_text
-                has_bet_content = '1X2' in betslip_text or has_return_value
+                has_odds_value = betslip_state['hasOdds']
+                has_return_value = betslip_state['hasReturn']
+                has_bet_content = betslip_state['has1X2'] or has_return_value
                 
                 if has_odds_value and has_bet_content:
                     print("    ⚠️ Betslip has existing selections - clearing...")
@@ -1707,7 +3045,7 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                     remove_all_btn = await page.query_selector('div#betslip-remove-all')
                     if remove_all_btn and await remove_all_btn.is_visible():
                         await remove_all_btn.click()
-                        await page.wait_for_timeout(800)
+                        await wait_for_state(page, 'div#betslip-remove-all', 800, state='hidden')
                         print("    ✅ Clicked 'Remove All' button")
                         betslip_cleared = True
                     else:
@@ -1717,7 +3055,7 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                             try:
                                 if await btn.is_visible():
                                     await btn.click()
-                                    await page.wait_for_timeout(500)
+                                    await wait_for_state(page, 'div#betslip-remove-all', 500, state='hidden')
                                     print("    ✅ Clicked remove button via SVG")
                                     betslip_cleared = True
                                     break
@@ -1725,10 +3063,12 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                                 continue
                         
                         if not betslip_cleared:
-                            # Method 3: Navigate to clear (fallback)
+                            # Method 3: Navigate to clear (fallback) - go straight to the first match page
+                            # so the navigation is useful for selection, not a wasted extra hop
                             print("    ⚠️ Remove button not found - using navigation fallback...")
-                            await page.goto('https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=20000)
-                            await page.wait_for_timeout(1500)
+                            fallback_url = matches[0].get('url') if matches else None
+                            await page.goto(fallback_url or 'https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=20000)
+                            await wait_for_dom_complete(page, 1500)
                 else:
                     print("    [OK] Betslip is empty - ready to add selections")
                     betslip_cleared = True
@@ -1740,31 +3080,39 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
         
         # Verify betslip is now empty
         if betslip_cleared:
-            await page.wait_for_timeout(500)
+            await page.wait_for_timeout(50)  # debounce - the clear above already waited for the slip to empty
             try:
-                betslip_recheck = await page.query_selector('div#betslip-container-mobile, div#betslip-container')
-                if betslip_recheck:
-                    recheck_text = await betslip_recheck.inner_text()
-                    still_has_bets = bool(re.search(r'\d+\.\d{2}', recheck_text)) and '1X2' in recheck_text
+                recheck_state = await read_betslip_state(page)
+                if recheck_state:
+                    still_has_bets = recheck_state['hasOdds'] and recheck_state['has1X2']
                     if still_has_bets:
                         print("    ⚠️ Betslip still has selections after clear attempt!")
                         # Try remove all one more time
                         remove_all_btn = await page.query_selector('div#betslip-remove-all')
                         if remove_all_btn:
                             await remove_all_btn.click()
-                            await page.wait_for_timeout(800)
+                            await wait_for_state(page, 'div#betslip-remove-all', 800, state='hidden')
                             print("    ✅ Second attempt - clicked 'Remove All'")
             except:
                 pass
         
         # Close any modals that may have appeared
         try:
-            await close_all_modals(page, max_attempts=2)
+            await close_modals_fast(page, max_attempts=2)
         except:
             pass
         
         # Click on each match outcome
-        for i, (match, selection) in enumerate(zip(matches, selections)):
+        # Accumulator selections are order-independent: if we're already on the LAST match page
+        # (where the previous slip finished), walk the matches in reverse to reuse that page
+        match_order = list(range(len(matches)))
+        current_url = page.url.rstrip('/')
+        if len(matches) > 1 and (matches[-1].get('url') or '').rstrip('/') == current_url:
+            match_order.reverse()
+            print("  Already on last match page - selecting in reverse order to skip a navigation")
+        
+        for order_pos, i in enumerate(match_order):
+            match, selection = matches[i], selections[i]
             start_time = match.get('start_time', 'Unknown time')
             print(f"  Match {i+1}: {match['name']} | ⏰ {start_time} - Selecting: {selection}")
             
@@ -1783,77 +3131,71 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                     
                     # Navigate to match page to click buttons with asyncio timeout for extra protection
                     # CRITICAL: Using safe_goto() with hard timeout to prevent indefinite hangs
-                    try:
-                        await safe_goto(
-                            page, match_url,
-                            wait_until='domcontentloaded',
-                            timeout=15000
-                        )
-                    except asyncio.TimeoutError:
-                        print(f"    ⚠️ Navigation timeout - page may be slow, continuing...")
+                    if page.url.rstrip('/') == match_url.rstrip('/'):
+                        print(f"    Already on match page - skipping navigation")
+                    else:
+                        try:
+                            await safe_goto(
+                                page, match_url,
+                                wait_until='domcontentloaded',
+                                timeout=15000
+                            )
+                        except asyncio.TimeoutError:
+                            print(f"    ⚠️ Navigation timeout - page may be slow, continuing...")
+                    
+                    # Pre-warm the next match page while this one is clicked and verified
+                    # (betslip state lives on this page, so clicks stay serial)
+                    next_url = matches[match_order[order_pos + 1]].get('url') if order_pos + 1 < len(match_order) else None
+                    if next_url and next_url != match_url:
+                        await prefetch_url(page, next_url)
+                    
+                    # Close modals while waiting for the 1X2 grid to render instead of fixed sleeps
+                    async def wait_for_outcome_grid():
+                        try:
+                            await page.wait_for_selector(_OUTCOME_GRID_SELECTOR, state='attached', timeout=8000)
+                        except PlaywrightTimeoutError:
+                            print(f"    ⚠️ Outcome grid not detected within 8s - continuing with selector probe...")
                     
-                    await page.wait_for_timeout(1200)
-                    await close_all_modals(page, timeout_seconds=5)  # Reduced modal timeout
-                    await page.wait_for_timeout(1000)  # Reduced wait
+                    await asyncio.gather(
+                        close_modals_fast(page, timeout_seconds=5),  # Reduced modal timeout
+                        wait_for_outcome_grid()
+                    )
                     
                     # Check if we have cached selector for this match URL
-                    outcome_buttons = []
+                    outcome_count = 0
+                    button_selector = None
                     if outcome_button_cache and match_url in outcome_button_cache:
-                        # Use cached selector to query FRESH elements
+                        # Use cached selector to count FRESH elements
                         cached_selector = outcome_button_cache[match_url]
                         print(f"    [CACHE HIT] Using cached selector: {cached_selector[:50]}...")
                         try:
-                            # Wait for elements to be present before querying
-                            await page.wait_for_timeout(1000)  # Additional wait for dynamic content
-                            outcome_buttons = await page.query_selector_all(cached_selector)
-                            if len(outcome_buttons) >= 3:
-                                print(f"    ✓ Found {len(outcome_buttons)} fresh buttons using cached selector")
+                            outcome_count = await page.locator(cached_selector).count()
+                            if outcome_count >= 3:
+                                button_selector = cached_selector
+                                print(f"    ✓ Found {outcome_count} fresh buttons using cached selector")
                             else:
-                                print(f"    ⚠️  Cached selector returned {len(outcome_buttons)} buttons, trying fallback selectors...")
-                                outcome_buttons = []
+                                print(f"    ⚠️  Cached selector returned {outcome_count} buttons, trying fallback selectors...")
+                                outcome_count = 0
                         except Exception as e:
                             print(f"    ⚠️  Cached selector failed: {e}, trying fallback selectors...")
-                            outcome_buttons = []
+                            outcome_count = 0
                     
-                    # If cache miss or cached selector failed, try all selectors
-                    if len(outcome_buttons) < 3:
-                        # Extended list of selectors to handle different league page structures
-                        button_selectors = [
-                            'div.grid.p-1 > div.flex.items-center.justify-between.h-12',
-                            'div[class*="grid"] > div[class*="flex items-center justify-between h-12"]',
-                            'details:has(span:text("1X2")) div.grid > div',
-                            'div[price]',
-                            'button[data-translate-market-name="Full Time Result"] div[price]',
-                            'div[data-translate-market-name="Full Time Result"] div[price]',
-                            # Additional fallback selectors for different league structures
-                            'div[class*="market"] div[price]',
-                            'div[class*="outcome"] div[price]',
-                            'div.flex.items-center.justify-between[price]',
-                            'button[price]',
-                            'div[data-price]',
-                            'span[price]',
-                            # More generic selectors as last resort
-                            'div[class*="selection"]',
-                            'div[class*="bet-button"]',
-                            'div[class*="odds"]',
-                        ]
-                        
-                        for selector in button_selectors:
-                            try:
-                                buttons = await page.query_selector_all(selector)
-                                if len(buttons) >= 3:
-                                    outcome_buttons = buttons
-                                    print(f"    Found {len(buttons)} outcome buttons using selector: {selector}")
-                                    # Cache the working selector
-                                    if outcome_button_cache is not None:
-                                        outcome_button_cache[match_url] = selector
-                                        print(f"    [CACHE STORED] Selector cached for reuse")
-                                    break
-                            except:
-                                continue
+                    # If cache miss or cached selector failed, probe all selectors in one page call
+                    if outcome_count < 3:
+                        try:
+                            button_selector, outcome_count = await find_outcome_selector(page)
+                        except PlaywrightError:
+                            button_selector, outcome_count = None, 0
+                        if button_selector:
+                            print(f"    Found {outcome_count} outcome buttons using selector: {button_selector}")
+                            # Cache the working selector
+                            if outcome_button_cache is not None:
+                                outcome_button_cache[match_url] = button_selector
+                                print(f"    [CACHE STORED] Selector cached for reuse")
                     
-                    if len(outcome_buttons) >= 3 and selection_index < len(outcome_buttons):
-                        outcome_btn = outcome_buttons[selection_index]
+                    if outcome_count >= 3 and selection_index < outcome_count:
+                        # Locator re-resolves on every action, so retries never hold a stale handle
+                        outcome_btn = page.locator(button_selector).nth(selection_index)
                         selection_confirmed = False
                         max_click_attempts = 3
                         
@@ -1864,43 +3206,32 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                         
                         for click_attempt in range(max_click_attempts):
                             try:
-                                # Re-query buttons on retry to ensure fresh DOM elements
                                 if click_attempt > 0:
-                                    print(f"    🔄 Retry {click_attempt + 1}/{max_click_attempts}: Re-querying buttons...")
-                                    await page.wait_for_timeout(1000)
-                                    
-                                    # Try to find buttons again with cached selector
-                                    if outcome_button_cache and match_url in outcome_button_cache:
-                                        cached_selector = outcome_button_cache[match_url]
-                                        fresh_buttons = await page.query_selector_all(cached_selector)
-                                        if len(fresh_buttons) >= 3:
-                                            outcome_btn = fresh_buttons[selection_index]
-                                        else:
-                                            # Try fallback selectors
-                                            for sel in ['div[price]', 'div.grid.p-1 > div.flex.items-center']:
-                                                fresh_buttons = await page.query_selector_all(sel)
-                                                if len(fresh_buttons) >= 3:
-                                                    outcome_btn = fresh_buttons[selection_index]
-                                                    break
+                                    log.debug("    🔄 Retry %d/%d...", click_attempt + 1, max_click_attempts)
                                 
-                                await outcome_btn.scroll_into_view_if_needed()
-                                await page.wait_for_timeout(300)
+                                await outcome_btn.wait_for(state='visible', timeout=5000)
                                 
-                                # Try multiple click methods
+                                # Capture betslip text length before clicking (one round-trip)
+                                prev_betslip_len = await page.evaluate(_BETSLIP_TEXT_LEN_JS)
+                                
+                                # Locator click auto-scrolls and waits for stability;
+                                # fall back to a JS click only if something intercepts it
                                 try:
-                                    await outcome_btn.click()
-                                except:
-                                    try:
-                                        await outcome_btn.evaluate('el => el.click()')
-                                    except:
-                                        await outcome_btn.dispatch_event('click')
+                                    await outcome_btn.click(timeout=5000)
+                                except PlaywrightTimeoutError:
+                                    await outcome_btn.evaluate('el => el.click()')
                                 
-                                await page.wait_for_timeout(1500)
                                 cache_status = "[CACHED]" if (outcome_button_cache and match_url in outcome_button_cache) else ""
                                 print(f"    ✓ Clicked outcome '{selection}' {cache_status}")
                                 
+                                # Wait in the browser for the new selection row instead of fixed sleeps -
+                                # resolves as soon as the betslip grows and shows odds
+                                try:
+                                    await page.wait_for_function(_BETSLIP_GREW_JS, arg=prev_betslip_len, timeout=3000)
+                                except PlaywrightTimeoutError:
+                                    pass
+                                
                                 # VERIFY: Check if selection count INCREASED by 1
-                                await page.wait_for_timeout(500)
                                 new_selection_count = await count_betslip_selections(page)
                                 
                                 if new_selection_count > initial_selection_count:
@@ -1909,13 +3240,12 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                                     break
                                 else:
                                     # Fallback: check betslip text for content
-                                    betslip_check = await page.query_selector('div#betslip-container-mobile, div#betslip-container')
-                                    if betslip_check:
-                                        betslip_text = await betslip_check.inner_text()
+                                    betslip_state = await read_betslip_state(page)
+                                    if betslip_state:
                                         # Check if this is the first selection and betslip has content
                                         if initial_selection_count == 0 and new_selection_count == 0:
                                             # Count function might have failed - check content
-                                            has_content = '1X2' in betslip_text or (len(betslip_text) > 150 and 'Return' in betslip_text)
+                                            has_content = betslip_state['has1X2'] or (betslip_state['len'] > 150 and betslip_state['hasReturn'])
                                             if has_content:
                                                 print(f"    ✓ Selection confirmed in betslip (content check)")
                                                 selection_confirmed = True
@@ -1941,7 +3271,7 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                             return False
                             
                     else:
-                        print(f"    ❌ ERROR: Could not find outcome buttons on match page (found {len(outcome_buttons)} buttons)")
+                        print(f"    ❌ ERROR: Could not find outcome buttons on match page (found {outcome_count} buttons)")
                         print(f"    Page URL: {page.url}")
                         # Try to get page content for debugging
                         try:
@@ -1962,31 +3292,21 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                 return False
         
         # Wait for betslip to fully update with all selections
-        await page.wait_for_timeout(1000)
+        await wait_for_state(page, '#betslip-container-mobile, #betslip-container', 1000, state='attached')
         
         # CRITICAL: Scroll to make betslip visible and wait for it to load
         print("  Scrolling to betslip...")
         await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-        await page.wait_for_timeout(1000)
+        await wait_for_state(page, '#bet-amount-input, input[placeholder="0.00"]', 1000, state='attached')
         
         # Try to click betslip toggle button if it exists (mobile view may have collapsed betslip)
         try:
-            betslip_toggle_selectors = [
-                'button[aria-label*="Betslip"]',
-                'div#betslip-toggle',
-                'button:has-text("Betslip")',
-                'div.betslip-toggle',
-            ]
-            for toggle_sel in betslip_toggle_selectors:
-                try:
-                    toggle_btn = await page.query_selector(toggle_sel)
-                    if toggle_btn and await toggle_btn.is_visible():
-                        await toggle_btn.click()
-                        print(f"    Clicked betslip toggle: {toggle_sel}")
-                        await page.wait_for_timeout(1000)
-                        break
-                except:
-                    continue
+            # Probe all toggles concurrently, then click only the first visible one
+            toggle_sel, toggle_btn = await find_first_visible(page, _BETSLIP_TOGGLE_SELECTORS)
+            if toggle_btn:
+                await toggle_btn.click()
+                print(f"    Clicked betslip toggle: {toggle_sel}")
+                await wait_for_state(page, '#bet-amount-input, input[placeholder="0.00"]', 1000)
         except:
             pass
         
@@ -1995,148 +3315,67 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
         try:
             # Try multiple selectors with retries (betslip may take time to appear)
             stake_input = None
-            stake_selectors = [
-                '#bet-amount-input',
-                'input[placeholder="0.00"]',
-                'input[type="number"][inputmode="decimal"]',
-                'div#betslip-container-mobile input[type="number"]',
-                'div#betslip-container input[type="number"]',
-                'input[id*="bet-amount"]',
-                'input[class*="stake"]',
-                'input[placeholder*="0"]',  # Any placeholder with 0
-            ]
             
-            # Try to find stake input with retries (up to 5 attempts, 1 second apart)
-            for find_attempt in range(5):
-                for selector in stake_selectors:
+            # Last-known-good selector (persisted across runs) is usually a 1-call hit
+            preferred_stake = selector_cache_state['stake_selector']
+            if preferred_stake:
+                try:
+                    stake_input = await page.query_selector(preferred_stake)
+                    if stake_input and await stake_input.is_visible():
+                        print(f"    Found stake input using cached selector: {preferred_stake}")
+                    else:
+                        stake_input = None
+                except:
+                    stake_input = None
+            
+            # Let the browser poll for the joined selector: 2s, then one consolidated recovery, then 3s more
+            if not stake_input:
+                for wait_ms in (2000, 3000):
                     try:
-                        stake_input = await page.query_selector(selector)
-                        if stake_input and await stake_input.is_visible():
-                            print(f"    Found stake input using: {selector}")
-                            break
-                    except:
-                        continue
-                
-                if stake_input:
-                    break
-                
-                # If not found, try additional recovery steps
-                if find_attempt < 4:
-                    print(f"    ⏳ Stake input not found, retrying ({find_attempt + 1}/5)...")
+                        stake_input = await page.wait_for_selector(_STAKE_INPUT_VISIBLE_UNION, state='visible', timeout=wait_ms)
+                    except Exception:
+                        stake_input = None
                     
-                    # Try scrolling in different ways
-                    if find_attempt == 0:
-                        await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-                    elif find_attempt == 1:
-                        # Try clicking on the betslip header/panel to expand it
-                        try:
-                            betslip_header_selectors = [
-                                'span:has-text("Betslip")',
-                                'div#betslip-container-mobile',
-                                'div#betslip-container',
-                                'div[class*="betslip"] span',
-                            ]
-                            for header_sel in betslip_header_selectors:
-                                try:
-                                    header = await page.query_selector(header_sel)
-                                    if header and await header.is_visible():
-                                        await header.click()
-                                        print(f"    Clicked betslip header to expand")
-                                        await page.wait_for_timeout(500)
-                                        break
-                                except:
-                                    continue
-                        except:
-                            pass
-                        await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-                    elif find_attempt == 2:
-                        # Try clicking on the Single tab in betslip (for single bets)
-                        try:
-                            single_tab = await page.query_selector('button:has-text("Single")')
-                            if single_tab and await single_tab.is_visible():
-                                await single_tab.click()
-                                print(f"    Clicked 'Single' tab to show stake input")
-                                await page.wait_for_timeout(500)
-                        except:
-                            pass
-                        # Also try Multi tab
-                        try:
-                            multi_tab = await page.query_selector('div#betslip-container-mobile button:has-text("Multi")')
-                            if not multi_tab:
-                                multi_tab = await page.query_selector('button:has-text("Multi")')
-                            if multi_tab and await multi_tab.is_visible():
-                                await multi_tab.click()
-                                print(f"    Clicked 'Multi' tab to show stake input")
-                        except:
-                            pass
-                    elif find_attempt == 3:
-                        # Debug: Print what's in the betslip container
-                        try:
-                            betslip = await page.query_selector('div#betslip-container-mobile')
-                            if not betslip:
-                                betslip = await page.query_selector('div#betslip-container')
-                            if betslip:
-                                betslip_html = await betslip.inner_html()
-                                print(f"    🔍 Debug: Betslip HTML (first 500 chars): {betslip_html[:500]}")
-                            else:
-                                print(f"    🔍 Debug: No betslip container found!")
-                                
-                            # Also list all input elements on page
-                            all_inputs = await page.query_selector_all('input')
-                            print(f"    🔍 Debug: Found {len(all_inputs)} input elements on page")
-                            for idx, inp in enumerate(all_inputs[:5]):
-                                try:
-                                    inp_id = await inp.get_attribute('id') or 'no-id'
-                                    inp_type = await inp.get_attribute('type') or 'no-type'
-                                    inp_placeholder = await inp.get_attribute('placeholder') or 'no-placeholder'
-                                    inp_visible = await inp.is_visible()
-                                    print(f"      Input {idx+1}: id={inp_id}, type={inp_type}, placeholder={inp_placeholder}, visible={inp_visible}")
-                                except:
-                                    pass
-                        except Exception as debug_err:
-                            print(f"    🔍 Debug error: {debug_err}")
+                    if stake_input:
+                        print(f"    Found stake input")
+                        # Remember which selector matched so the next run starts with it
+                        winner = await stake_input.evaluate('(el, sels) => sels.find(s => el.matches(s)) || null', _STAKE_INPUT_SELECTORS)
+                        if winner:
+                            selector_cache_state['stake_selector'] = winner
+                        break
                     
-                    await page.wait_for_timeout(1000)
+                    if wait_ms == 2000:
+                        print(f"    ⏳ Stake input not visible after 2s - expanding betslip...")
+                        for step in range(3):
+                            await run_stake_recovery_step(page, step)
+                else:
+                    # Final failure - dump what the page actually has
+                    await run_stake_recovery_step(page, 3)
             
             if stake_input:
                 print("    Found stake input, setting value...")
                 amount_str = str(amount)
                 amount_entered = False
                 
-                # Try multiple methods to enter amount with verification
+                # Set and verify the amount in one evaluate per attempt
                 for attempt in range(3):
                     try:
                         # Use JavaScript directly (fill() doesn't work with number inputs that have validation)
-                        await stake_input.evaluate('''(el, amount) => {
-                            // Clear and set value
-                            el.value = '';
-                            el.focus();
-                            el.value = amount;
-                            
-                            // Trigger all necessary events for React/form validation
-                            el.dispatchEvent(new Event('input', { bubbles: true }));
-                            el.dispatchEvent(new Event('change', { bubbles: true }));
-                            el.blur();
-                        }''', amount_str)
-                        
-                        await page.wait_for_timeout(400)
-                        
-                        # VERIFY: Check if value was actually set
-                        entered_value = await stake_input.input_value()
-                        print(f"    Attempt {attempt + 1}: Input field value = '{entered_value}'")
+                        entered_value = await stake_input.evaluate(_SET_STAKE_JS, amount_str)
+                        log.debug("    Attempt %d: Input field value = '%s'", attempt + 1, entered_value)
                         
                         if entered_value and str(entered_value).strip() == amount_str:
                             print("    ✓ Amount successfully entered and verified!")
                             amount_entered = True
                             break
                         elif attempt < 2:
-                            print(f"    Retrying amount entry (attempt {attempt + 2}/3)...")
-                            await page.wait_for_timeout(500)
+                            log.debug("    Retrying amount entry (attempt %d/3)...", attempt + 2)
+                            await page.wait_for_timeout(200)
                         
                     except Exception as js_error:
                         print(f"    Error on attempt {attempt + 1}: {js_error}")
                         if attempt < 2:
-                            await page.wait_for_timeout(500)
+                            await page.wait_for_timeout(200)
                 
                 if not amount_entered:
                     print("    ❌ FAILED to enter amount after 3 attempts!")
@@ -2144,7 +3383,7 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                     
                 # CRITICAL: Wait for betslip to fully update after amount entry
                 print("    Waiting for betslip to update...")
-                await page.wait_for_timeout(1500)
+                await wait_for_betslip_ready(page, 1500)
                 
             else:
                 print("    ! Could not find stake input field")
@@ -2156,61 +3395,46 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
         # Check for betslip errors or conflicts before placing
         print("  Checking for conflicts or errors...")
         
-        await page.wait_for_timeout(800)
+        await wait_for_dom_complete(page, 800)
         
         # Close any modals that might have appeared after amount entry (aggressive check)
-        await close_all_modals(page, max_attempts=2)
+        await close_modals_fast(page, max_attempts=2)
         
         # CRITICAL: Verify betslip is ready before clicking Bet Now
         print("  Verifying betslip is ready to place...")
         betslip_ready = False
         max_retries = 5
         
+        # Stake renderings depend only on the amount - the pattern is cached per amount
+        stake_str = str(amount)
+        stake_re = stake_regex(amount)
+        
         for retry in range(max_retries):
             # Scroll down to ensure betslip is visible
             await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            await page.wait_for_timeout(500)
-            
-            # Get betslip content for validation
-            betslip_container = await page.query_selector('div#betslip-container-mobile')
-            if not betslip_container:
-                betslip_container = await page.query_selector('div#betslip-container')
-            if not betslip_container:
-                betslip_container = await page.query_selector('div[class*="betslip"]')
+            await wait_for_betslip_ready(page, 500)
             
-            if betslip_container:
-                betslip_text = await betslip_container.inner_text()
-                
+            # Get betslip content for validation (single round-trip)
+            betslip_state = await read_betslip_state(page)
+
+            if betslip_state:
+                betslip_text = betslip_state['text']
+
                 # More flexible checks - look for any indication betslip is ready
-                has_bet_button = 'Bet Now' in betslip_text or 'bet now' in betslip_text.lower() or 'Place Bet' in betslip_text
-                has_return_calculation = 'Return' in betslip_text or 'Total' in betslip_text
-                has_odds = any(char.isdigit() and '.' in betslip_text for char in betslip_text)
+                has_bet_button = betslip_state['hasBetNow']
+                has_return_calculation = _RETURN_OR_TOTAL_RE.search(betslip_text) is not None
+                has_odds = betslip_state['hasOdds']  # precompiled regex scan, not a per-char loop
                 
                 # Check for stake amount - look for the actual stake value OR verify return is calculated
-                stake_str = str(amount)
-                # Also check for amount without decimal if it's a whole number
-                stake_int_str = str(int(amount)) if amount == int(amount) else None
-                
-                # Betslip shows stake in different ways - check for any of them
-                has_stake = (
-                    stake_str in betslip_text or 
-                    f"R {stake_str}" in betslip_text or 
-                    f"R{stake_str}" in betslip_text or
-                    (stake_int_str and f"R {stake_int_str}" in betslip_text) or
-                    (stake_int_str and f"R{stake_int_str}" in betslip_text)
-                )
+                has_stake = stake_re.search(betslip_text) is not None
                 
                 # ALTERNATIVE: If return is shown with a valid amount, stake was entered
                 # Check if there's a return value that makes sense (return = stake * odds)
                 has_valid_return = False
                 if has_return_calculation:
                     # Look for "Return:R X.XX" pattern - if present, stake was entered
-                    return_match = re.search(r'Return[:\s]*R\s*(\d+\.?\d*)', betslip_text)
-                    if return_match:
-                        return_value = float(return_match.group(1))
-                        # If return is greater than 0, stake was entered
-                        if return_value > 0:
-                            has_valid_return = True
+                    # If return is greater than 0, stake was entered
+                    has_valid_return = parse_return_value(betslip_text) > 0
                 
                 # Betslip is ready if: has bet button AND (stake visible OR valid return calculated)
                 if has_bet_button and (has_stake or has_valid_return):
@@ -2221,7 +3445,7 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                     # Check if session expired (Login button appears instead of Bet Now)
                     # Look for "Login" right before "share" which indicates the button position
                     is_logged_out = ('Login' in betslip_text and 'Bet Now' not in betslip_text) or \
-                                   ('Loginshare' in betslip_text.replace(' ', ''))
+                                   (_LOGIN_SHARE_RE.search(betslip_text) is not None)
                     
                     if is_logged_out:
                         print(f"    ⚠️ [SESSION EXPIRED] Detected 'Login' instead of 'Bet Now' - attempting re-login...")
@@ -2235,18 +3459,18 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                         missing.append("Return")
                     if not has_stake:
                         missing.append(f"Stake ({stake_str})")
-                    print(f"    ⏳ Missing: {', '.join(missing)} (retry {retry + 1}/{max_retries})")
+                    log.debug("    ⏳ Missing: %s (retry %d/%d)", ', '.join(missing), retry + 1, max_retries)
                     
                     # Debug: print first 200 chars of betslip content on last retry
                     if retry == max_retries - 1:
-                        print(f"    🔍 Debug betslip content: {betslip_text[:200]}")
+                        log.debug("    🔍 Debug betslip content: %s", betslip_text[:200])
                 
                 if retry < max_retries - 1:
-                    await page.wait_for_timeout(1000)
+                    await wait_for_betslip_ready(page, min(250 * (2 ** retry), 2000))
             else:
                 print(f"    ⚠️ Could not find betslip container (retry {retry + 1}/{max_retries})")
                 if retry < max_retries - 1:
-                    await page.wait_for_timeout(1000)
+                    await wait_for_betslip_ready(page, min(250 * (2 ** retry), 2000))
         
         if not betslip_ready:
             print(f"    ❌ [ERROR] Betslip not ready after {max_retries} retries - stake amount not visible!")
@@ -2254,18 +3478,21 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
             return "RETRY"  # Return RETRY instead of False to trigger automatic retry
         
         # Get betslip content for debugging (try mobile container first from HTML)
-        betslip_container = await page.query_selector('div#betslip-container-mobile')
-        if not betslip_container:
-            betslip_container = await page.query_selector('div#betslip-container')
-        if not betslip_container:
-            betslip_container = await page.query_selector('div[class*="betslip"]')
-        if betslip_container:
-            betslip_text = await betslip_container.inner_text()
+        betslip_state = await read_betslip_state(page)
+        if betslip_state:
+            betslip_text = betslip_state['text']
             print(f"    Betslip contents: {betslip_text[:300]}")
             
+            # Lowercase once and scan the conflict needles in a single pass
+            hits = scan_betslip_needles(betslip_text.lower())
+            
             # CRITICAL: Check if user is logged out (betslip shows Login text but no betting elements)
-            # The word "Login" appears in T&Cs, so check for absence of key betting indicators
-            has_betting_elements = any(indicator in betslip_text for indicator in ['Total', 'Return', 'Stake', '1X2'])
+            # The word "Login" appears in T&Cs, so check for absence of key betting indicators.
+            # These stay case-sensitive: lowercase 'login'/'total'/'stake' also match T&C wording.
+            # (the 1X2 tally doubles as the selection count below)
+            selection_count = betslip_text.count('1X2')
+            has_betting_elements = selection_count > 0 or any(
+                indicator in betslip_text for indicator in ('Total', 'Return', 'Stake'))
             if 'Login' in betslip_text and not has_betting_elements:
                 print(f"\n    ❌❌❌ [CRITICAL ERROR] USER IS LOGGED OUT! ❌❌❌")
                 print(f"    ❌ Session expired - need to re-login")
@@ -2274,10 +3501,8 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                 return False
             
             # CRITICAL: Check for conflict message (case insensitive)
-            betslip_lower = betslip_text.lower()
-            has_conflict = ('conflicting' in betslip_lower and 'selection' in betslip_lower) or \
-                          'conflict' in betslip_lower or \
-                          ('there are' in betslip_lower and 'revise' in betslip_lower)
+            # ('conflicting ... selection' is already covered by the plain 'conflict' check)
+            has_conflict = 'conflict' in hits or ('there are' in hits and 'revise' in hits)
             
             if has_conflict:
                 print(f"\n    ❌❌❌ [CRITICAL ERROR] CONFLICTING SELECTIONS DETECTED! ❌❌❌")
@@ -2286,8 +3511,7 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                 
                 return False
             
-            # Check if betslip has correct number of selections
-            selection_count = betslip_text.count('1X2')
+            # Check if betslip has correct number of selections (counted above)
             expected_count = len(matches)
             
             if selection_count != expected_count:
@@ -2315,25 +3539,16 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                 return "RETRY"  # Signal retry instead of hard failure
             
             # Check for error messages in betslip
-            error_selectors = [
-                'div.error-message',
-                'div[class*="error"]',
-                'span[class*="error"]',
-                'div.betslip-error',
-                'div[class*="conflict"]',
-                'span[class*="conflict"]',
-                'div[role="alert"]'
-            ]
             
-            for selector in error_selectors:
-                error_elements = await page.query_selector_all(selector)
-                for error_elem in error_elements:
-                    error_text = await error_elem.inner_text()
-                    if error_text and len(error_text.strip()) > 0:
-                        print(f"    [ERROR] Betslip error detected: {error_text}")
-                        if 'conflict' in error_text.lower() or 'related' in error_text.lower():
-                            print("    [ERROR] Conflicting selections - aborting this bet")
-                            return False
+            # One query over the joined selector list, texts read in the same round-trip
+            error_texts = await page.eval_on_selector_all(_BETSLIP_ERROR_UNION, 'els => els.map(e => e.innerText)')
+            for error_text in error_texts:
+                if error_text and len(error_text.strip()) > 0:
+                    print(f"    [ERROR] Betslip error detected: {error_text}")
+                    error_lower = error_text.lower()
+                    if 'conflict' in error_lower or 'related' in error_lower:
+                        print("    [ERROR] Conflicting selections - aborting this bet")
+                        return False
         
         # ===== PRE-BET VERIFICATION =====
         # 1. Capture balance BEFORE placing bet
@@ -2353,113 +3568,49 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
         # Click place bet button
         print("  Attempting to place bet...")
         
-        await close_all_modals(page, max_attempts=2)
+        await close_modals_fast(page, max_attempts=2)
         await page.wait_for_timeout(500)
         
         try:
             # CRITICAL: Container-scoped selectors to find "Bet Now" button
             # Prioritizes searching within betslip containers (div#betslip-container, div#betslip-container-mobile)
             # to avoid clicking unrelated buttons elsewhere on the page
-            bet_button_selectors = [
-                # First priority: Look inside betslip container with exact ID from HTML
-                'div#betslip-container button#betslip-strike-btn',
-                'button#betslip-strike-btn',
-                '#betslip-strike-btn',
-                
-                # Secondary: Look by aria-label INSIDE betslip
-                'div#betslip-container button[aria-label="Bet Now"]',
-                'div#betslip-container-mobile button[aria-label="Bet Now"]',
-                'button[aria-label="Bet Now"]:not(#sign-up-btn)',
-                
-                # Tertiary: Look by text content INSIDE betslip container
-                'div#betslip-container button:has-text("Bet Now")',
-                'div#betslip-container-mobile button:has-text("Bet Now")',
-                'button.p-button:has-text("Bet Now"):not(#sign-up-btn)',
-                
-                # Quaternary: Look by class combinations from HTML BUT exclude sign-up button
-                'div#betslip-container button.p-button.bg-identity',
-                'div#betslip-container-mobile button.p-button.bg-identity',
-                'button.p-button.bg-identity:not(#sign-up-btn)',
-                
-                # Last resort: Any button with Bet in betslip container (explicitly exclude sign-up)
-                'div#betslip-container button:has-text("Bet"):not(#sign-up-btn)',
-                'div#betslip-container-mobile button:has-text("Bet"):not(#sign-up-btn)',
-            ]
-            
-            place_bet_btn = None
-            successful_selector = None
             
-            for selector in bet_button_selectors:
+            # One query for every candidate, then rank in Python (instead of up to 15 x 2s waits)
+            candidates = await page.query_selector_all(_BET_BUTTON_UNION_SELECTOR)
+            if not candidates:
                 try:
-                    btn = await page.wait_for_selector(selector, timeout=2000, state='visible')
-                    if btn:
-                        is_visible = await btn.is_visible()
-                        is_enabled = await btn.is_enabled()
-                        
-                        # CRITICAL: Verify this is NOT the sign-up button
-                        btn_id = await btn.get_attribute('id')
-                        if btn_id == 'sign-up-btn':
-                            print(f"    ⚠️  Skipping sign-up button (selector: {selector})")
-                            continue
-                        
-                        # CRITICAL: Get button text and verify it's not account-related
-                        try:
-                            btn_text = (await btn.inner_text()).lower()
-                            skip_keywords = ['account', 'deposit', 'withdraw', 'profile', 'login', 'sign', 'register']
-                            if any(kw in btn_text for kw in skip_keywords):
-                                print(f"    ⚠️  Skipping account-related button: '{btn_text}' (selector: {selector})")
-                                continue
-                        except:
-                            pass
-                        
-                        if is_visible and is_enabled:
-                            place_bet_btn = btn
-                            successful_selector = selector
-                            print(f"    ✓ Found enabled bet button: {selector}")
-                            break
-                        elif is_visible and not is_enabled:
-                            print(f"    ⚠️  Button found but disabled: {selector}")
-                        else:
-                            print(f"    ⚠️  Button found but not visible: {selector}")
-                except Exception as e:
-                    continue
+                    await page.wait_for_selector(_BET_BUTTON_UNION_SELECTOR, timeout=5000, state='visible')
+                    candidates = await page.query_selector_all(_BET_BUTTON_UNION_SELECTOR)
+                except Exception:
+                    candidates = []
+            
+            place_bet_btn, successful_selector = await rank_bet_buttons(candidates)
+            
+            if place_bet_btn:
+                print(f"    ✓ Found enabled bet button: {successful_selector}")
             
             if not place_bet_btn:
                 print("    ❌ [ERROR] Could not find enabled Bet Now button!")
-                print("    Attempting to capture all buttons for debugging...")
                 
-                # Try to list all buttons for debugging
-                try:
-                    all_buttons = await page.query_selector_all('button')
-                    print(f"    Found {len(all_buttons)} buttons total:")
-                    for i, btn in enumerate(all_buttons[:15]):  # Show first 15
-                        try:
-                            text = await btn.inner_text()
-                            classes = await btn.get_attribute('class')
-                            btn_id = await btn.get_attribute('id')
-                            is_vis = await btn.is_visible()
-                            print(f"      {i+1}. text='{text[:30]}' id='{btn_id}' visible={is_vis}")
-                        except:
-                            pass
-                except:
-                    pass
+                # Try to list all buttons for debugging (skips the evaluate entirely below DEBUG)
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("    Attempting to capture all buttons for debugging...")
+                    try:
+                        dump = await page.evaluate(_BUTTON_DUMP_JS, 15)  # Show first 15
+                        log.debug("    Found %d buttons total:", dump['total'])
+                        for i, info in enumerate(dump['buttons']):
+                            log.debug("      %d. text='%s' id='%s' visible=%s", i + 1, info['text'], info['id'], info['visible'])
+                    except:
+                        pass
                 
                 return False
             
-            # Double-check button is not disabled
-            is_disabled = await place_bet_btn.get_attribute('disabled')
-            aria_disabled = await place_bet_btn.get_attribute('aria-disabled')
-            
-            if is_disabled or aria_disabled == 'true':
-                print(f"    ❌ [ERROR] Bet Now button is DISABLED!")
-                print(f"       disabled attribute: {is_disabled}")
-                print(f"       aria-disabled: {aria_disabled}")
-                return False
-            
+            # disabled / aria-disabled were already checked in the candidate evaluate above
             print(f"    Button ready to click (selector: {successful_selector})")
             
             # Try multiple click methods to handle DOM detachment and ensure modal appears
-            # Re-queries button before each attempt to avoid "element detached from DOM" errors
+            # Acts through a Locator that re-resolves on each attempt to avoid "element detached from DOM" errors
             # Stops after first successful method (when confirmation modal is detected)
             print("    Attempting to click Bet Now button...")
             click_success = False
@@ -2470,8 +3621,11 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                 # FIRST PRIORITY: Check if balance decreased (bet was placed)
                 # This handles cases where Account modal appears instead of bet confirmation
                 if check_balance_change and pre_click_balance is not None and pre_click_balance > 0:
-                    await page.wait_for_timeout(500)
-                    current_balance = await get_current_balance(page)
+                    for delay in _BALANCE_POLL_DELAYS_MS:
+                        await page.wait_for_timeout(delay)
+                        current_balance = await get_current_balance(page)
+                        if 0 < current_balance < pre_click_balance:
+                            break
                     if current_balance > 0 and current_balance < pre_click_balance:
                         balance_diff = pre_click_balance - current_balance
                         print(f"    ✓ [check_for_modal] BALANCE DECREASED: R{pre_click_balance:.2f} → R{current_balance:.2f} (diff: R{balance_diff:.2f})")
@@ -2484,57 +3638,19 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                 
                 # SECOND: Check if this is an Account Options modal (NOT a bet confirmation)
                 # Account modal has unique identifiers we should exclude
-                account_modal_indicators = [
-                    '#deposit-account-nav',
-                    '#withdraw-account-nav', 
-                    '#banking-iframe-deposit',
-                    'text="Account Options"',
-                    'text="Deposit funds"',
-                    '[aria-label="Deposit funds"]',
-                ]
-                
-                for indicator in account_modal_indicators:
-                    try:
-                        elem = await page.query_selector(indicator)
-                        if elem and await elem.is_visible():
-                            print(f"    ⚠️ [check_for_modal] Detected Account modal (no bet placed) - indicator: {indicator}")
-                            return False  # This is NOT a bet confirmation modal and bet wasn't placed
-                    except:
-                        continue
                 
-                # Check for SPECIFIC bet confirmation elements (not generic modal selectors)
-                # These are unique to the bet confirmation modal
-                confirmation_selectors = [
-                    'button#strike-conf-continue-btn',  # "Continue betting" button - most specific
-                    'span:has-text("Bet Confirmation")',  # Title of confirmation modal
-                    'button:has-text("Continue betting")',  # Text of continue button
-                    'div:has-text("Your bet has been placed")',  # Success message
-                ]
-                
-                for selector in confirmation_selectors:
-                    try:
-                        element = await page.query_selector(selector)
-                        if element and await element.is_visible():
-                            print(f"    ✓ [check_for_modal] Found bet confirmation element: {selector}")
-                            return True
-                    except:
-                        pass
+                hit = await find_visible_index(page, _ACCOUNT_MODAL_INDICATORS)
+                if hit >= 0:
+                    print(f"    ⚠️ [check_for_modal] Detected Account modal (no bet placed) - indicator: {_ACCOUNT_MODAL_INDICATORS[hit]}")
+                    return False  # This is NOT a bet confirmation modal and bet wasn't placed
                 
-                # Fallback: check generic modal but verify it's not Account modal
-                generic_modal_selectors = [
-                    'button:has-text("Confirm")',
-                    'button:has-text("Place Bet")',
-                    'button:has-text("OK")',
-                ]
-                for selector in generic_modal_selectors:
-                    try:
-                        element = await page.query_selector(selector)
-                        if element and await element.is_visible():
-                            return True
-                    except:
-                        pass
+                # Check for SPECIFIC bet confirmation elements first, then the generic
+                # modal buttons as a fallback - one probe, priority order preserved
+                hit = await find_visible_index(page, _CONFIRMATION_SELECTORS + _GENERIC_MODAL_SELECTORS)
+                if 0 <= hit < len(_CONFIRMATION_SELECTORS):
+                    print(f"    ✓ [check_for_modal] Found bet confirmation element: {_CONFIRMATION_SELECTORS[hit]}")
                 
-                return False
+                return hit >= 0
             
             # Helper function to check for and close Account Options modal
             async def check_and_close_account_modal(pre_balance=None):
@@ -2553,45 +3669,16 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                         pass
                 
                 # Also check if bet confirmation elements are present - don't close if they are
-                confirmation_indicators = [
-                    'button#strike-conf-continue-btn',  # Continue betting button
-                    'text="Bet Confirmation"',
-                    'text="Booking Code"',
-                    'text="Successful Bets"',
-                    'text="Betslip:"',
-                ]
-                for conf_indicator in confirmation_indicators:
-                    try:
-                        elem = await page.query_selector(conf_indicator)
-                        if elem and await elem.is_visible():
-                            print(f"    ✓ [ACCOUNT CHECK] Found bet confirmation indicator: {conf_indicator} - NOT closing")
-                            return False  # This is a bet confirmation, not an account modal
-                    except:
-                        continue
+                hit = await find_visible_index(page, _CONFIRMATION_INDICATORS)
+                if hit >= 0:
+                    print(f"    ✓ [ACCOUNT CHECK] Found bet confirmation indicator: {_CONFIRMATION_INDICATORS[hit]} - NOT closing")
+                    return False  # This is a bet confirmation, not an account modal
                 
                 # Use more specific selectors based on the actual modal HTML
-                account_indicators = [
-                    '#deposit-account-nav',  # Most reliable - the deposit nav tab
-                    '#withdraw-account-nav',  # Withdraw nav tab
-                    '#banking-iframe-deposit',  # Banking iframe
-                    '[aria-label="Deposit funds"]',  # Aria label
-                    'text="Account Options"',
-                    'text="Deposit funds"',
-                ]
-                
-                detected = False
-                for indicator in account_indicators:
-                    try:
-                        elem = await page.query_selector(indicator)
-                        if elem and await elem.is_visible():
-                            detected = True
-                            print(f"    ⚠️ [ACCOUNT MODAL] Detected via: {indicator}")
-                            break
-                    except:
-                        continue
-                
-                if not detected:
+                hit = await find_visible_index(page, _ACCOUNT_MODAL_INDICATORS)
+                if hit < 0:
                     return False
+                print(f"    ⚠️ [ACCOUNT MODAL] Detected via: {_ACCOUNT_MODAL_INDICATORS[hit]}")
                     
                 print(f"    ⚠️ [ACCOUNT MODAL] Closing Account Options/Deposit modal...")
                 
@@ -2600,26 +3687,11 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                 await page.wait_for_timeout(500)
                 
                 # Check if it's still there using the most reliable indicator
-                still_visible = False
-                for indicator in account_indicators[:3]:  # Check the reliable selectors
-                    try:
-                        elem = await page.query_selector(indicator)
-                        if elem and await elem.is_visible():
-                            still_visible = True
-                            break
-                    except:
-                        continue
+                still_visible = await find_visible_index(page, _ACCOUNT_MODAL_INDICATORS[:3]) >= 0  # Check the reliable selectors
                 
                 if still_visible:
                     # Try clicking close button
-                    close_selectors = [
-                        'svg[id="modal-close-btn"]',
-                        '#modal-close-btn',
-                        'button[aria-label="Close"]',
-                        'button:has-text("×")',
-                        '.modal-close-btn',
-                    ]
-                    for close_sel in close_selectors:
+                    for close_sel in _ACCOUNT_MODAL_CLOSE_SELECTORS:
                         try:
                             close_btns = await page.query_selector_all(close_sel)
                             for close_btn in close_btns:
@@ -2638,22 +3710,33 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                 print(f"    ✓ Account modal closed")
                 return True
             
-            # Helper function to re-query button (Betway re-renders the betslip)
-            async def get_fresh_button():
-                # Wait a bit for DOM to stabilize after betslip update
-                await page.wait_for_timeout(800)
-                
-                for selector in bet_button_selectors:
-                    try:
-                        btn = await page.wait_for_selector(selector, timeout=3000, state='attached')
-                        if btn and await btn.is_visible() and await btn.is_enabled():
-                            # Double-check it's still enabled (Betway may update it)
-                            await page.wait_for_timeout(300)
-                            if await btn.is_enabled():
-                                return btn
-                    except:
-                        continue
-                return None
+            # Stable locator for the chosen button - it re-resolves on every action, so a
+            # betslip re-render (or the Method 6 reload) can't leave us with a detached handle
+            try:
+                await place_bet_btn.evaluate(_BET_TARGET_TAG_JS)
+                bet_loc = page.locator(_BET_TARGET_SELECTOR).first
+            except Exception:
+                # Handle already detached - stay inside the betslip rather than the whole union
+                bet_loc = page.locator(_BETSLIP_BET_BUTTON_SELECTOR).locator('visible=true').filter(has_text=_BET_BTN_RE).first
+            
+            # Event-driven confirmation check - races the confirmation modal against the
+            # Account modal so a mis-click is reported as soon as it happens, not after the timeout
+            async def wait_for_confirmation(timeout=2000):
+                outcomes = {
+                    asyncio.create_task(wait_for_state(page, ', '.join(_CONFIRMATION_SELECTORS), timeout)): True,
+                    asyncio.create_task(wait_for_state(page, _ACCOUNT_MODAL_CSS_UNION, timeout)): False,
+                }
+                pending = set(outcomes)
+                try:
+                    while pending:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            if task.result():
+                                return outcomes[task]
+                    return False
+                finally:
+                    for task in pending:
+                        task.cancel()
             
             # Capture balance BEFORE any click attempts (for balance-based bet detection)
             pre_click_balance = await get_current_balance(page)
@@ -2663,138 +3746,63 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
             # Track how many times Account modal appears (indicates position problem)
             account_modal_count = 0
             
-            # Method 1: Scroll into view and JavaScript click
-            if not modal_appeared:
+            # Click strategies, tried in order until the confirmation modal appears.
+            # Each entry: (success label, miss label, action). An action returning False
+            # means it could not fire at all, so there is nothing to check afterwards.
+            async def js_click():
+                # Ensure button is fully visible and stable
+                await bet_loc.scroll_into_view_if_needed(timeout=3000)
+                await page.wait_for_timeout(500)
+                
+                # Verify button is still enabled before clicking
+                if not await bet_loc.is_enabled(timeout=3000):
+                    print("    ⚠️  Button became disabled - waiting...")
+                    await page.wait_for_timeout(1000)
+                
+                await bet_loc.evaluate('el => el.click()', timeout=3000)
+            
+            async def enter_key():
+                await bet_loc.focus(timeout=3000)
+                await page.wait_for_timeout(300)
+                await page.keyboard.press('Enter')
+            
+            async def mouse_click():
+                box = await bet_loc.bounding_box(timeout=3000)
+                if not box:
+                    return False
+                await page.mouse.click(box['x'] + box['width'] / 2, box['y'] + box['height'] / 2)
+            
+            click_strategies = [
+                ('JavaScript click', 'Click executed', js_click),
+                ('Direct click', 'Click executed', lambda: bet_loc.click(timeout=3000, force=True)),
+                ('Dispatch click', 'Click executed', lambda: bet_loc.dispatch_event('click', timeout=3000)),
+                ('Enter key', 'Enter pressed', enter_key),
+                ('Mouse click', 'Mouse click', mouse_click),
+            ]
+            
+            for method_num, (label, miss_label, action) in enumerate(click_strategies, start=1):
+                if modal_appeared:
+                    break
                 try:
-                    fresh_btn = await get_fresh_button()
-                    if fresh_btn:
-                        # Ensure button is fully visible and stable
-                        await fresh_btn.scroll_into_view_if_needed()
-                        await page.wait_for_timeout(500)
-                        
-                        # Verify button is still enabled before clicking
-                        is_enabled = await fresh_btn.is_enabled()
-                        if not is_enabled:
-                            print("    ⚠️  Button became disabled - waiting...")
-                            await page.wait_for_timeout(1000)
-                            fresh_btn = await get_fresh_button()
-                        
-                        if fresh_btn:
-                            await fresh_btn.evaluate('el => el.click()')
-                            await page.wait_for_timeout(1500)  # Increased wait for modal
-                    
-                    # CRITICAL: Check if Account Options modal appeared instead of bet confirmation
-                    account_modal_closed = await check_and_close_account_modal(pre_click_balance)
-                    if account_modal_closed:
-                        account_modal_count += 1
-                        print("    ⚠️ Account modal was triggered instead of bet - will retry")
-                    
-                    modal_appeared = await check_for_modal(check_balance_change=True, pre_click_balance=pre_click_balance)
-                    if modal_appeared:
-                        print("    ✅ Method 1: JavaScript click SUCCESS - modal appeared!")
-                        click_success = True
-                    else:
-                        print("    ✗ Method 1: Click executed but no modal appeared")
-                except Exception as e:
-                    print(f"    ✗ Method 1 failed: {e}")
-            
-            # Method 2: Direct Playwright click
-            if not modal_appeared:
-                try:
-                    fresh_btn = await get_fresh_button()
-                    if fresh_btn:
-                        await fresh_btn.click(timeout=3000, force=True)
-                    await page.wait_for_timeout(1000)
-                    
-                    # Check for Account Options modal
-                    account_modal_closed = await check_and_close_account_modal(pre_click_balance)
-                    if account_modal_closed:
-                        account_modal_count += 1
-                        print("    ⚠️ Account modal was triggered instead of bet - will retry")
-                    
-                    modal_appeared = await check_for_modal(check_balance_change=True, pre_click_balance=pre_click_balance)
-                    if modal_appeared:
-                        print("    ✅ Method 2: Direct click SUCCESS - modal appeared!")
-                        click_success = True
-                    else:
-                        print("    ✗ Method 2: Click executed but no modal appeared")
-                except Exception as e:
-                    print(f"    ✗ Method 2 failed: {e}")
-            
-            # Method 3: Dispatch click event
-            if not modal_appeared:
-                try:
-                    fresh_btn = await get_fresh_button()
-                    if fresh_btn:
-                        await fresh_btn.dispatch_event('click')
-                    await page.wait_for_timeout(1000)
-                    
-                    # Check for Account Options modal
-                    account_modal_closed = await check_and_close_account_modal(pre_click_balance)
-                    if account_modal_closed:
-                        account_modal_count += 1
-                        print("    ⚠️ Account modal was triggered instead of bet - will retry")
-                    
-                    modal_appeared = await check_for_modal(check_balance_change=True, pre_click_balance=pre_click_balance)
-                    if modal_appeared:
-                        print("    ✅ Method 3: Dispatch click SUCCESS - modal appeared!")
-                        click_success = True
-                    else:
-                        print("    ✗ Method 3: Click executed but no modal appeared")
-                except Exception as e:
-                    print(f"    ✗ Method 3 failed: {e}")
-            
-            # Method 4: Focus and press Enter
-            if not modal_appeared:
-                try:
-                    fresh_btn = await get_fresh_button()
-                    if fresh_btn:
-                        await fresh_btn.focus()
-                        await page.wait_for_timeout(300)
-                    await page.keyboard.press('Enter')
-                    await page.wait_for_timeout(1000)
-                    
-                    # Check for Account Options modal
-                    account_modal_closed = await check_and_close_account_modal(pre_click_balance)
-                    if account_modal_closed:
-                        account_modal_count += 1
-                        print("    ⚠️ Account modal was triggered instead of bet - will retry")
+                    if await action() is False:
+                        continue
                     
-                    modal_appeared = await check_for_modal(check_balance_change=True, pre_click_balance=pre_click_balance)
-                    if modal_appeared:
-                        print("    ✅ Method 4: Enter key SUCCESS - modal appeared!")
-                        click_success = True
-                    else:
-                        print("    ✗ Method 4: Enter pressed but no modal appeared")
-                except Exception as e:
-                    print(f"    ✗ Method 4 failed: {e}")
-            
-            # Method 5: Mouse click at button coordinates
-            if not modal_appeared:
-                try:
-                    fresh_btn = await get_fresh_button()
-                    if fresh_btn:
-                        box = await fresh_btn.bounding_box()
-                        if box:
-                            x = box['x'] + box['width'] / 2
-                            y = box['y'] + box['height'] / 2
-                            await page.mouse.click(x, y)
-                        await page.wait_for_timeout(1000)
-                        
-                        # Check for Account Options modal
+                    modal_appeared = await wait_for_confirmation()
+                    if not modal_appeared:
+                        # CRITICAL: Check if Account Options modal appeared instead of bet confirmation
                         account_modal_closed = await check_and_close_account_modal(pre_click_balance)
                         if account_modal_closed:
                             account_modal_count += 1
                             print("    ⚠️ Account modal was triggered instead of bet - will retry")
                         
                         modal_appeared = await check_for_modal(check_balance_change=True, pre_click_balance=pre_click_balance)
-                        if modal_appeared:
-                            print("    ✅ Method 5: Mouse click SUCCESS - modal appeared!")
-                            click_success = True
-                        else:
-                            print("    ✗ Method 5: Mouse click but no modal appeared")
+                    if modal_appeared:
+                        print(f"    ✅ Method {method_num}: {label} SUCCESS - modal appeared!")
+                        click_success = True
+                    else:
+                        print(f"    ✗ Method {method_num}: {miss_label} but no modal appeared")
                 except Exception as e:
-                    print(f"    ✗ Method 5 failed: {e}")
+                    print(f"    ✗ Method {method_num} failed: {e}")
             
             # If Account modal appeared multiple times, try special recovery method
             if not modal_appeared and account_modal_count >= 2:
@@ -2820,7 +3828,7 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                             x = box['x'] + box['width'] / 2
                             y = box['y'] + box['height'] / 2 - 5  # 5px above center
                             await page.mouse.click(x, y)
-                            await page.wait_for_timeout(1500)
+                            await wait_for_confirmation(1500)
                             
                             # Close any account modal that might appear
                             await check_and_close_account_modal(pre_click_balance)
@@ -2839,34 +3847,35 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                     # Reload the current match page to get fresh DOM
                     current_url = page.url
                     await page.reload(wait_until='domcontentloaded', timeout=15000)
-                    await page.wait_for_timeout(2000)
+                    await wait_for_page_settled(page, 10000)
                     await close_all_modals(page)
                     
                     # Re-capture balance after reload
                     pre_click_balance = await get_current_balance(page)
                     
                     # Re-enter the bet amount since page was reloaded
-                    stake_input = await page.query_selector('#bet-amount-input')
-                    if not stake_input:
-                        stake_input = await page.query_selector('input[placeholder="0.00"]')
+                    # One union query instead of two sequential probes
+                    stake_input = await page.query_selector('#bet-amount-input, input[placeholder="0.00"]')
                     if stake_input:
-                        await stake_input.evaluate('''(el, amt) => {
-                            el.value = '';
-                            el.focus();
-                            el.value = amt;
-                            el.dispatchEvent(new Event('input', { bubbles: true }));
-                            el.dispatchEvent(new Event('change', { bubbles: true }));
-                            el.blur();
-                        }''', str(amount))
-                        await page.wait_for_timeout(1500)
+                        await stake_input.evaluate(_SET_STAKE_JS, str(amount))
+                        await wait_for_betslip_ready(page, 1500)
                     
-                    # Try to click the fresh button
-                    fresh_btn = await get_fresh_button()
+                    # Try to click the fresh button - the reload dropped the tag, so rank and tag again
+                    fresh_btn, _ = await rank_bet_buttons(
+                        await page.query_selector_all(_BET_BUTTON_UNION_SELECTOR), verbose=False)
                     if fresh_btn:
-                        await fresh_btn.scroll_into_view_if_needed()
+                        await fresh_btn.evaluate(_BET_TARGET_TAG_JS)
+                        bet_loc = page.locator(_BET_TARGET_SELECTOR).first
+                    try:
+                        await bet_loc.wait_for(state='visible', timeout=3000)
+                        bet_visible = True
+                    except PlaywrightTimeoutError:
+                        bet_visible = False
+                    if bet_visible:
+                        await bet_loc.scroll_into_view_if_needed(timeout=3000)
                         await page.wait_for_timeout(500)
-                        await fresh_btn.click(timeout=3000, force=True)
-                        await page.wait_for_timeout(1500)
+                        await bet_loc.click(timeout=3000, force=True)
+                        await wait_for_confirmation(1500)
                         
                         # Close any account modal
                         await check_and_close_account_modal(pre_click_balance)
@@ -2900,26 +3909,13 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                         print(f"    💰 Final balance check: R{final_balance:.2f} (no decrease from R{pre_click_balance:.2f})")
                 
                 if not click_success:
-                    # Try to get button's computed style and state for debugging
-                    try:
-                        button_info = await place_bet_btn.evaluate('''el => {
-                            const style = window.getComputedStyle(el);
-                            return {
-                                display: style.display,
-                                visibility: style.visibility,
-                                opacity: style.opacity,
-                                pointerEvents: style.pointerEvents,
-                                zIndex: style.zIndex,
-                                position: style.position,
-                                disabled: el.disabled,
-                                ariaDisabled: el.getAttribute('aria-disabled'),
-                                classList: Array.from(el.classList),
-                                id: el.id,
-                            };
-                        }''')
-                        print(f"    🔍 Button debug info: {button_info}")
-                    except:
-                        pass
+                    # Try to get button's computed style and state for debugging (DEBUG only - costs an evaluate)
+                    if log.isEnabledFor(logging.DEBUG):
+                        try:
+                            button_info = await bet_loc.evaluate(_BUTTON_STATE_DEBUG_JS, timeout=2000)
+                            log.debug("    🔍 Button debug info: %s", button_info)
+                        except:
+                            pass
                     
                     # Log the account modal issue if it happened multiple times
                     if account_modal_count > 0:
@@ -2932,82 +3928,58 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
             print("    ✅ Bet Now button clicked and confirmation modal appeared!")
             
             # Modal already appeared, no need to wait again
-            await page.wait_for_timeout(500)
             
             # CRITICAL: Check for PRICE CHANGE modal first and accept new odds
             # Price change modals appear when odds change between selection and placement
             price_change_handled = False
-            price_change_selectors = [
-                'button:has-text("Accept")',
-                'button:has-text("Accept Changes")',
-                'button:has-text("Accept New Odds")',
-                'button:has-text("Accept Odds")',
-                'button:has-text("Accept Price")',
-                'button:has-text("Accept new price")',
-                'button:has-text("Confirm")',
-                'button[aria-label*="Accept"]',
-                'button[id*="accept"]',
-                'button.p-button:has-text("Accept")',
-            ]
             
-            for price_selector in price_change_selectors:
-                try:
-                    accept_btn = await page.query_selector(price_selector)
-                    if accept_btn and await accept_btn.is_visible():
-                        # Check if this is a price change modal by looking for price-related text
-                        try:
-                            modal_text = await page.query_selector('div[role="dialog"], div[class*="modal"]')
-                            if modal_text:
-                                text_content = await modal_text.inner_text()
-                                text_lower = text_content.lower()
-                                if any(keyword in text_lower for keyword in ['price', 'odds', 'changed', 'new', 'updated', 'different']):
-                                    print(f"    ⚠️ [PRICE CHANGE] Detected price change modal - accepting new odds...")
-                                    await accept_btn.click()
-                                    await page.wait_for_timeout(1500)
-                                    price_change_handled = True
-                                    print(f"    ✓ Price change accepted!")
-                                    break
-                        except:
-                            pass
-                        
-                        # Even if we can't verify it's a price modal, try clicking Accept
-                        if not price_change_handled:
-                            btn_text = await accept_btn.inner_text()
-                            if 'accept' in btn_text.lower():
-                                print(f"    ⚠️ [PRICE CHANGE] Found Accept button - clicking...")
-                                await accept_btn.click()
-                                await page.wait_for_timeout(1500)
-                                price_change_handled = True
-                                print(f"    ✓ Accepted!")
-                                break
-                except:
-                    continue
+            # Locate the Accept/Confirm button and read its modal text in a single evaluate
+            try:
+                probe = await page.evaluate(_ACCEPT_PROBE_JS)
+                if probe:
+                    modal_lower = probe['modalText'].lower()
+                    if any(keyword in modal_lower for keyword in _PRICE_CHANGE_KEYWORDS):
+                        print(f"    ⚠️ [PRICE CHANGE] Detected price change modal - accepting new odds...")
+                    elif 'accept' in probe['text'].lower():
+                        # Even if we can't verify it's a price modal, click Accept
+                        print(f"    ⚠️ [PRICE CHANGE] Found Accept button - clicking...")
+                    else:
+                        probe = None
+                    if probe:
+                        await page.click(_ACCEPT_PROBE_SELECTOR, timeout=3000)
+                        await wait_for_state(page, 'button#strike-conf-continue-btn', 1500)
+                        price_change_handled = True
+                        print(f"    ✓ Price change accepted!")
+            except:
+                pass
             
             if price_change_handled:
                 # After accepting price change, we need to wait for the bet to complete
-                await page.wait_for_timeout(1000)
-            
-            # CRITICAL: Try all possible confirmation buttons
-            confirmation_selectors = [
-                'button:has-text("Confirm")',
-                'button:has-text("Place Bet")',
-                'button:has-text("OK")',
-                'button:has-text("Yes")',
-                'button[id*="confirm"]',
-                'button[id*="place"]',
-                'button[class*="confirm"]',
-                'button[aria-label*="Confirm"]',
-                'button.p-button:has-text("Confirm")',
-            ]
+                await wait_for_dom_complete(page, 1000)
             
             # Note: Betway doesn't always show a confirmation button - bet is placed automatically
-            # Just wait for the bet to process
-            await page.wait_for_timeout(1500)
+            # Wait for the success modal's Continue button (what verification reads next)
+            await wait_for_state(page, 'button#strike-conf-continue-btn', 1500)
             
             # ===== POST-BET VERIFICATION =====
             # Verify bet was actually placed using multiple checks
             print("  [POST-BET] Verifying bet placement...")
-            verification = await verify_bet_placement(page, amount, balance_before)
+            # The Continue-betting lookup is independent of verification (nothing is clicked
+            # until both finish), so run them concurrently - tail latency is max, not sum
+            async def find_continue_betting():
+                """One 3s wait on the union, then the first visible selector in priority order."""
+                if not await wait_for_state(page, _CONTINUE_BETTING_UNION, 3000):
+                    return None, None
+                return await find_first_visible(page, _CONTINUE_BETTING_VISIBLE)
+            
+            verification, continue_match = await asyncio.gather(
+                verify_bet_placement(page, amount, balance_before),
+                find_continue_betting(),
+                return_exceptions=True,
+            )
+            if isinstance(verification, BaseException):
+                raise verification
+            cont_selector, continue_btn = (None, None) if isinstance(continue_match, BaseException) else continue_match
             
             if verification['success']:
                 confidence = verification['confidence']
@@ -3034,26 +4006,12 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
             
             # Look for success confirmation or "Continue betting" button
             # After successful bet, Betway shows a "Bet Confirmation" modal with "Continue betting" button
-            continue_betting_selectors = [
-                'button#strike-conf-continue-btn',  # Primary selector from HTML
-                'button[aria-label="Continue betting"]',
-                'button:has-text("Continue betting")',
-                'button.p-button:has-text("Continue betting")',
-                'button:has-text("Continue")',  # Shorter text match
-            ]
-            
             bet_confirmed = False
-            continue_btn = None
             
-            # First, find the Continue betting button
-            for cont_selector in continue_betting_selectors:
-                try:
-                    continue_btn = await page.wait_for_selector(cont_selector, timeout=3000, state='visible')
-                    if continue_btn and await continue_btn.is_visible():
-                        print(f"    ✅ Found 'Continue betting' button using: {cont_selector}")
-                        break
-                except:
-                    continue
+            # The Continue betting button was looked up alongside verification above - one 3s
+            # wait on the union instead of a 3s wait per selector
+            if continue_btn:
+                print(f"    ✅ Found 'Continue betting' button using: {cont_selector}")
             
             # If button found, try multiple click methods
             if continue_btn:
@@ -3066,10 +4024,8 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                         await continue_btn.scroll_into_view_if_needed()
                         await page.wait_for_timeout(300)
                         await continue_btn.evaluate('el => el.click()')
-                        await page.wait_for_timeout(500)
-                        # Check if modal closed
-                        still_visible = await page.query_selector('button#strike-conf-continue-btn')
-                        if not still_visible or not await still_visible.is_visible():
+                        # Check if modal closed - resolves the moment it goes away
+                        if await wait_for_state(page, 'button#strike-conf-continue-btn', 500, state='hidden'):
                             click_succeeded = True
                             print(f"    ✅ Method 1: JavaScript click succeeded")
                     except Exception as e:
@@ -3078,13 +4034,10 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                 # Method 2: Direct Playwright click
                 if not click_succeeded:
                     try:
-                        # Re-query button in case DOM changed
-                        continue_btn = await page.query_selector('button#strike-conf-continue-btn')
-                        if continue_btn and await continue_btn.is_visible():
+                        continue_btn = cached_locator('button#strike-conf-continue-btn')
+                        if await continue_btn.is_visible():
                             await continue_btn.click(timeout=3000, force=True)
-                            await page.wait_for_timeout(500)
-                            still_visible = await page.query_selector('button#strike-conf-continue-btn')
-                            if not still_visible or not await still_visible.is_visible():
+                            if await wait_for_state(page, 'button#strike-conf-continue-btn', 500, state='hidden'):
                                 click_succeeded = True
                                 print(f"    ✅ Method 2: Direct click succeeded")
                     except Exception as e:
@@ -3093,16 +4046,14 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                 # Method 3: Mouse click at coordinates
                 if not click_succeeded:
                     try:
-                        continue_btn = await page.query_selector('button#strike-conf-continue-btn')
-                        if continue_btn and await continue_btn.is_visible():
-                            box = await continue_btn.bounding_box()
+                        continue_btn = cached_locator('button#strike-conf-continue-btn')
+                        if await continue_btn.is_visible():
+                            box = await continue_btn.bounding_box(timeout=3000)
                             if box:
                                 x = box['x'] + box['width'] / 2
                                 y = box['y'] + box['height'] / 2
                                 await page.mouse.click(x, y)
-                                await page.wait_for_timeout(500)
-                                still_visible = await page.query_selector('button#strike-conf-continue-btn')
-                                if not still_visible or not await still_visible.is_visible():
+                                if await wait_for_state(page, 'button#strike-conf-continue-btn', 500, state='hidden'):
                                     click_succeeded = True
                                     print(f"    ✅ Method 3: Mouse click succeeded")
                     except Exception as e:
@@ -3111,12 +4062,10 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                 # Method 4: Dispatch click event
                 if not click_succeeded:
                     try:
-                        continue_btn = await page.query_selector('button#strike-conf-continue-btn')
-                        if continue_btn and await continue_btn.is_visible():
-                            await continue_btn.dispatch_event('click')
-                            await page.wait_for_timeout(500)
-                            still_visible = await page.query_selector('button#strike-conf-continue-btn')
-                            if not still_visible or not await still_visible.is_visible():
+                        continue_btn = cached_locator('button#strike-conf-continue-btn')
+                        if await continue_btn.is_visible():
+                            await continue_btn.dispatch_event('click', timeout=3000)
+                            if await wait_for_state(page, 'button#strike-conf-continue-btn', 500, state='hidden'):
                                 click_succeeded = True
                                 print(f"    ✅ Method 4: Dispatch click succeeded")
                     except Exception as e:
@@ -3125,14 +4074,12 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                 # Method 5: Press Enter while focused
                 if not click_succeeded:
                     try:
-                        continue_btn = await page.query_selector('button#strike-conf-continue-btn')
-                        if continue_btn and await continue_btn.is_visible():
-                            await continue_btn.focus()
+                        continue_btn = cached_locator('button#strike-conf-continue-btn')
+                        if await continue_btn.is_visible():
+                            await continue_btn.focus(timeout=3000)
                             await page.wait_for_timeout(200)
                             await page.keyboard.press('Enter')
-                            await page.wait_for_timeout(500)
-                            still_visible = await page.query_selector('button#strike-conf-continue-btn')
-                            if not still_visible or not await still_visible.is_visible():
+                            if await wait_for_state(page, 'button#strike-conf-continue-btn', 500, state='hidden'):
                                 click_succeeded = True
                                 print(f"    ✅ Method 5: Enter key succeeded")
                     except Exception as e:
@@ -3143,9 +4090,7 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                     try:
                         print(f"    ⚠️ Trying Escape key to close modal...")
                         await page.keyboard.press('Escape')
-                        await page.wait_for_timeout(500)
-                        still_visible = await page.query_selector('button#strike-conf-continue-btn')
-                        if not still_visible or not await still_visible.is_visible():
+                        if await wait_for_state(page, 'button#strike-conf-continue-btn', 500, state='hidden'):
                             click_succeeded = True
                             print(f"    ✅ Method 6: Escape key closed modal")
                     except Exception as e:
@@ -3185,51 +4130,48 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
                     # Try multiple methods to close the modal
                     modal_closed = False
                     
-                    # Method 1: Try clicking Continue betting button with multiple approaches
-                    close_selectors = [
-                        'button#strike-conf-continue-btn',  # Continue betting button
-                        'svg#modal-close-btn',  # Specific modal close button
-                        'button[aria-label="Close"]',  # Exact match close button
-                    ]
-                    for close_sel in close_selectors:
+                    # Method 1: Try clicking Continue betting / close button with multiple approaches.
+                    # One 2s wait on the union gates the lookup (instead of a 2s wait per selector);
+                    # buttons are then tried in priority order, moving on when one is rejected or fails.
+                    close_candidates = []
+                    if await wait_for_state(page, _CONFIRMATION_CLOSE_UNION, 2000):
+                        handles = await asyncio.gather(
+                            *(page.query_selector(sel) for sel in _CONFIRMATION_CLOSE_VISIBLE), return_exceptions=True)
+                        close_candidates = [(sel, h) for sel, h in zip(_CONFIRMATION_CLOSE_SELECTORS, handles)
+                                            if h and not isinstance(h, BaseException)]
+                    
+                    for close_sel, close_btn in close_candidates:
                         if modal_closed:
                             break
+                        # Verify it's not an account-related button
                         try:
-                            close_btn = await page.wait_for_selector(close_sel, timeout=2000, state='visible')
-                            if close_btn:
-                                # Verify it's not an account-related button
-                                try:
-                                    btn_text = await close_btn.inner_text()
-                                    if 'deposit' in btn_text.lower() or 'account' in btn_text.lower():
-                                        continue
-                                except:
-                                    pass
-                                
-                                # Try multiple click methods
-                                for click_method in ['js', 'direct', 'mouse', 'dispatch']:
-                                    try:
-                                        if click_method == 'js':
-                                            await close_btn.evaluate('el => el.click()')
-                                        elif click_method == 'direct':
-                                            await close_btn.click(force=True)
-                                        elif click_method == 'mouse':
-                                            box = await close_btn.bounding_box()
-                                            if box:
-                                                await page.mouse.click(box['x'] + box['width']/2, box['y'] + box['height']/2)
-                                        elif click_method == 'dispatch':
-                                            await close_btn.dispatch_event('click')
-                                        
-                                        await page.wait_for_timeout(500)
-                                        # Check if modal closed
-                                        check = await page.query_selector('span:has-text("Bet Confirmation")')
-                                        if not check or not await check.is_visible():
-                                            modal_closed = True
-                                            print(f"    ✅ Modal closed using {close_sel} ({click_method})")
-                                            break
-                                    except:
-                                        continue
+                            btn_text = (await close_btn.inner_text()).lower()
+                            if 'deposit' in btn_text or 'account' in btn_text:
+                                continue
                         except:
-                            continue
+                            pass
+                        
+                        # Try multiple click methods
+                        for click_method in ['js', 'direct', 'mouse', 'dispatch']:
+                            try:
+                                if click_method == 'js':
+                                    await close_btn.evaluate('el => el.click()')
+                                elif click_method == 'direct':
+                                    await close_btn.click(force=True)
+                                elif click_method == 'mouse':
+                                    box = await close_btn.bounding_box()
+                                    if box:
+                                        await page.mouse.click(box['x'] + box['width']/2, box['y'] + box['height']/2)
+                                elif click_method == 'dispatch':
+                                    await close_btn.dispatch_event('click')
+                                
+                                # Check if modal closed
+                                if await wait_for_state(page, 'span:has-text("Bet Confirmation")', 500, state='hidden'):
+                                    modal_closed = True
+                                    print(f"    ✅ Modal closed using {close_sel} ({click_method})")
+                                    break
+                            except:
+                                continue
                     
                     # Method 2: Try Escape key
                     if not modal_closed:
@@ -3275,12 +4217,29 @@ async def place_bet_slip(page: Page, bet_slip: dict, amount: float, match_cache:
         print(f"  Error placing bet slip: {e}")
         return False
 
-async def wait_between_bets(page, seconds=5, add_random=True):
+async def wait_between_bets(page, seconds=5, add_random=True, concurrent_coro=None):
     """Wait for specified seconds between bets with optional randomization
     
     Handles page/browser closures gracefully by catching CancelledError.
     All interruptions and timeouts are logged to the error tracker.
+    
+    concurrent_coro (e.g. a page refresh) runs alongside the wait instead of before it,
+    so its network time is absorbed by the delay rather than added to it.
     """
+    if concurrent_coro is not None:
+        wait_result, concurrent_result = await asyncio.gather(
+            wait_between_bets(page, seconds, add_random), concurrent_coro, return_exceptions=True
+        )
+        if isinstance(concurrent_result, Exception):
+            print(f"  [WARNING] Navigation during wait failed: {concurrent_result}")
+            error_tracker.add_error(
+                error_type='EXCEPTION',
+                error_message=f'Navigation overlapped with the wait between bets failed: {str(concurrent_result)[:150]}',
+                context={'recovery_action': 'continuing_anyway'},
+                exception=concurrent_result
+            )
+        return wait_result is True
+    
     base_seconds = seconds
     
     if add_random:
@@ -3291,94 +4250,78 @@ async def wait_between_bets(page, seconds=5, add_random=True):
         total_seconds = base_seconds
         print(f"\n[WAITING] {seconds} seconds before next bet...")
     
-    chunk_size = 10
-    chunks = total_seconds // chunk_size
+    # Page check up front - a corrupted page object can't register the close listener either
+    try:
+        if page.is_closed():
+            print("[ERROR] Page was closed during wait!")
+            error_tracker.add_error(
+                error_type='BROWSER_RESTART',
+                error_message='Wait interrupted - page was closed during wait period (may require browser restart)',
+                context={
+                    'elapsed_seconds': 0,
+                    'total_seconds': total_seconds,
+                    'recovery_action': 'Browser will be restarted on next bet attempt'
+                }
+            )
+            return False
+    except Exception as page_check_error:
+        # Page object itself may be corrupted
+        error_tracker.add_error(
+            error_type='MEMORY_ERROR',
+            error_message=f'Page object corrupted during wait: {str(page_check_error)[:100]}',
+            context={'elapsed_seconds': 0, 'total_seconds': total_seconds},
+            exception=page_check_error
+        )
+        return False
+    
+    # One sleep that wakes early only if the page closes, instead of waking every 10s to poll
+    close_event = asyncio.Event()
+    def on_close(*_):
+        close_event.set()
+    page.on('close', on_close)
+    
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    progress = {}
+    
+    def report_progress():
+        elapsed = int(loop.time() - started)
+        print(f"  [{elapsed}s elapsed, {total_seconds - elapsed}s remaining]")
+        progress['handle'] = loop.call_later(60, report_progress)
+    
+    progress['handle'] = loop.call_later(60, report_progress)
     
     try:
-        for i in range(chunks):
-            # Check if page is still valid before sleeping
-            try:
-                if page.is_closed():
-                    print("[ERROR] Page was closed during wait!")
-                    error_tracker.add_error(
-                        error_type='BROWSER_RESTART',
-                        error_message='Wait interrupted - page was closed during wait period (may require browser restart)',
-                        context={
-                            'elapsed_seconds': (i) * chunk_size,
-                            'total_seconds': total_seconds,
-                            'recovery_action': 'Browser will be restarted on next bet attempt'
-                        }
-                    )
-                    return False
-            except Exception as page_check_error:
-                # Page object itself may be corrupted
-                error_tracker.add_error(
-                    error_type='MEMORY_ERROR',
-                    error_message=f'Page object corrupted during wait: {str(page_check_error)[:100]}',
-                    context={'elapsed_seconds': (i) * chunk_size, 'total_seconds': total_seconds},
-                    exception=page_check_error
-                )
-                return False
-            
-            try:
-                await asyncio.sleep(chunk_size)
-            except asyncio.CancelledError:
-                print(f"\n[WARNING] Wait interrupted at {(i + 1) * chunk_size}s - page/browser may have been closed")
-                error_tracker.add_error(
-                    error_type='CANCELLED',
-                    error_message=f'Wait interrupted (CancelledError) at {(i + 1) * chunk_size}s - page/browser may have been closed',
-                    context={
-                        'elapsed_seconds': (i + 1) * chunk_size,
-                        'total_seconds': total_seconds,
-                        'recovery_action': 'Script will attempt to continue or restart'
-                    }
-                )
-                return False
-            except asyncio.TimeoutError as timeout_err:
-                print(f"\n[ERROR] Timeout during wait at {(i + 1) * chunk_size}s")
-                error_tracker.add_error(
-                    error_type='TIMEOUT',
-                    error_message=f'Timeout during wait operation at {(i + 1) * chunk_size}s',
-                    context={'elapsed_seconds': (i + 1) * chunk_size, 'total_seconds': total_seconds},
-                    exception=timeout_err
-                )
-                return False
-            
-            elapsed = (i + 1) * chunk_size
-            remaining = total_seconds - elapsed
-            if i % 6 == 0:
-                print(f"  [{elapsed}s elapsed, {remaining}s remaining]")
-        
-        remainder = total_seconds % chunk_size
-        if remainder > 0:
-            try:
-                await asyncio.sleep(remainder)
-            except asyncio.CancelledError:
-                print(f"\n[WARNING] Wait interrupted during final {remainder}s - page/browser may have been closed")
-                error_tracker.add_error(
-                    error_type='CANCELLED',
-                    error_message=f'Wait interrupted (CancelledError) during final {remainder}s - page/browser may have been closed',
-                    context={'elapsed_seconds': total_seconds - remainder, 'total_seconds': total_seconds}
-                )
-                return False
-            except asyncio.TimeoutError as timeout_err:
-                error_tracker.add_error(
-                    error_type='TIMEOUT',
-                    error_message=f'Timeout during final wait period',
-                    context={'elapsed_seconds': total_seconds - remainder, 'total_seconds': total_seconds},
-                    exception=timeout_err
-                )
-                return False
+        try:
+            await asyncio.wait_for(close_event.wait(), timeout=total_seconds)
+        except asyncio.TimeoutError:
+            print("[OK] Wait complete!\n")
+            return True
         
-        print("[OK] Wait complete!\n")
-        return True
+        elapsed = int(loop.time() - started)
+        print("[ERROR] Page was closed during wait!")
+        error_tracker.add_error(
+            error_type='BROWSER_RESTART',
+            error_message='Wait interrupted - page was closed during wait period (may require browser restart)',
+            context={
+                'elapsed_seconds': elapsed,
+                'total_seconds': total_seconds,
+                'recovery_action': 'Browser will be restarted on next bet attempt'
+            }
+        )
+        return False
         
     except asyncio.CancelledError:
-        print("\n[ERROR] Wait operation cancelled - likely due to browser/page closure")
+        elapsed = int(loop.time() - started)
+        print(f"\n[WARNING] Wait interrupted at {elapsed}s - page/browser may have been closed")
         error_tracker.add_error(
             error_type='CANCELLED',
-            error_message='Wait operation cancelled - likely due to browser/page closure',
-            context={'total_seconds': total_seconds, 'recovery_action': 'Auto-retry wrapper will restart script'}
+            error_message=f'Wait interrupted (CancelledError) at {elapsed}s - page/browser may have been closed',
+            context={
+                'elapsed_seconds': elapsed,
+                'total_seconds': total_seconds,
+                'recovery_action': 'Script will attempt to continue or restart'
+            }
         )
         return False
     except Exception as unexpected_error:
@@ -3390,6 +4333,12 @@ async def wait_between_bets(page, seconds=5, add_random=True):
             exception=unexpected_error
         )
         return False
+    finally:
+        progress['handle'].cancel()
+        try:
+            page.remove_listener('close', on_close)
+        except Exception:
+            pass
 
 async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
     """Main async function to run the Betway automation
@@ -3404,7 +4353,7 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
     script_start_time = time.time()
     cumulative_runtime_seconds = 0.0  # Track total runtime across crashes/restarts
     
-    async with async_playwright() as p:
+    async with buffered_stdout(), async_playwright() as p:
         print("Starting Betway Automation...")
         print("="*60)
         
@@ -3525,45 +4474,49 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
         
         if os.path.exists(progress_file):
             try:
-                with open(progress_file, 'r') as f:
-                    resume_data = json.load(f)
-                    print(f"\n{'='*60}")
-                    print(f"📋 FOUND EXISTING PROGRESS FILE")
-                    print(f"{'='*60}")
-                    print(f"Last completed bet: {resume_data.get('last_completed_bet', 0)}")
-                    print(f"Successful: {resume_data.get('successful', 0)} | Failed: {resume_data.get('failed', 0)}")
-                    
-                    # Load cumulative runtime from previous sessions
-                    cumulative_runtime_seconds = resume_data.get('cumulative_runtime_seconds', 0.0)
-                    if cumulative_runtime_seconds > 0:
-                        prev_mins = int(cumulative_runtime_seconds // 60)
-                        prev_secs = int(cumulative_runtime_seconds % 60)
-                        print(f"Previous runtime: {prev_mins}m {prev_secs}s")
-                    
-                    # Check if we have saved match data
-                    if 'matches_data' in resume_data:
-                        saved_timestamp = resume_data.get('timestamp', '')
-                        if saved_timestamp:
-                            try:
-                                saved_time = datetime.fromisoformat(saved_timestamp)
-                                time_since_save = datetime.now() - saved_time
-                                hours_since_save = time_since_save.total_seconds() / 3600
-                                minutes_since_save = time_since_save.total_seconds() / 60
-                                
-                                if hours_since_save > 2:
-                                    print(f"⚠️ Progress is {hours_since_save:.1f} hours old - will re-scrape")
-                                elif hours_since_save > 1:
-                                    print(f"⚠️ Progress is {minutes_since_save:.0f} minutes old - will validate matches")
-                                    saved_matches = resume_data.get('matches_data', [])
-                                    skip_scraping = True  # Try to use saved matches, validate later
-                                else:
-                                    print(f"✅ Progress is {minutes_since_save:.0f} minutes old - will reuse saved matches")
-                                    saved_matches = resume_data.get('matches_data', [])
-                                    skip_scraping = True
-                            except Exception as e:
-                                print(f"⚠️ Could not parse timestamp: {e}")
-                    
-                    print(f"{'='*60}\n")
+                resume_data = load_progress(progress_file)
+                print(f"\n{'='*60}")
+                print(f"📋 FOUND EXISTING PROGRESS FILE")
+                print(f"{'='*60}")
+                print(f"Last completed bet: {resume_data.get('last_completed_bet', 0)}")
+                print(f"Successful: {resume_data.get('successful', 0)}")
+                
+                # Load cumulative runtime from previous sessions
+                cumulative_runtime_seconds = resume_data.get('cumulative_runtime_seconds', 0.0)
+                if cumulative_runtime_seconds > 0:
+                    prev_mins = int(cumulative_runtime_seconds // 60)
+                    prev_secs = int(cumulative_runtime_seconds % 60)
+                    print(f"Previous runtime: {prev_mins}m {prev_secs}s")
+                
+                # Check if we have saved match data
+                if 'matches_data' in resume_data:
+                    saved_timestamp = resume_data.get('timestamp', '')
+                    if saved_timestamp:
+                        try:
+                            saved_time = datetime.fromisoformat(saved_timestamp)
+                            time_since_save = datetime.now() - saved_time
+                            hours_since_save = time_since_save.total_seconds() / 3600
+                            minutes_since_save = time_since_save.total_seconds() / 60
+                            
+                            if hours_since_save > 2:
+                                print(f"⚠️ Progress is {hours_since_save:.1f} hours old - will re-scrape")
+                            elif hours_since_save > 1:
+                                print(f"⚠️ Progress is {minutes_since_save:.0f} minutes old - will validate matches")
+                                saved_matches = resume_data.get('matches_data', [])
+                                skip_scraping = True  # Try to use saved matches, validate later
+                            else:
+                                print(f"✅ Progress is {minutes_since_save:.0f} minutes old - will reuse saved matches")
+                                saved_matches = resume_data.get('matches_data', [])
+                                skip_scraping = True
+                        except Exception as e:
+                            print(f"⚠️ Could not parse timestamp: {e}")
+                
+                print(f"{'='*60}\n")
+            except ProgressLogError as e:
+                # Starting fresh here would re-place bets that were already paid for
+                print(f"\n❌ [FATAL] {e}")
+                print(f"[ACTION] Inspect {progress_file}.log, or delete {progress_file} and its .log to start over")
+                sys.exit(EXIT_PROGRESS_UNREADABLE)
             except Exception as e:
                 print(f"\n⚠️ [WARNING] Could not read progress file: {e}")
                 print(f"[ACTION] Starting fresh...\n")
@@ -3687,35 +4640,7 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
         # Define parse_match_time function early (needed for both resume and fresh scraping)
         def parse_match_time(match):
             """Parse match start time and return minutes from midnight"""
-            start_time_text = match.get('start_time', '')
-            
-            # Future dates - add day offset
-            if re.search(r'\d{1,2}\s+\w{3}', start_time_text):
-                time_match = re.search(r'(\d{1,2}):(\d{2})', start_time_text)
-                if time_match:
-                    hour = int(time_match.group(1))
-                    minute = int(time_match.group(2))
-                    return 1440 + (hour * 60) + minute
-                return None
-            
-            # Tomorrow matches
-            if 'Tomorrow' in start_time_text:
-                time_match = re.search(r'(\d{1,2}):(\d{2})', start_time_text)
-                if time_match:
-                    hour = int(time_match.group(1))
-                    minute = int(time_match.group(2))
-                    return 1440 + (hour * 60) + minute
-                return None
-            
-            # Today matches
-            if 'Today' in start_time_text:
-                time_match = re.search(r'(\d{1,2}):(\d{2})', start_time_text)
-                if time_match:
-                    hour = int(time_match.group(1))
-                    minute = int(time_match.group(2))
-                    return (hour * 60) + minute
-            
-            return None
+            return parse_start_minutes(match.get('start_time', ''))
         
         # Define min_gap_minutes early (needed for both resume and fresh scraping)
         min_gap_minutes = int(min_gap_hours * 60)
@@ -3731,14 +4656,13 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
             
             # Validate saved matches are still valid (not started yet)
             now = datetime.now()
-            current_minutes = now.hour * 60 + now.minute
+            start_cutoff = now.hour * 60 + now.minute + 30  # Must start after now + 30 min buffer
             valid_matches = []
             
             for match in saved_matches:
-                match_time = parse_match_time(match)
-                if match_time is not None:
+                if (match_time := parse_match_time(match)) is not None:
                     # Check if match hasn't started yet (with 30 min buffer)
-                    if match_time > current_minutes + 30:
+                    if match_time > start_cutoff:
                         # CRITICAL: Re-validate odds against new profit guarantee threshold
                         odds = match.get('odds', [])
                         if len(odds) >= 3:
@@ -3801,8 +4725,150 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
             min_gap_minutes = int(min_gap_hours * 60)
             max_pages_per_source = 20
             
-            # Track all processed match names across all sources
-            all_processed_match_names = set()
+            # Track all processed (team1, team2) pairs across all sources
+            all_processed_match_keys = set()
+            
+            # Last Next-button selector that worked (same paginator across pages and sources)
+            next_selector_cache = None
+            
+            # Per-page skip summary lines, in display order
+            skip_reason_labels = (
+                ('no_teams', "Missing team names"),
+                ('no_time', "No start time found"),
+                ('live', "Live matches (excluded)"),
+                ('too_soon', f"Starts too soon (<{min_time_before_match} hours)"),
+                ('no_odds', "No odds available"),
+                ('wrong_odds_count', "Not 1X2 market (odds ≠ 3)"),
+                ('low_odds', f"Low odds (max odd < {min_odds_threshold:.2f})"),
+                ('no_url', "Could not extract URL"),
+                ('no_gap', f"Too close to other selected matches (<{min_gap_hours}h gap)"),
+                ('duplicate', "Duplicate (already seen)"),
+            )
+
+            # Kick-off minutes of every selected match, kept sorted so the gap check only has
+            # to compare against the two neighbours of a candidate instead of every pick
+            selected_times_sorted = []
+            
+            def has_min_gap(minutes):
+                idx = bisect.bisect_left(selected_times_sorted, minutes)
+                if idx > 0 and minutes - selected_times_sorted[idx - 1] < min_gap_minutes:
+                    return False
+                if idx < len(selected_times_sorted) and selected_times_sorted[idx] - minutes < min_gap_minutes:
+                    return False
+                return True
+            
+            min_minutes_before_match = int(min_time_before_match * 60)
+            
+            def extract_match(row, source_name, skips, now_minutes):
+                """
+                Turn one scraped container row into a match dict, or return None and count the
+                skip reason in `skips`. Pure Python over the evaluate() snapshot - no DOM calls.
+                """
+                # Extract team names first to check if already processed
+                if len(row['teams']) < 2:
+                    skips['no_teams'] += 1
+                    return None
+                
+                team1, team2 = row['teams'][0], row['teams'][1]
+                match_key = (team1, team2)
+                
+                # Skip if already processed this match (across ALL sources)
+                if match_key in all_processed_match_keys:
+                    skips['duplicate'] += 1
+                    return None
+                
+                # Mark as processed globally
+                all_processed_match_keys.add(match_key)
+                match_name = f"{team1} vs {team2}"  # Only needed for logging/saving
+                
+                # Start time (first span that looks like "Today 15:00" / "12 Jan - 15:00")
+                start_time_text = row['startTime']
+                
+                if not start_time_text:
+                    skips['no_time'] += 1
+                    return None
+                
+                kind = classify_start_time(start_time_text)
+                
+                # Skip live matches
+                if kind == 'live':
+                    skips['live'] += 1
+                    return None
+                
+                # Check if match meets basic time requirement (min_time_before_match hours or future date)
+                # Future dates and tomorrow's matches always qualify
+                is_valid_time = kind == 'date' or kind == 'tomorrow'
+                
+                # For today's matches, check if they meet minimum time requirement
+                if kind == 'today':
+                    time_match = _HHMM_RE.search(start_time_text)
+                    if time_match:
+                        time_until_match = int(time_match.group(1)) * 60 + int(time_match.group(2)) - now_minutes
+                        if time_until_match >= min_minutes_before_match:
+                            is_valid_time = True
+                
+                if not is_valid_time:
+                    skips['too_soon'] += 1
+                    return None
+                
+                # Extract odds
+                odds = []
+                if row['odds']:
+                    for odd_text in row['odds']:
+                        if odd_text and _ODD_TEXT_RE.match(odd_text):
+                            odds.append(float(odd_text.replace(',', '.')))
+                else:
+                    skips['no_odds'] += 1
+                
+                # CRITICAL: Only accept matches with exactly 3 odds (1X2 market)
+                if len(odds) != 3:
+                    skips['wrong_odds_count'] += 1
+                    return None
+                
+                # BASELINE FILTER: All odds must be > 2.0 (quality threshold)
+                min_odd = min(odds)
+                if min_odd <= 2.0:
+                    skips['low_odds'] += 1
+                    # Debug output to see what's being rejected (formatted only at DEBUG level)
+                    log.debug("    ⚠️ REJECTED: %s - min odd %.2f ≤ 2.0 [%.2f, %.2f, %.2f]", match_name, min_odd, *odds)
+                    return None
+                
+                # PROFIT GUARANTEE FILTER: Max odd must meet threshold to ensure doubling
+                # This ensures the best possible combination will at least double total cost
+                max_odd = max(odds)
+                if max_odd < min_odds_threshold:
+                    skips['low_odds'] += 1
+                    # Debug output to see what's being rejected (formatted only at DEBUG level)
+                    log.debug("    ⚠️ REJECTED: %s - max odd %.2f < %.2f [%.2f, %.2f, %.2f]",
+                              match_name, max_odd, min_odds_threshold, *odds)
+                    return None
+                
+                # Try to capture URL for this match
+                match_url = None
+                relative_url = row['href']
+                if relative_url:
+                    if relative_url.startswith('/'):
+                        match_url = f"https://new.betway.co.za{relative_url}"
+                    else:
+                        match_url = relative_url
+                
+                if not match_url:
+                    skips['no_url'] += 1
+                    return None
+                
+                # Debug: Show that match passed both filters
+                log.debug("    ✅ PASSED: %s - all odds > 2.0, max %.2f ≥ %.2f [%.2f, %.2f, %.2f]",
+                          match_name, max_odd, min_odds_threshold, *odds)
+                
+                return {
+                    'name': match_name,
+                    'team1': team1,
+                    'team2': team2,
+                    'odds': odds[:3],
+                    'start_time': start_time_text,
+                    'url': match_url,
+                    'source': source_name
+                }
             
             # Iterate through scraping sources: highlights first, then upcoming
             for source_index, source in enumerate(SCRAPING_URLS):
@@ -3837,7 +4903,12 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
                 except Exception as nav_error:
                     print(f"  ⚠️ Failed to navigate to {source_name}: {nav_error}")
                     continue  # Try next source
-                
+
+                # Pages within a source are paginated client-side, so the next source URL is the
+                # only thing that can be fetched ahead - warm the cache while this one is parsed
+                if source_index + 1 < len(SCRAPING_URLS):
+                    await prefetch_url(page, SCRAPING_URLS[source_index + 1]['url'])
+
                 current_page = 0
                 
                 # For highlights page: collect ALL candidate matches first, then sort by time
@@ -3865,236 +4936,63 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
                         await page.evaluate('window.scrollBy(0, 500)')
                         await page.wait_for_timeout(200)
                     
-                    match_containers = await page.query_selector_all('div[data-v-206d232b].relative.grid.grid-cols-12')
-                    print(f"  Found {len(match_containers)} match containers on page {current_page}")
+                    # Every container's teams/time/odds/link in one evaluate (no per-element round-trips)
+                    match_rows = await page.evaluate(_MATCH_ROWS_JS, _MATCH_CONTAINER_SELECTOR)
+                    print(f"  Found {len(match_rows)} match containers on page {current_page}")
                     
-                    # Debug counters (reset per page)
-                    debug_no_teams = 0
-                    debug_no_time = 0
-                    debug_live = 0
-                    debug_too_soon = 0
-                    debug_no_odds = 0
-                    debug_wrong_odds_count = 0
-                    debug_low_odds = 0
-                    debug_no_gap = 0
-                    debug_duplicate = 0
-                    debug_no_url = 0
+                    # Skip-reason counters and the clock snapshot (both per page)
+                    skips = Counter()
+                    page_now = datetime.now()
+                    now_minutes = page_now.hour * 60 + page_now.minute
                     matches_added_this_page = 0
                     
                     # Process each match container
-                    for i, container in enumerate(match_containers):
+                    for row in match_rows:
                         # For non-highlights pages, check if we have enough matches
                         if not is_highlights_page and len(filtered_matches) >= num_matches:
                             print(f"\n✅ Found {num_matches} matches - stopping scraping early")
                             break
                         
-                        try:
-                            # Extract team names first to check if already processed
-                            team_elements = await container.query_selector_all('strong.overflow-hidden.text-ellipsis')
-                            if len(team_elements) < 2:
-                                debug_no_teams += 1
-                                continue
-                            
-                            team1 = await team_elements[0].inner_text()
-                            team2 = await team_elements[1].inner_text()
-                            match_name = f"{team1} vs {team2}"
-                            
-                            # Skip if already processed this match (across ALL sources)
-                            if match_name in all_processed_match_names:
-                                debug_duplicate += 1
-                                continue
-                            
-                            # Mark as processed globally
-                            all_processed_match_names.add(match_name)
-                            
-                            # Extract start time
-                            start_time_text = None
-                            all_spans = await container.query_selector_all('span')
-                            for span in all_spans:
-                                try:
-                                    span_text = await span.inner_text()
-                                    if span_text and (
-                                        re.match(r'(Today|Tomorrow|Mon|Tue|Wed|Thu|Fri|Sat|Sun).*\d{1,2}:\d{2}', span_text) or
-                                        re.match(r'\d{1,2}\s+\w{3}\s*-?\s*\d{1,2}:\d{2}', span_text)
-                                    ):
-                                        start_time_text = span_text
-                                        break
-                                except:
-                                    continue
-                            
-                            if not start_time_text:
-                                debug_no_time += 1
+                        match = extract_match(row, source_name, skips, now_minutes)
+                        if match is None:
+                            continue
+                        
+                        # For highlights page: add to candidates (will sort later)
+                        # For upcoming page: apply gap filter immediately
+                        if is_highlights_page:
+                            candidate_matches.append(match)
+                            matches_added_this_page += 1
+                        else:
+                            # Check time gap for non-highlights pages
+                            current_time = parse_match_time(match)
+                            if current_time is None:
                                 continue
                             
-                            # Skip live matches
-                            if 'Live' in start_time_text or 'live' in start_time_text.lower():
-                                debug_live += 1
+                            if not has_min_gap(current_time):
+                                skips['no_gap'] += 1
                                 continue
                             
-                            # Check if match meets basic time requirement (min_time_before_match hours or future date)
-                            is_valid_time = False
+                            filtered_matches.append(match)
+                            bisect.insort(selected_times_sorted, current_time)
+                            matches_added_this_page += 1
+                            print(f"  ✓ Match {len(filtered_matches)}/{num_matches}: '{match['name']}' ({match['start_time']}) [from {source_name}]")
                             
-                            # Accept future dates
-                            if re.search(r'\d{1,2}\s+\w{3}', start_time_text):
-                                is_valid_time = True
-                            # Accept tomorrow matches
-                            elif 'Tomorrow' in start_time_text:
-                                is_valid_time = True
-                            # For today's matches, check if they meet minimum time requirement
-                            elif 'Today' in start_time_text:
-                                time_match = re.search(r'(\d{1,2}):(\d{2})', start_time_text)
-                                if time_match:
-                                    start_hour = int(time_match.group(1))
-                                    start_minute = int(time_match.group(2))
-                                    time_until_match = (start_hour - now.hour) * 60 + (start_minute - now.minute)
-                                    
-                                    min_minutes = int(min_time_before_match * 60)
-                                    if time_until_match >= min_minutes:
-                                        is_valid_time = True
-                            
-                            if not is_valid_time:
-                                debug_too_soon += 1
-                                continue
-                            
-                            # Extract odds
-                            odds = []
-                            try:
-                                price_divs = await container.query_selector_all('div[price]')
-                                if len(price_divs) >= 3:
-                                    for j in range(3):
-                                        btn = price_divs[j]
-                                        try:
-                                            odd_elem = await btn.query_selector('span')
-                                            if odd_elem:
-                                                odd_text = await odd_elem.inner_text()
-                                                if odd_text and odd_text.replace('.', '').replace(',', '').isdigit():
-                                                    odds.append(float(odd_text.replace(',', '.')))
-                                        except:
-                                            continue
-                                else:
-                                    debug_no_odds += 1
-                            except:
-                                debug_no_odds += 1
-                            
-                            # CRITICAL: Only accept matches with exactly 3 odds (1X2 market)
-                            if len(odds) != 3:
-                                debug_wrong_odds_count += 1
-                                continue
-                            
-                            # BASELINE FILTER: All odds must be > 2.0 (quality threshold)
-                            min_odd = min(odds)
-                            if min_odd <= 2.0:
-                                debug_low_odds += 1
-                                # Debug output to see what's being rejected
-                                odds_str = f"[{odds[0]:.2f}, {odds[1]:.2f}, {odds[2]:.2f}]"
-                                print(f"    ⚠️ REJECTED: {match_name} - min odd {min_odd:.2f} ≤ 2.0 {odds_str}")
-                                continue
-                            
-                            # PROFIT GUARANTEE FILTER: Max odd must meet threshold to ensure doubling
-                            # This ensures the best possible combination will at least double total cost
-                            max_odd = max(odds)
-                            if max_odd < min_odds_threshold:
-                                debug_low_odds += 1
-                                # Debug output to see what's being rejected
-                                odds_str = f"[{odds[0]:.2f}, {odds[1]:.2f}, {odds[2]:.2f}]"
-                                print(f"    ⚠️ REJECTED: {match_name} - max odd {max_odd:.2f} < {min_odds_threshold:.2f} {odds_str}")
-                                continue
-                            
-                            # Try to capture URL for this match
-                            match_url = None
-                            try:
-                                link_element = await container.query_selector('a[href*="/event/soccer/"]')
-                                if link_element:
-                                    relative_url = await link_element.get_attribute('href')
-                                    if relative_url:
-                                        if relative_url.startswith('/'):
-                                            match_url = f"https://new.betway.co.za{relative_url}"
-                                        else:
-                                            match_url = relative_url
-                            except Exception as href_error:
-                                print(f"  ⚠️ Failed to extract href: {href_error}")
-                            
-                            if not match_url:
-                                debug_no_url += 1
-                                continue
-                            
-                            # Create match object
-                            match = {
-                                'name': match_name,
-                                'team1': team1,
-                                'team2': team2,
-                                'odds': odds[:3],
-                                'start_time': start_time_text,
-                                'url': match_url,
-                                'source': source_name
-                            }
-                            
-                            # Debug: Show that match passed both filters
-                            odds_str = f"[{odds[0]:.2f}, {odds[1]:.2f}, {odds[2]:.2f}]"
-                            print(f"    ✅ PASSED: {match_name} - all odds > 2.0, max {max_odd:.2f} ≥ {min_odds_threshold:.2f} {odds_str}")
-                            
-                            # For highlights page: add to candidates (will sort later)
-                            # For upcoming page: apply gap filter immediately
-                            if is_highlights_page:
-                                candidate_matches.append(match)
-                                matches_added_this_page += 1
-                            else:
-                                # Check time gap for non-highlights pages
-                                current_time = parse_match_time(match)
-                                if current_time is None:
-                                    continue
-                                
-                                is_far_enough = True
-                                for selected_match in filtered_matches:
-                                    selected_time = parse_match_time(selected_match)
-                                    if selected_time is not None:
-                                        time_diff = abs(current_time - selected_time)
-                                        if time_diff < min_gap_minutes:
-                                            is_far_enough = False
-                                            break
-                                
-                                if not is_far_enough:
-                                    debug_no_gap += 1
-                                    continue
-                                
-                                filtered_matches.append(match)
-                                matches_added_this_page += 1
-                                print(f"  ✓ Match {len(filtered_matches)}/{num_matches}: '{match_name}' ({start_time_text}) [from {source_name}]")
-                                
-                                if len(filtered_matches) >= num_matches:
-                                    break
-                            
-                        except Exception as e:
-                            continue
+                            if len(filtered_matches) >= num_matches:
+                                break
                     
-                    # Print debug info for this page
-                    print(f"  📊 Page {current_page} summary for [{source_name}]:")
+                    # Print debug info for this page (assembled first, written in one call)
+                    summary = [f"  📊 Page {current_page} summary for [{source_name}]:"]
                     if is_highlights_page:
-                        print(f"    ✓ {matches_added_this_page} candidates added (will sort by time later)")
-                        print(f"    Total candidates so far: {len(candidate_matches)}")
+                        summary.append(f"    ✓ {matches_added_this_page} candidates added (will sort by time later)")
+                        summary.append(f"    Total candidates so far: {len(candidate_matches)}")
                     else:
-                        print(f"    ✓ {matches_added_this_page} matches selected")
-                    
-                    if debug_no_teams > 0:
-                        print(f"    ❌ {debug_no_teams} - Missing team names")
-                    if debug_no_time > 0:
-                        print(f"    ❌ {debug_no_time} - No start time found")
-                    if debug_live > 0:
-                        print(f"    ❌ {debug_live} - Live matches (excluded)")
-                    if debug_too_soon > 0:
-                        print(f"    ❌ {debug_too_soon} - Starts too soon (<{min_time_before_match} hours)")
-                    if debug_no_odds > 0:
-                        print(f"    ❌ {debug_no_odds} - No odds available")
-                    if debug_wrong_odds_count > 0:
-                        print(f"    ❌ {debug_wrong_odds_count} - Not 1X2 market (odds ≠ 3)")
-                    if debug_low_odds > 0:
-                        print(f"    ❌ {debug_low_odds} - Low odds (max odd < {min_odds_threshold:.2f})")
-                    if debug_no_url > 0:
-                        print(f"    ❌ {debug_no_url} - Could not extract URL")
-                    if not is_highlights_page and debug_no_gap > 0:
-                        print(f"    ❌ {debug_no_gap} - Too close to other selected matches (<{min_gap_hours}h gap)")
-                    if debug_duplicate > 0:
-                        print(f"    ❌ {debug_duplicate} - Duplicate (already seen)")
+                        summary.append(f"    ✓ {matches_added_this_page} matches selected")
+                    summary.extend(
+                        f"    ❌ {skips[reason]} - {label}"
+                        for reason, label in skip_reason_labels
+                        if skips[reason] and not (is_highlights_page and reason == 'no_gap')
+                    )
+                    print('\n'.join(summary))
                     
                     # Check if we should continue to next page
                     if not is_highlights_page and len(filtered_matches) >= num_matches:
@@ -4104,22 +5002,23 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
                     if current_page < max_pages_per_source:
                         try:
                             next_button = None
-                            next_selectors = [
-                                'button[aria-label="Go to next page"]',
-                                'button.p-ripple.p-element.p-paginator-next',
-                                'button:has-text("Next")',
-                                'button[class*="next"]'
-                            ]
+                            # The paginator markup is the same on every page, so try last page's
+                            # winning selector first and only walk the full list on a miss
+                            if next_selector_cache:
+                                next_order = (next_selector_cache,) + tuple(sel for sel in _NEXT_PAGE_SELECTORS if sel != next_selector_cache)
+                            else:
+                                next_order = _NEXT_PAGE_SELECTORS
                             
-                            for selector in next_selectors:
+                            for selector in next_order:
                                 try:
                                     btn = await page.query_selector(selector)
                                     if btn:
                                         is_disabled = await btn.get_attribute('disabled')
                                         if not is_disabled:
                                             next_button = btn
+                                            next_selector_cache = selector
                                             break
-                                except:
+                                except PlaywrightError:
                                     continue
                             
                             if next_button:
@@ -4144,7 +5043,7 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
                     
                     # Helper function to get the maximum odd value from a match's odds
                     def get_max_odd(match):
-                        odds = match.get('odds', [])
+                        odds = match['odds']
                         if len(odds) >= 3:
                             return max(odds)  # Return highest odd value
                         return 0  # No odds available
@@ -4156,10 +5055,10 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
                     
                     print(f"  Sorted order (by time, then highest odds):")
                     for idx, cm in enumerate(candidate_matches[:10], 1):  # Show first 10
-                        odds = cm.get('odds', [])
+                        odds = cm['odds']
                         max_odd = max(odds) if len(odds) >= 3 else 0
                         odds_str = f"[1:{odds[0]:.2f} X:{odds[1]:.2f} 2:{odds[2]:.2f}]" if len(odds) >= 3 else "[no odds]"
-                        print(f"    {idx}. {cm['name']} - {cm.get('start_time', 'Unknown')} | Max odd: {max_odd:.2f} {odds_str}")
+                        print(f"    {idx}. {cm['name']} - {cm['start_time']} | Max odd: {max_odd:.2f} {odds_str}")
                     if len(candidate_matches) > 10:
                         print(f"    ... and {len(candidate_matches) - 10} more candidates")
                     
@@ -4174,27 +5073,19 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
                         if current_time is None:
                             continue
                         
-                        is_far_enough = True
-                        for selected_match in filtered_matches:
-                            selected_time = parse_match_time(selected_match)
-                            if selected_time is not None:
-                                time_diff = abs(current_time - selected_time)
-                                if time_diff < min_gap_minutes:
-                                    is_far_enough = False
-                                    break
-                        
-                        if is_far_enough:
+                        if has_min_gap(current_time):
                             filtered_matches.append(match)
-                            print(f"  ✓ Selected {len(filtered_matches)}/{num_matches}: '{match['name']}' ({match.get('start_time', 'Unknown')}) [from {source_name}]")
+                            bisect.insort(selected_times_sorted, current_time)
+                            print(f"  ✓ Selected {len(filtered_matches)}/{num_matches}: '{match['name']}' ({match['start_time']}) [from {source_name}]")
                 
                 # Summary for this source
-                matches_from_source = len([m for m in filtered_matches if m.get('source') == source_name])
+                matches_from_source = len([m for m in filtered_matches if m['source'] == source_name])
                 print(f"\n  📋 [{source_name}] Summary: Found {matches_from_source} matches from this source")
             
             # Count matches by source for final summary
             source_counts = {}
             for m in filtered_matches:
-                src = m.get('source', 'Unknown')
+                src = m['source']
                 source_counts[src] = source_counts.get(src, 0) + 1
             
             print(f"\n{'='*60}")
@@ -4223,7 +5114,7 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
                     if time_minutes is None:
                         time_minutes = 999999  # Put unparseable times at the end
                     
-                    odds = match.get('odds', [])
+                    odds = match['odds']
                     max_odd = max(odds) if len(odds) >= 3 else 0
                     
                     # Return tuple: (time_ascending, odds_descending)
@@ -4235,9 +5126,9 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
                 print(f"✓ Sorted {len(filtered_matches)} matches by time, then highest odds")
                 print("  Top 5 matches after sorting:")
                 for i, m in enumerate(filtered_matches[:5], 1):
-                    start_time = m.get('start_time', 'Unknown')
-                    source = m.get('source', 'Unknown')
-                    odds = m.get('odds', [])
+                    start_time = m['start_time']
+                    source = m['source']
+                    odds = m['odds']
                     max_odd = max(odds) if len(odds) >= 3 else 0
                     odds_str = f"[1:{odds[0]:.2f} X:{odds[1]:.2f} 2:{odds[2]:.2f}]" if len(odds) >= 3 else "[no odds]"
                     print(f"    {i}. {m['name']} - {start_time} | Max odd: {max_odd:.2f} {odds_str} [from {source}]")
@@ -4272,15 +5163,15 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
         print(f"\n{'='*60}")
         print(f"📋 SELECTED MATCHES ({len(matches)} matches)")
         print(f"{'='*60}")
+        selected_lines = []
         for i, m in enumerate(matches, 1):
-            start_time = m.get('start_time', 'Unknown time')
-            source = m.get('source', 'Unknown')
-            odds = m.get('odds', [])
+            odds = m['odds']
             odds_str = f"1:{odds[0]:.2f} X:{odds[1]:.2f} 2:{odds[2]:.2f}" if len(odds) >= 3 else str(odds)
-            print(f"  {i}. {m['name']}")
-            print(f"     ⏰ Start: {start_time}")
-            print(f"     📊 Odds: {odds_str}")
-            print(f"     📌 Source: {source}")
+            selected_lines.append(f"  {i}. {m['name']}")
+            selected_lines.append(f"     ⏰ Start: {m['start_time']}")
+            selected_lines.append(f"     📊 Odds: {odds_str}")
+            selected_lines.append(f"     📌 Source: {m['source']}")
+        print('\n'.join(selected_lines))
         print(f"{'='*60}")
         print(f"All matches are {min_gap_hours}+ hours apart from each other")
         print(f"Matches can be from any of the configured league sources")
@@ -4292,14 +5183,14 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
         print(f"{'='*60}")
         
         missing_urls = []
+        url_lines = []
         for i, match in enumerate(matches, 1):
-            match_url = match.get('url')
-            start_time = match.get('start_time', 'Unknown')
-            if match_url:
-                print(f"  ✓ Match {i}: {match['name']} ({start_time}) - URL cached")
+            if match['url']:
+                url_lines.append(f"  ✓ Match {i}: {match['name']} ({match['start_time']}) - URL cached")
             else:
-                print(f"  ❌ Match {i}: {match['name']} ({start_time}) - NO URL!")
+                url_lines.append(f"  ❌ Match {i}: {match['name']} ({match['start_time']}) - NO URL!")
                 missing_urls.append(match['name'])
+        print('\n'.join(url_lines))
         
         if missing_urls:
             print(f"\n{'='*60}")
@@ -4541,33 +5432,36 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
         print(f"{'='*60}\n")
         
         # Generate all possible combinations (3^num_matches total)
-        bet_slips = generate_bet_combinations(matches, num_matches)
+        total_bets, bet_slips = generate_bet_combinations(matches, num_matches)
         
         print(f"\n{'='*60}")
         print("BET COMBINATION SUMMARY & VALIDATION")
         print(f"{'='*60}")
-        print(f"Total combinations: {len(bet_slips)} (3^{num_matches})")
+        print(f"Total combinations: {total_bets} (3^{num_matches})")
         print(f"✅ All combinations generated successfully")
         
         # VALIDATE: Show first 5 combinations as examples
         print(f"\nFirst 5 combinations (examples):")
-        for i, slip in enumerate(bet_slips[:5], 1):
+        # Peek at the first 5 lazily and chain them back in front of the rest
+        preview_slips = list(islice(bet_slips, 5))
+        bet_slips = chain(preview_slips, bet_slips)
+        for i, slip in enumerate(preview_slips, 1):
             selections_str = ', '.join([f"{m['name'][:20]}→{s}" for m, s in zip(slip['matches'], slip['selections'])])
             print(f"  {i}. {selections_str}")
         
-        if len(bet_slips) > 5:
-            print(f"  ... ({len(bet_slips) - 5} more combinations)")
+        if total_bets > 5:
+            print(f"  ... ({total_bets - 5} more combinations)")
         
-        print(f"\n✅ VALIDATION: All {len(bet_slips)} combinations are valid and ready")
+        print(f"\n✅ VALIDATION: All {total_bets} combinations are valid and ready")
         print(f"{'='*60}\n")
         
         print(f"\n{'='*60}")
         print("🚀 STARTING BET PLACEMENT PHASE")
         print(f"{'='*60}")
-        print(f"Total bets to place: {len(bet_slips)}")
+        print(f"Total bets to place: {total_bets}")
         print(f"Using cached URLs for all {num_matches} matches")
         print(f"Amount per bet: R{amount_per_slip:.2f}")
-        print(f"Total amount: R{len(bet_slips) * amount_per_slip:.2f}")
+        print(f"Total amount: R{total_bets * amount_per_slip:.2f}")
         print(f"{'='*60}\n")
         
         # Process ALL bets with enhanced anti-detection and progress tracking
@@ -4579,21 +5473,25 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
         match_cache = {}
         
         # Initialize outcome button cache to reuse buttons across all bets
-        outcome_button_cache = {}
-        
-        # CHECK: Try to load cached selectors from previous run
-        cached_selectors_loaded = False
-        if resume_data and 'outcome_button_cache' in resume_data:
-            saved_cache = resume_data.get('outcome_button_cache', {})
-            if saved_cache and len(saved_cache) >= num_matches:
-                outcome_button_cache = saved_cache
-                cached_selectors_loaded = True
-                print(f"\n{'='*60}")
-                print("⚡ USING SAVED SELECTOR CACHE (SKIPPING PRE-CACHE)")
-                print(f"{'='*60}")
-                print(f"Loaded {len(outcome_button_cache)} cached selectors from previous run")
-                print(f"No navigation needed - selectors work on any browser instance")
-                print(f"{'='*60}\n")
+        # Seed from the on-disk selector cache so reruns skip probing known match pages
+        outcome_button_cache = load_selector_cache()
+        if outcome_button_cache:
+            print(f"Loaded {len(outcome_button_cache)} selectors from {SELECTOR_CACHE_FILE}")
+        # An in-process retry re-enters here - keep only this run's cache registered
+        atexit.unregister(save_selector_cache)
+        atexit.register(save_selector_cache, outcome_button_cache)
+        
+        # selector_cache.json already covers every selected match - skip the pre-cache navigation
+        cached_selectors_loaded = all(
+            match.get('url') in outcome_button_cache for match in matches[:num_matches]
+        )
+        if cached_selectors_loaded:
+            print(f"\n{'='*60}")
+            print("⚡ USING SAVED SELECTOR CACHE (SKIPPING PRE-CACHE)")
+            print(f"{'='*60}")
+            print(f"All {num_matches} matches have a cached selector in {SELECTOR_CACHE_FILE}")
+            print(f"No navigation needed - selectors work on any browser instance")
+            print(f"{'='*60}\n")
         
         # Only do pre-caching if we don't have a valid saved cache
         if not cached_selectors_loaded:
@@ -4602,105 +5500,30 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
             print("🔄 PRE-CACHING OUTCOME BUTTONS FOR ALL MATCHES")
             print(f"{'='*60}")
             print(f"Navigating to {num_matches} match pages to cache buttons...")
-            print(f"Cache will be PERSISTENT across all {len(bet_slips)} bet combinations")
-            print(f"Cache is saved to progress file - survives crashes!")
+            print(f"Cache will be PERSISTENT across all {total_bets} bet combinations")
+            print(f"Cache is saved to {SELECTOR_CACHE_FILE} - survives crashes!")
             print(f"{'='*60}\n")
             
-            for match_idx, match in enumerate(matches[:num_matches], 1):
-                match_url = match.get('url')
-                start_time = match.get('start_time', 'Unknown time')
-                if match_url and match_url not in outcome_button_cache:
-                    try:
-                        print(f"Match {match_idx}/{num_matches}: {match['name']} | ⏰ {start_time}")
-                        print(f"  Navigating to: {match_url}")
-                        await page.goto(match_url, wait_until='domcontentloaded', timeout=15000)
-                        await page.wait_for_timeout(1500)
-                        await close_all_modals(page)
-                        await page.wait_for_timeout(500)
-                        
-                        # Find working selector for outcome buttons
-                        # Extended list of selectors to handle different league page structures
-                        button_selectors = [
-                            'div.grid.p-1 > div.flex.items-center.justify-between.h-12',
-                            'div[class*="grid"] > div[class*="flex items-center justify-between h-12"]',
-                            'details:has(span:text("1X2")) div.grid > div',
-                            'div[price]',
-                            'button[data-translate-market-name="Full Time Result"] div[price]',
-                            'div[data-translate-market-name="Full Time Result"] div[price]',
-                            # Additional fallback selectors for different league structures
-                            'div[class*="market"] div[price]',
-                            'div[class*="outcome"] div[price]',
-                            'div.flex.items-center.justify-between[price]',
-                            'button[price]',
-                            'div[data-price]',
-                            'span[price]',
-                            # More generic selectors as last resort
-                            'div[class*="selection"]',
-                            'div[class*="bet-button"]',
-                            'div[class*="odds"]',
-                        ]
-                        
-                        working_selector = None
-                        for selector in button_selectors:
-                            try:
-                                buttons = await page.query_selector_all(selector)
-                                if len(buttons) >= 3:
-                                    working_selector = selector
-                                    print(f"  ✓ Found {len(buttons)} outcome buttons using selector: {selector}")
-                                    break
-                            except:
-                                continue
-                        
-                        if working_selector:
-                            # Cache the selector, not the elements
-                            outcome_button_cache[match_url] = working_selector
-                            print(f"  ✓ [CACHED] Selector stored for reuse across all {len(bet_slips)} bets\n")
-                        else:
-                            print(f"  ❌ ERROR: Could not find working selector\n")
-                            error_tracker.add_error(
-                                error_type="BET_FAILED",
-                                error_message=f"Could not find outcome button selector for match: {match['name']}",
-                                context={
-                                    'match_url': match_url,
-                                    'match_name': match['name'],
-                                    'phase': 'pre_caching'
-                                }
-                            )
-                        
-                    except Exception as e:
-                        print(f"  ❌ ERROR caching buttons: {e}\n")
-                        error_tracker.add_error(
-                            error_type="EXCEPTION",
-                            error_message=f"Exception during outcome button caching for match: {match['name']}",
-                            context={
-                                'match_url': match_url,
-                                'match_name': match['name'],
-                                'phase': 'pre_caching'
-                            },
-                            exception=e
-                        )
-        
+            # Also navigates back to the soccer page before bet placement starts
+            _, cached = await recache_outcome_buttons(page, matches, num_matches, outcome_button_cache)
+            
             print(f"{'='*60}")
             print(f"✅ PRE-CACHING COMPLETE")
             print(f"{'='*60}")
-            print(f"Cached outcome buttons for {len(outcome_button_cache)}/{num_matches} matches")
-            print(f"Cache saved to progress file - survives crashes!")
+            print(f"Cached outcome buttons for {cached}/{num_matches} matches")
+            print(f"Cache saved to {SELECTOR_CACHE_FILE} - survives crashes!")
             print(f"{'='*60}\n")
-            
-            # Navigate back to soccer page before starting bet placement
-            await page.goto('https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=15000)
-            await page.wait_for_timeout(1000)
-            await close_all_modals(page)
         
         # Create a match fingerprint to validate matches haven't changed
-        current_match_fingerprint = []
-        for match in matches:
-            fingerprint = f"{match['team1']}|{match['team2']}|{match.get('start_time', 'unknown')}"
-            current_match_fingerprint.append(fingerprint)
+        current_match_fingerprint = tuple((m['team1'], m['team2'], m['start_time']) for m in matches)
         
         # Check if resuming with saved progress
         if resume_data:
-            saved_fingerprint = resume_data.get('match_fingerprint', [])
+            # JSON hands the tuples back as lists; progress files from older runs hold "team1|team2|time" strings
+            saved_fingerprint = tuple(
+                tuple(fp.split('|')) if isinstance(fp, str) else tuple(fp)
+                for fp in resume_data.get('match_fingerprint', ())
+            )
             saved_timestamp = resume_data.get('timestamp', '')
             
             # Check if progress is too old (more than 2 hours)
@@ -4722,14 +5545,14 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
             
             # Validate matches haven't changed
             if is_expired:
-                os.remove(progress_file)
+                clear_progress(progress_file)
                 resume_data = None
             elif saved_fingerprint != current_match_fingerprint:
                 print(f"\n⚠️ [WARNING] Matches have changed since last run!")
                 print(f"[INFO] Saved matches: {saved_fingerprint}")
                 print(f"[INFO] Current matches: {current_match_fingerprint}")
                 print(f"[ACTION] Deleting progress file and starting fresh...\n")
-                os.remove(progress_file)
+                clear_progress(progress_file)
                 resume_data = None  # Clear resume data
             else:
                 start_index = resume_data.get('last_completed_bet', 0)
@@ -4746,1072 +5569,928 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
                         pass
                 
                 print(f"\n✅ [RESUME] Matches validated - same as previous run")
-                print(f"[RESUME] Resuming from bet {start_index + 1}/{len(bet_slips)} (retrying failed bet)")
+                print(f"[RESUME] Resuming from bet {start_index + 1}/{total_bets} (retrying failed bet)")
                 print(f"[PROGRESS] Previously successful: {successful}{time_info}\n")
         
-        for i, bet_slip in enumerate(bet_slips):
-            # Skip already completed bets
-            if i < start_index:
-                continue
-                
-            print(f"\n{'='*60}")
-            print(f"BET {i+1}/{len(bet_slips)}")
-            print(f"{'='*60}")
-            
-            # Check if still logged in before each bet
-            is_logged_in = await check_and_relogin(page, browser)
-            if not is_logged_in:
-                print(f"\n❌ [FATAL] Could not verify/restore login - stopping bet placement")
-                print(f"[INFO] Completed {successful} bets before login failure")
+        # Matches are fixed from here on - write them once, checkpoints only append counters.
+        # A validated resume already has the same match set on disk.
+        if not resume_data:
+            save_progress_snapshot(progress_file, matches, current_match_fingerprint)
+        
+        # Checkpoints go through a one-slot queue drained by a background writer.
+        # Progress only moves forward, so a newer checkpoint replaces one still waiting.
+        checkpoint_queue = asyncio.Queue(maxsize=1)
+        checkpoint_task = asyncio.create_task(checkpoint_writer(checkpoint_queue, progress_file))
+        
+        async def save_checkpoint(next_bet):
+            """Queue a checkpoint that resumes from bet index `next_bet`."""
+            state = {
+                'last_completed_bet': next_bet,
+                'last_successful_bet': next_bet - 1 if next_bet > 0 else -1,
+                'successful': successful,
+                'timestamp': datetime.now().isoformat(),
+                'cumulative_runtime_seconds': cumulative_runtime_seconds + (time.time() - script_start_time)
+            }
+            if checkpoint_queue.full():
+                checkpoint_queue.get_nowait()
+                checkpoint_queue.task_done()
+            await checkpoint_queue.put(state)
+        
+        async def stop_checkpoints():
+            """Wait for the pending checkpoint to hit the disk, then stop the writer (safe to call twice)."""
+            if checkpoint_task.done():
+                return
+            await checkpoint_queue.join()
+            checkpoint_task.cancel()
+        
+        async def open_soccer_page(page):
+            """Land a fresh page on the soccer listing, ready for the next bet."""
+            await page.goto('https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=15000)
+            await wait_for_page_settled(page, 1000)
+            await close_all_modals(page, timeout_seconds=5)
+        
+        async def refresh_page(page, bet_number):
+            """Scheduled page refresh to shed accumulated DOM/JS memory; failures are logged, not raised."""
+            try:
+                print(f"  [MEMORY] Refreshing page after {bet_number} bets...")
+                await page.goto('https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=15000)
+                await page.wait_for_timeout(2000)
+                await close_all_modals(page)
+                gc.collect(generation=0)
+                print(f"  [MEMORY] Page refreshed and GC completed")
                 
+                # Log successful page refresh
                 error_tracker.add_error(
-                    error_type="SESSION_EXPIRED",
-                    error_message=f"Could not verify/restore login - stopping after {successful} successful bets",
+                    error_type='PAGE_REFRESH_SUCCESS',
+                    error_message=f'Scheduled page refresh after bet {bet_number} completed successfully',
                     context={
-                        'bet_number': i + 1,
-                        'total_bets': len(bet_slips),
-                        'successful_so_far': successful
+                        'bet_number': bet_number,
+                        'reason': 'scheduled_memory_cleanup',
+                        'interval': 'every_5_bets'
                     }
                 )
-                
-                # Save progress before stopping
-                with open(progress_file, 'w') as f:
-                    json.dump({
-                        'last_completed_bet': i,
-                        'last_successful_bet': i - 1 if i > 0 else 0,
-                        'successful': successful,
-                        'failed': 0,
-                        'match_fingerprint': current_match_fingerprint,
-                        'timestamp': datetime.now().isoformat(),
-                        'matches_data': matches,
-                        'cumulative_runtime_seconds': cumulative_runtime_seconds + (time.time() - script_start_time),
-                        'outcome_button_cache': outcome_button_cache
-                    }, f)
-                
-                error_tracker.display_summary()
                 error_tracker.save_to_file()
-                
-                break
+            except Exception as refresh_err:
+                print(f"  [WARNING] Page refresh failed: {refresh_err}")
+                error_tracker.add_error(
+                    error_type='PAGE_REFRESH_FAILED',
+                    error_message=f'Page refresh failed after bet {bet_number}: {str(refresh_err)[:150]}',
+                    context={
+                        'bet_number': bet_number,
+                        'error_details': str(refresh_err),
+                        'recovery_action': 'continuing_anyway'
+                    },
+                    exception=refresh_err
+                )
+                error_tracker.save_to_file()
+        
+        # Bet indexes followed by a scheduled browser restart (every 8th) or page refresh (every 5th),
+        # never after the last bet. Ranges keep `in` O(1) without materializing 3^n indexes;
+        # a bet due for both only restarts, since the restart branch is tested first.
+        restart_points = range(7, total_bets - 1, 8)
+        refresh_points = range(4, total_bets - 1, 5)
+        
+        # Setup is done: move what survives it (matches, caches, module state) into the permanent
+        # generation so the per-bet collections never rescan it
+        gc.collect()
+        gc.freeze()
+        
+        # Skip already completed bets
+        try:
+            for i, bet_slip in enumerate(islice(bet_slips, start_index, None), start_index):
+                print(f"\n{'='*60}")
+                print(f"BET {i+1}/{total_bets}")
+                print(f"{'='*60}")
             
-            try:
-                # Try to place bet with retry on network errors
-                # Per-bet timeout: 4 minutes (240 seconds) to prevent hangs
-                PER_BET_TIMEOUT = 240  # 4 minutes - reduced for faster recovery
+                # Check if still logged in before each bet
+                is_logged_in = await check_and_relogin(page, browser)
+                if not is_logged_in:
+                    print(f"\n❌ [FATAL] Could not verify/restore login - stopping bet placement")
+                    print(f"[INFO] Completed {successful} bets before login failure")
                 
-                try:
-                    # Wrap the bet placement in asyncio.wait_for with timeout
-                    success = await asyncio.wait_for(
-                        retry_with_backoff(
-                            place_bet_slip,
-                            max_retries=3,
-                            initial_delay=5,
-                            page=page, bet_slip=bet_slip, amount=amount_per_slip, match_cache=match_cache, outcome_button_cache=outcome_button_cache
-                        ),
-                        timeout=PER_BET_TIMEOUT
-                    )
-                except asyncio.TimeoutError:
-                    # Per-bet timeout exceeded - bet took longer than 5 minutes
-                    print(f"\n⏱️ [PER-BET TIMEOUT] Bet {bet_slip['slip_number']} exceeded {PER_BET_TIMEOUT}s ({PER_BET_TIMEOUT//60} min) timeout!")
-                    print(f"[ERROR] Marking bet as failed and triggering retry...")
-                    
                     error_tracker.add_error(
-                        error_type='TIMEOUT',
-                        error_message=f'Per-bet timeout ({PER_BET_TIMEOUT}s) exceeded for bet {bet_slip["slip_number"]} - operation hung',
+                        error_type="SESSION_EXPIRED",
+                        error_message=f"Could not verify/restore login - stopping after {successful} successful bets",
                         context={
-                            'bet_number': bet_slip['slip_number'],
-                            'timeout_seconds': PER_BET_TIMEOUT,
-                            'action': 'will_retry_or_terminate'
+                            'bet_number': i + 1,
+                            'total_bets': total_bets,
+                            'successful_so_far': successful
                         }
                     )
-                    success = "RETRY"  # Trigger retry logic instead of hard failure
+                
+                    # Save progress before stopping
+                    await save_checkpoint(i)
+                
+                    error_tracker.display_summary()
+                    error_tracker.save_to_file()
+                
+                    break
+            
+                try:
+                    # Try to place bet with retry on network errors
+                    # Per-bet timeout: 4 minutes (240 seconds) to prevent hangs
+                    PER_BET_TIMEOUT = 240  # 4 minutes - reduced for faster recovery
+                
+                    try:
+                        # Wrap the bet placement in asyncio.wait_for with timeout
+                        success = await asyncio.wait_for(
+                            retry_with_backoff(
+                                place_bet_slip,
+                                max_retries=3,
+                                initial_delay=5,
+                                page=page, bet_slip=bet_slip, amount=amount_per_slip, match_cache=match_cache, outcome_button_cache=outcome_button_cache
+                            ),
+                            timeout=PER_BET_TIMEOUT
+                        )
+                    except asyncio.TimeoutError:
+                        # Per-bet timeout exceeded - bet took longer than 5 minutes
+                        print(f"\n⏱️ [PER-BET TIMEOUT] Bet {bet_slip['slip_number']} exceeded {PER_BET_TIMEOUT}s ({PER_BET_TIMEOUT//60} min) timeout!")
+                        print(f"[ERROR] Marking bet as failed and triggering retry...")
+                    
+                        error_tracker.add_error(
+                            error_type='TIMEOUT',
+                            error_message=f'Per-bet timeout ({PER_BET_TIMEOUT}s) exceeded for bet {bet_slip["slip_number"]} - operation hung',
+                            context={
+                                'bet_number': bet_slip['slip_number'],
+                                'timeout_seconds': PER_BET_TIMEOUT,
+                                'action': 'will_retry_or_terminate'
+                            }
+                        )
+                        success = "RETRY"  # Trigger retry logic instead of hard failure
                     
-                except (PlaywrightError, PlaywrightTimeoutError) as e:
-                    # Network failure - mark bet as failed
-                    print(f"\n[CRITICAL ERROR] Network failure after retries: {e}")
-                    print("[ERROR] Marking bet as failed (no browser restart)")
+                    except (PlaywrightError, PlaywrightTimeoutError) as e:
+                        # Network failure - mark bet as failed
+                        print(f"\n[CRITICAL ERROR] Network failure after retries: {e}")
+                        print("[ERROR] Marking bet as failed (no browser restart)")
                     
-                    # Determine error type
-                    error_str = str(e).lower()
-                    if 'timeout' in error_str:
-                        error_type = 'TIMEOUT'
-                    else:
-                        error_type = 'NETWORK_FAILURE'
+                        # Determine error type
+                        error_str = str(e).lower()
+                        if 'timeout' in error_str:
+                            error_type = 'TIMEOUT'
+                        else:
+                            error_type = 'NETWORK_FAILURE'
                     
-                    error_tracker.add_error(
-                        error_type=error_type,
-                        error_message=f'Network/timeout failure during bet {bet_slip["slip_number"]} placement: {str(e)[:150]}',
-                        context={
-                            'bet_number': bet_slip['slip_number'],
-                            'exception_type': type(e).__name__
-                        },
-                        exception=e
-                    )
-                    success = False
+                        error_tracker.add_error(
+                            error_type=error_type,
+                            error_message=f'Network/timeout failure during bet {bet_slip["slip_number"]} placement: {str(e)[:150]}',
+                            context={
+                                'bet_number': bet_slip['slip_number'],
+                                'exception_type': type(e).__name__
+                            },
+                            exception=e
+                        )
+                        success = False
                 
-                if success == True:
-                    successful += 1
-                    print(f"\n[SUCCESS] Bet slip {bet_slip['slip_number']} placed!")
+                    if success == True:
+                        successful += 1
+                        print(f"\n[SUCCESS] Bet slip {bet_slip['slip_number']} placed!")
                     
-                    # Save progress - track last SUCCESSFUL bet index
-                    # Calculate current session runtime to add to cumulative
-                    current_session_runtime = time.time() - script_start_time
-                    with open(progress_file, 'w') as f:
-                        json.dump({
-                            'last_completed_bet': i + 1,  # Next bet to attempt
-                            'last_successful_bet': i,  # Last successful bet index
-                            'successful': successful,
-                            'failed': 0,
-                            'match_fingerprint': current_match_fingerprint,
-                            'timestamp': datetime.now().isoformat(),
-                            'matches_data': matches,  # Save match data for resume
-                            'cumulative_runtime_seconds': cumulative_runtime_seconds + current_session_runtime,  # Track total runtime
-                            'outcome_button_cache': outcome_button_cache  # PERSIST selector cache for restart
-                        }, f)
+                        # Save progress - track last SUCCESSFUL bet index
+                        await save_checkpoint(i + 1)
                     
-                    # AGGRESSIVE memory management to prevent Playwright corruption
-                    # GC every bet (not just every 3) for more stable long sessions
-                    gc.collect()
+                        # Young-generation GC every bet is cheap; the full collection runs on the
+                        # browser restart below, where the old Playwright object graph actually dies
+                        gc.collect(generation=0)
                     
-                    # BROWSER RESTART every 8 bets - TRUE fix for Playwright memory corruption
-                    # Creates completely fresh browser instance with clean memory state
-                    # Reduced from 10 to 8 for earlier memory cleanup
-                    if (i + 1) % 8 == 0 and i < len(bet_slips) - 1:
-                        try:
-                            print(f"\n  [BROWSER RESTART] Restarting browser after {i + 1} bets to prevent memory corruption...")
-                            restart_result = await restart_browser_fresh(p, old_browser=browser, old_page=page)
-                            if restart_result:
-                                page = restart_result["page"]
-                                browser = restart_result["browser"]
-                                # NOTE: We intentionally DO NOT clear the cache!
-                                # The cache contains selector STRINGS (e.g., 'div.grid.p-1 > div...')
-                                # These selectors are still valid for the new browser - no re-caching needed!
-                                print(f"  [BROWSER RESTART] ✓ Fresh browser ready - keeping {len(outcome_button_cache)} cached selectors")
+                        # Navigation to run during the wait between bets (post-restart landing or refresh)
+                        pending_navigation = None
+                    
+                        # BROWSER RESTART every 8 bets - TRUE fix for Playwright memory corruption
+                        # Recycling the context frees the same page memory without relaunching Chromium
+                        # or logging in again; the full browser restart is only the fallback
+                        # Reduced from 10 to 8 for earlier memory cleanup
+                        if i in restart_points:
+                            try:
+                                print(f"\n  [BROWSER RESTART] Recycling browser context after {i + 1} bets to prevent memory corruption...")
+                                new_page = await restart_context_fresh(browser, page.context)
+                                if new_page:
+                                    restart_result = {"page": new_page, "browser": browser}
+                                else:
+                                    print(f"  [BROWSER RESTART] Falling back to a full browser restart...")
+                                    restart_result = await restart_browser_fresh(p, old_browser=browser, old_page=page)
+                                if restart_result:
+                                    page = restart_result["page"]
+                                    browser = restart_result["browser"]
+                                    # NOTE: We intentionally DO NOT clear the cache!
+                                    # The cache contains selector STRINGS (e.g., 'div.grid.p-1 > div...')
+                                    # These selectors are still valid for the new browser - no re-caching needed!
+                                    print(f"  [BROWSER RESTART] ✓ Fresh browser ready - keeping {len(outcome_button_cache)} cached selectors")
+                                
+                                    # Log successful browser restart
+                                    error_tracker.add_error(
+                                        error_type='BROWSER_RESTART_SUCCESS',
+                                        error_message=f'Scheduled browser restart after bet {i + 1} completed successfully',
+                                        context={
+                                            'bet_number': i + 1,
+                                            'cached_selectors': len(outcome_button_cache),
+                                            'reason': 'scheduled_memory_cleanup',
+                                            'interval': 'every_8_bets'
+                                        }
+                                    )
+                                    error_tracker.save_to_file()
                                 
-                                # Log successful browser restart
+                                    # Just navigate to soccer page (during the wait below) - selectors will work on first bet
+                                    pending_navigation = open_soccer_page(page)
+                                else:
+                                    print(f"  [BROWSER RESTART] ⚠️ Failed - continuing with current browser")
+                                    error_tracker.add_error(
+                                        error_type='BROWSER_RESTART_FAILED',
+                                        error_message=f'Scheduled browser restart after bet {i + 1} failed - no result returned',
+                                        context={
+                                            'bet_number': i + 1,
+                                            'reason': 'restart_returned_none',
+                                            'recovery_action': 'continuing_with_current_browser'
+                                        }
+                                    )
+                                    error_tracker.save_to_file()
+                            except Exception as restart_err:
+                                print(f"  [BROWSER RESTART] ⚠️ Error: {restart_err} - continuing with current browser")
                                 error_tracker.add_error(
-                                    error_type='BROWSER_RESTART_SUCCESS',
-                                    error_message=f'Scheduled browser restart after bet {i + 1} completed successfully',
+                                    error_type='BROWSER_RESTART_ERROR',
+                                    error_message=f'Browser restart exception after bet {i + 1}: {str(restart_err)[:150]}',
                                     context={
                                         'bet_number': i + 1,
-                                        'cached_selectors': len(outcome_button_cache),
-                                        'reason': 'scheduled_memory_cleanup',
-                                        'interval': 'every_8_bets'
-                                    }
+                                        'error_details': str(restart_err),
+                                        'recovery_action': 'continuing_with_current_browser'
+                                    },
+                                    exception=restart_err
                                 )
                                 error_tracker.save_to_file()
-                                
-                                # Just navigate to soccer page - selectors will work on first bet
-                                await page.goto('https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=15000)
-                                await page.wait_for_timeout(1000)
-                                await close_all_modals(page, timeout_seconds=5)
-                            else:
-                                print(f"  [BROWSER RESTART] ⚠️ Failed - continuing with current browser")
+                    
+                        # Periodic page refresh (every 5 bets that aren't browser restart bets), during the wait below
+                        elif i in refresh_points:
+                            pending_navigation = refresh_page(page, i + 1)
+                    
+                        # Wait between bets
+                        if i < total_bets - 1:
+                            wait_success = await wait_between_bets(page, seconds=5, add_random=True, concurrent_coro=pending_navigation)
+                        
+                            # If wait was interrupted, just log it (no restart)
+                            if not wait_success:
+                                print("\n[WARNING] Wait interrupted - continuing anyway...")
                                 error_tracker.add_error(
-                                    error_type='BROWSER_RESTART_FAILED',
-                                    error_message=f'Scheduled browser restart after bet {i + 1} failed - no result returned',
+                                    error_type='WAIT_INTERRUPTED',
+                                    error_message=f'Wait between bets was interrupted after bet {i + 1}',
                                     context={
                                         'bet_number': i + 1,
-                                        'reason': 'restart_returned_none',
-                                        'recovery_action': 'continuing_with_current_browser'
+                                        'recovery_action': 'continuing_anyway'
                                     }
                                 )
                                 error_tracker.save_to_file()
-                        except Exception as restart_err:
-                            print(f"  [BROWSER RESTART] ⚠️ Error: {restart_err} - continuing with current browser")
-                            error_tracker.add_error(
-                                error_type='BROWSER_RESTART_ERROR',
-                                error_message=f'Browser restart exception after bet {i + 1}: {str(restart_err)[:150]}',
-                                context={
-                                    'bet_number': i + 1,
-                                    'error_details': str(restart_err),
-                                    'recovery_action': 'continuing_with_current_browser'
-                                },
-                                exception=restart_err
-                            )
-                            error_tracker.save_to_file()
-                    
-                    # Periodic page refresh (every 5 bets that aren't browser restart bets)
-                    elif (i + 1) % 5 == 0 and i < len(bet_slips) - 1:
-                        try:
-                            print(f"  [MEMORY] Refreshing page after {i + 1} bets...")
-                            await page.goto('https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=15000)
-                            await page.wait_for_timeout(2000)
-                            await close_all_modals(page)
-                            gc.collect()
-                            print(f"  [MEMORY] Page refreshed and GC completed")
-                            
-                            # Log successful page refresh
-                            error_tracker.add_error(
-                                error_type='PAGE_REFRESH_SUCCESS',
-                                error_message=f'Scheduled page refresh after bet {i + 1} completed successfully',
-                                context={
-                                    'bet_number': i + 1,
-                                    'reason': 'scheduled_memory_cleanup',
-                                    'interval': 'every_5_bets'
-                                }
-                            )
-                            error_tracker.save_to_file()
-                        except Exception as refresh_err:
-                            print(f"  [WARNING] Page refresh failed: {refresh_err}")
-                            error_tracker.add_error(
-                                error_type='PAGE_REFRESH_FAILED',
-                                error_message=f'Page refresh failed after bet {i + 1}: {str(refresh_err)[:150]}',
-                                context={
-                                    'bet_number': i + 1,
-                                    'error_details': str(refresh_err),
-                                    'recovery_action': 'continuing_anyway'
-                                },
-                                exception=refresh_err
-                            )
-                            error_tracker.save_to_file()
-                    
-                    # Wait between bets
-                    if i < len(bet_slips) - 1:
-                        wait_success = await wait_between_bets(page, seconds=5, add_random=True)
-                        
-                        # If wait was interrupted, just log it (no restart)
-                        if not wait_success:
-                            print("\n[WARNING] Wait interrupted - continuing anyway...")
-                            error_tracker.add_error(
-                                error_type='WAIT_INTERRUPTED',
-                                error_message=f'Wait between bets was interrupted after bet {i + 1}',
-                                context={
-                                    'bet_number': i + 1,
-                                    'recovery_action': 'continuing_anyway'
-                                }
-                            )
-                            error_tracker.save_to_file()
                 
-                elif success == "RETRY":
-                    # Click failed but may succeed on retry - don't count as failed yet
-                    print(f"\n⚠️ [RETRY NEEDED] Bet slip {bet_slip['slip_number']} click failed - will retry...")
+                    elif success == "RETRY":
+                        # Click failed but may succeed on retry - don't count as failed yet
+                        print(f"\n⚠️ [RETRY NEEDED] Bet slip {bet_slip['slip_number']} click failed - will retry...")
                     
-                    # Track the retry attempt
-                    error_tracker.add_error(
-                        error_type='RETRY_FAILED',
-                        error_message=f'Bet slip {bet_slip["slip_number"]} required retry - click failed on first attempt',
-                        context={
-                            'bet_number': bet_slip['slip_number'],
-                            'action': 'retry_in_progress'
-                        }
-                    )
+                        # Track the retry attempt
+                        error_tracker.add_error(
+                            error_type='RETRY_FAILED',
+                            error_message=f'Bet slip {bet_slip["slip_number"]} required retry - click failed on first attempt',
+                            context={
+                                'bet_number': bet_slip['slip_number'],
+                                'action': 'retry_in_progress'
+                            }
+                        )
                     
-                    # Wait a bit before retrying
-                    print("  Waiting 10 seconds before retry...")
-                    await page.wait_for_timeout(10000)
+                        # Wait a bit before retrying
+                        print("  Waiting 10 seconds before retry...")
+                        await page.wait_for_timeout(10000)
                     
-                    # Retry the same bet with timeout protection
-                    print(f"\n🔄 RETRYING BET {bet_slip['slip_number']}/{len(bet_slips)}...")
-                    try:
-                        retry_success = await safe_place_bet_slip(page, bet_slip, amount_per_slip, match_cache, outcome_button_cache, timeout_seconds=360)
-                    except asyncio.TimeoutError:
-                        print(f"⚠️ Retry also timed out after 360s - treating as failure")
-                        retry_success = False
+                        # Retry the same bet with timeout protection
+                        print(f"\n🔄 RETRYING BET {bet_slip['slip_number']}/{total_bets}...")
+                        try:
+                            retry_success = await safe_place_bet_slip(page, bet_slip, amount_per_slip, match_cache, outcome_button_cache, timeout_seconds=360)
+                        except asyncio.TimeoutError:
+                            print(f"⚠️ Retry also timed out after 360s - treating as failure")
+                            retry_success = False
                     
-                    if retry_success == True:
-                        successful += 1
-                        print(f"\n[SUCCESS] Retry bet slip {bet_slip['slip_number']} placed!")
+                        if retry_success == True:
+                            successful += 1
+                            print(f"\n[SUCCESS] Retry bet slip {bet_slip['slip_number']} placed!")
                         
-                        # Save progress
-                        with open(progress_file, 'w') as f:
-                            json.dump({
-                                'last_completed_bet': i + 1,
-                                'last_successful_bet': i,
-                                'successful': successful,
-                                'failed': 0,
-                                'match_fingerprint': current_match_fingerprint,
-                                'timestamp': datetime.now().isoformat(),
-                                'matches_data': matches,
-                                'cumulative_runtime_seconds': cumulative_runtime_seconds + (time.time() - script_start_time),
-                                'outcome_button_cache': outcome_button_cache
-                            }, f)
+                            # Save progress
+                            await save_checkpoint(i + 1)
                         
-                        # Wait between bets
-                        if i < len(bet_slips) - 1:
-                            await wait_between_bets(page, seconds=5, add_random=True)
-                    else:
-                        # First retry failed - try browser restart
-                        print(f"\n❌ [FAILED] Retry bet slip {bet_slip['slip_number']} also failed!")
-                        print(f"\n🔄 ALL BETS ARE IMPORTANT - Attempting browser restart...")
+                            # Wait between bets
+                            if i < total_bets - 1:
+                                await wait_between_bets(page, seconds=5, add_random=True)
+                        else:
+                            # First retry failed - try browser restart
+                            print(f"\n❌ [FAILED] Retry bet slip {bet_slip['slip_number']} also failed!")
+                            print(f"\n🔄 ALL BETS ARE IMPORTANT - Attempting browser restart...")
                         
-                        error_tracker.add_error(
-                            error_type='RETRY_FAILED',
-                            error_message=f'Bet {bet_slip["slip_number"]} retry failed - attempting browser restart',
-                            context={'bet_number': bet_slip['slip_number'], 'action': 'browser_restart'}
-                        )
-                        error_tracker.save_to_file()
+                            error_tracker.add_error(
+                                error_type='RETRY_FAILED',
+                                error_message=f'Bet {bet_slip["slip_number"]} retry failed - attempting browser restart',
+                                context={'bet_number': bet_slip['slip_number'], 'action': 'browser_restart'}
+                            )
+                            error_tracker.save_to_file()
                         
-                        # Browser restart retry loop
-                        max_browser_retries = 5
-                        bet_placed = False
+                            # Browser restart retry loop
+                            max_browser_retries = 5
+                            bet_placed = False
                         
-                        for browser_retry in range(max_browser_retries):
-                            print(f"\n🔄 Browser restart attempt {browser_retry + 1}/{max_browser_retries}...")
+                            for browser_retry in range(max_browser_retries):
+                                print(f"\n🔄 Browser restart attempt {browser_retry + 1}/{max_browser_retries}...")
                             
-                            try:
-                                restart_result = await restart_browser_fresh(p, old_browser=browser, old_page=page)
-                                if restart_result:
-                                    page = restart_result["page"]
-                                    browser = restart_result["browser"]
+                                try:
+                                    restart_result = await restart_browser_fresh(p, old_browser=browser, old_page=page)
+                                    if restart_result:
+                                        page = restart_result["page"]
+                                        browser = restart_result["browser"]
                                     
-                                    await page.goto('https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=15000)
-                                    await page.wait_for_timeout(2000)
-                                    await close_all_modals(page)
-                                    await page.wait_for_timeout(10000)
+                                        await page.goto('https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=15000)
+                                        await page.wait_for_timeout(2000)
+                                        await close_all_modals(page)
+                                        await page.wait_for_timeout(10000)
                                     
-                                    retry_success = await place_bet_slip(page, bet_slip, amount_per_slip, match_cache, outcome_button_cache)
+                                        retry_success = await place_bet_slip(page, bet_slip, amount_per_slip, match_cache, outcome_button_cache)
                                     
-                                    if retry_success == True:
-                                        successful += 1
-                                        bet_placed = True
-                                        print(f"\n✅ [SUCCESS] Bet {bet_slip['slip_number']} placed after browser restart!")
+                                        if retry_success == True:
+                                            successful += 1
+                                            bet_placed = True
+                                            print(f"\n✅ [SUCCESS] Bet {bet_slip['slip_number']} placed after browser restart!")
                                         
-                                        with open(progress_file, 'w') as f:
-                                            json.dump({
-                                                'last_completed_bet': i + 1,
-                                                'last_successful_bet': i,
-                                                'successful': successful,
-                                                'failed': 0,
-                                                'match_fingerprint': current_match_fingerprint,
-                                                'timestamp': datetime.now().isoformat(),
-                                                'matches_data': matches,
-                                                'cumulative_runtime_seconds': cumulative_runtime_seconds + (time.time() - script_start_time),
-                                                'outcome_button_cache': outcome_button_cache
-                                            }, f)
-                                        break
-                            except Exception as e:
-                                print(f"  ❌ Exception: {e}")
+                                            await save_checkpoint(i + 1)
+                                            break
+                                except Exception as e:
+                                    print(f"  ❌ Exception: {e}")
                             
-                            if browser_retry < max_browser_retries - 1:
-                                wait_time = 15 * (browser_retry + 1)
-                                print(f"  Waiting {wait_time}s...")
-                                await asyncio.sleep(wait_time)
+                                if browser_retry < max_browser_retries - 1:
+                                    wait_time = 15 * (browser_retry + 1)
+                                    print(f"  Waiting {wait_time}s...")
+                                    await asyncio.sleep(wait_time)
                         
-                        if not bet_placed:
-                            print(f"\n⛔ All retries exhausted for bet {bet_slip['slip_number']}")
-                            print(f"Progress saved - run script again to retry")
+                            if not bet_placed:
+                                print(f"\n⛔ All retries exhausted for bet {bet_slip['slip_number']}")
+                                print(f"Progress saved - run script again to retry")
                             
-                            with open(progress_file, 'w') as f:
-                                json.dump({
-                                    'last_completed_bet': i,
-                                    'last_successful_bet': i - 1 if i > 0 else -1,
-                                    'successful': successful,
-                                    'failed': 0,
-                                    'match_fingerprint': current_match_fingerprint,
-                                    'timestamp': datetime.now().isoformat(),
-                                    'matches_data': matches,
-                                    'cumulative_runtime_seconds': cumulative_runtime_seconds + (time.time() - script_start_time),
-                                    'outcome_button_cache': outcome_button_cache
-                                }, f)
+                                await save_checkpoint(i)
                             
-                            error_tracker.display_summary()
-                            error_tracker.save_to_file()
+                                error_tracker.display_summary()
+                                error_tracker.save_to_file()
                             
-                            try:
-                                await browser.close()
-                            except:
-                                pass
+                                try:
+                                    await browser.close()
+                                except:
+                                    pass
                             
-                            import sys
-                            sys.exit(1)
+                                import sys
+                                sys.exit(1)
                         
-                        if i < len(bet_slips) - 1:
-                            await wait_between_bets(page, seconds=5, add_random=True)
+                            if i < total_bets - 1:
+                                await wait_between_bets(page, seconds=5, add_random=True)
                 
-                elif success == "RELOGIN":
-                    # Session expired during bet - need to re-login and retry
-                    print(f"\n🔄 [RE-LOGIN REQUIRED] Session expired during bet {bet_slip['slip_number']}")
-                    print("  Attempting to re-authenticate...")
+                    elif success == "RELOGIN":
+                        # Session expired during bet - need to re-login and retry
+                        print(f"\n🔄 [RE-LOGIN REQUIRED] Session expired during bet {bet_slip['slip_number']}")
+                        print("  Attempting to re-authenticate...")
                     
-                    # Attempt re-login
-                    relogin_success = await check_and_relogin(page, browser)
+                        # Attempt re-login
+                        relogin_success = await check_and_relogin(page, browser)
                     
-                    if relogin_success:
-                        print("  ✅ Re-login successful! Verifying login state...")
+                        if relogin_success:
+                            print("  ✅ Re-login successful! Verifying login state...")
                         
-                        # CRITICAL: Verify login was actually successful by checking for balance
-                        await page.wait_for_timeout(2000)
-                        balance_verified = False
-                        for verify_attempt in range(3):
-                            try:
-                                balance_elem = await page.query_selector('strong:has-text("Balance")')
-                                if balance_elem and await balance_elem.is_visible():
-                                    parent = await balance_elem.evaluate_handle('el => el.closest("div")')
-                                    balance_text = await parent.inner_text()
-                                    balance_clean = balance_text.replace('\n', ' ').strip()
-                                    print(f"  ✓ Login verified: {balance_clean}")
-                                    balance_verified = True
-                                    break
-                            except:
-                                pass
+                            # CRITICAL: Verify login was actually successful by checking for balance
+                            await page.wait_for_timeout(2000)
+                            balance_verified = False
+                            for verify_attempt in range(3):
+                                try:
+                                    balance_elem = await page.query_selector('strong:has-text("Balance")')
+                                    if balance_elem and await balance_elem.is_visible():
+                                        parent = await balance_elem.evaluate_handle('el => el.closest("div")')
+                                        balance_text = await parent.inner_text()
+                                        balance_clean = balance_text.replace('\n', ' ').strip()
+                                        print(f"  ✓ Login verified: {balance_clean}")
+                                        balance_verified = True
+                                        break
+                                except:
+                                    pass
                             
-                            if verify_attempt < 2:
-                                print(f"  ⏳ Verifying login... (attempt {verify_attempt + 1}/3)")
-                                await page.wait_for_timeout(1500)
+                                if verify_attempt < 2:
+                                    print(f"  ⏳ Verifying login... (attempt {verify_attempt + 1}/3)")
+                                    await page.wait_for_timeout(1500)
                         
-                        if not balance_verified:
-                            print("  ⚠️ Could not verify login, but continuing anyway...")
+                            if not balance_verified:
+                                print("  ⚠️ Could not verify login, but continuing anyway...")
                         
-                        # Navigate to clear betslip completely before retrying
-                        print("  Clearing betslip before retry...")
-                        try:
-                            await page.goto('https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=15000)
-                            await page.wait_for_timeout(3000)  # Increased wait time
-                            await close_all_modals(page)
+                            # Navigate to clear betslip completely before retrying
+                            print("  Clearing betslip before retry...")
+                            try:
+                                await page.goto('https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=15000)
+                                await page.wait_for_timeout(3000)  # Increased wait time
+                                await close_all_modals(page)
                             
-                            # Verify betslip is empty by scrolling to it
-                            await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-                            await page.wait_for_timeout(1000)
-                            print("  ✓ Betslip cleared and page ready")
-                        except Exception as nav_err:
-                            print(f"  ⚠️ Navigation warning: {nav_err}")
+                                # Verify betslip is empty by scrolling to it
+                                await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+                                await page.wait_for_timeout(1000)
+                                print("  ✓ Betslip cleared and page ready")
+                            except Exception as nav_err:
+                                print(f"  ⚠️ Navigation warning: {nav_err}")
                         
-                        await page.wait_for_timeout(1000)
+                            await page.wait_for_timeout(1000)
                         
-                        # Retry the bet after re-login
-                        retry_success = await place_bet_slip(page, bet_slip, amount_per_slip, match_cache, outcome_button_cache)
+                            # Retry the bet after re-login
+                            retry_success = await place_bet_slip(page, bet_slip, amount_per_slip, match_cache, outcome_button_cache)
                         
-                        if retry_success == True:
-                            successful += 1
-                            print(f"\n[SUCCESS] Bet slip {bet_slip['slip_number']} placed after re-login!")
+                            if retry_success == True:
+                                successful += 1
+                                print(f"\n[SUCCESS] Bet slip {bet_slip['slip_number']} placed after re-login!")
                             
-                            # Save progress
-                            with open(progress_file, 'w') as f:
-                                json.dump({
-                                    'last_completed_bet': i + 1,
-                                    'last_successful_bet': i,
-                                    'successful': successful,
-                                    'failed': 0,
-                                    'match_fingerprint': current_match_fingerprint,
-                                    'timestamp': datetime.now().isoformat(),
-                                    'matches_data': matches,
-                                    'cumulative_runtime_seconds': cumulative_runtime_seconds + (time.time() - script_start_time),
-                                    'outcome_button_cache': outcome_button_cache
-                                }, f)
+                                # Save progress
+                                await save_checkpoint(i + 1)
                             
-                            # Wait between bets
-                            if i < len(bet_slips) - 1:
-                                await wait_between_bets(page, seconds=5, add_random=True)
-                        else:
-                            # Retry after re-login failed - keep trying with browser restarts
-                            print(f"\n❌ [FAILED] Bet {bet_slip['slip_number']} failed after re-login!")
-                            print(f"🔄 ALL BETS ARE IMPORTANT - Trying browser restart...")
+                                # Wait between bets
+                                if i < total_bets - 1:
+                                    await wait_between_bets(page, seconds=5, add_random=True)
+                            else:
+                                # Retry after re-login failed - keep trying with browser restarts
+                                print(f"\n❌ [FAILED] Bet {bet_slip['slip_number']} failed after re-login!")
+                                print(f"🔄 ALL BETS ARE IMPORTANT - Trying browser restart...")
+                            
+                                error_tracker.add_error(
+                                    error_type='RETRY_FAILED',
+                                    error_message=f'Bet {bet_slip["slip_number"]} failed after re-login - attempting browser restarts',
+                                    context={'bet_number': bet_slip['slip_number'], 'action': 'browser_restart_loop'}
+                                )
+                                error_tracker.save_to_file()
+                            
+                                # Keep trying with browser restarts
+                                max_browser_retries = 5
+                                bet_placed = False
+                            
+                                for browser_retry in range(max_browser_retries):
+                                    print(f"\n🔄 Browser restart attempt {browser_retry + 1}/{max_browser_retries}...")
+                                
+                                    try:
+                                        restart_result = await restart_browser_fresh(p, old_browser=browser, old_page=page)
+                                        if restart_result:
+                                            page = restart_result["page"]
+                                            browser = restart_result["browser"]
+                                        
+                                            await page.goto('https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=15000)
+                                            await page.wait_for_timeout(2000)
+                                            await close_all_modals(page)
+                                            await page.wait_for_timeout(10000)
+                                        
+                                            retry_success = await place_bet_slip(page, bet_slip, amount_per_slip, match_cache, outcome_button_cache)
+                                        
+                                            if retry_success == True:
+                                                successful += 1
+                                                bet_placed = True
+                                                print(f"\n✅ [SUCCESS] Bet {bet_slip['slip_number']} placed!")
+                                            
+                                                await save_checkpoint(i + 1)
+                                                break
+                                    except Exception as e:
+                                        print(f"  ❌ Exception: {e}")
+                                
+                                    if browser_retry < max_browser_retries - 1:
+                                        wait_time = 15 * (browser_retry + 1)
+                                        print(f"  Waiting {wait_time}s...")
+                                        await asyncio.sleep(wait_time)
+                            
+                                if not bet_placed:
+                                    print(f"\n⛔ All retries exhausted - saving progress and exiting")
+                                
+                                    await save_checkpoint(i)
+                                
+                                    error_tracker.display_summary()
+                                    error_tracker.save_to_file()
+                                
+                                    try:
+                                        await browser.close()
+                                    except:
+                                        pass
+                                
+                                    import sys
+                                    sys.exit(1)
                             
+                                if i < total_bets - 1:
+                                    await wait_between_bets(page, seconds=5, add_random=True)
+                        else:
+                            # Re-login failed - try browser restart loop
+                            print(f"\n⚠️ [RE-LOGIN FAILED] Starting browser restart loop...")
+                        
                             error_tracker.add_error(
-                                error_type='RETRY_FAILED',
-                                error_message=f'Bet {bet_slip["slip_number"]} failed after re-login - attempting browser restarts',
+                                error_type='RELOGIN_FAILED',
+                                error_message=f'Re-login failed for bet {bet_slip["slip_number"]} - starting browser restart loop',
                                 context={'bet_number': bet_slip['slip_number'], 'action': 'browser_restart_loop'}
                             )
                             error_tracker.save_to_file()
-                            
+                        
                             # Keep trying with browser restarts
                             max_browser_retries = 5
                             bet_placed = False
-                            
+                        
                             for browser_retry in range(max_browser_retries):
                                 print(f"\n🔄 Browser restart attempt {browser_retry + 1}/{max_browser_retries}...")
-                                
+                            
                                 try:
                                     restart_result = await restart_browser_fresh(p, old_browser=browser, old_page=page)
                                     if restart_result:
                                         page = restart_result["page"]
                                         browser = restart_result["browser"]
-                                        
+                                    
                                         await page.goto('https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=15000)
                                         await page.wait_for_timeout(2000)
                                         await close_all_modals(page)
                                         await page.wait_for_timeout(10000)
-                                        
+                                    
                                         retry_success = await place_bet_slip(page, bet_slip, amount_per_slip, match_cache, outcome_button_cache)
-                                        
+                                    
                                         if retry_success == True:
                                             successful += 1
                                             bet_placed = True
                                             print(f"\n✅ [SUCCESS] Bet {bet_slip['slip_number']} placed!")
-                                            
-                                            with open(progress_file, 'w') as f:
-                                                json.dump({
-                                                    'last_completed_bet': i + 1,
-                                                    'last_successful_bet': i,
-                                                    'successful': successful,
-                                                    'failed': 0,
-                                                    'match_fingerprint': current_match_fingerprint,
-                                                    'timestamp': datetime.now().isoformat(),
-                                                    'matches_data': matches,
-                                                    'cumulative_runtime_seconds': cumulative_runtime_seconds + (time.time() - script_start_time),
-                                                    'outcome_button_cache': outcome_button_cache
-                                                }, f)
+                                        
+                                            await save_checkpoint(i + 1)
                                             break
                                 except Exception as e:
                                     print(f"  ❌ Exception: {e}")
-                                
+                            
                                 if browser_retry < max_browser_retries - 1:
                                     wait_time = 15 * (browser_retry + 1)
                                     print(f"  Waiting {wait_time}s...")
                                     await asyncio.sleep(wait_time)
-                            
+                        
                             if not bet_placed:
                                 print(f"\n⛔ All retries exhausted - saving progress and exiting")
-                                
-                                with open(progress_file, 'w') as f:
-                                    json.dump({
-                                        'last_completed_bet': i,
-                                        'last_successful_bet': i - 1 if i > 0 else -1,
-                                        'successful': successful,
-                                        'failed': 0,
-                                        'match_fingerprint': current_match_fingerprint,
-                                        'timestamp': datetime.now().isoformat(),
-                                        'matches_data': matches,
-                                        'cumulative_runtime_seconds': cumulative_runtime_seconds + (time.time() - script_start_time),
-                                        'outcome_button_cache': outcome_button_cache
-                                    }, f)
-                                
+                            
+                                await save_checkpoint(i)
+                            
                                 error_tracker.display_summary()
                                 error_tracker.save_to_file()
-                                
+                            
                                 try:
                                     await browser.close()
                                 except:
                                     pass
-                                
+                            
                                 import sys
                                 sys.exit(1)
-                            
-                            if i < len(bet_slips) - 1:
+                        
+                            if i < total_bets - 1:
                                 await wait_between_bets(page, seconds=5, add_random=True)
+                
                     else:
-                        # Re-login failed - try browser restart loop
-                        print(f"\n⚠️ [RE-LOGIN FAILED] Starting browser restart loop...")
-                        
+                        # Bet failed - DO NOT SKIP, retry with browser restart
+                        print(f"\n❌ [FAILED] Bet slip {bet_slip['slip_number']} failed!")
+                        print(f"\n{'='*60}")
+                        print(f"🔄 ALL BETS ARE IMPORTANT - RETRYING WITH BROWSER RESTART")
+                        print(f"{'='*60}")
+                    
+                        # Track the failure
                         error_tracker.add_error(
-                            error_type='RELOGIN_FAILED',
-                            error_message=f'Re-login failed for bet {bet_slip["slip_number"]} - starting browser restart loop',
-                            context={'bet_number': bet_slip['slip_number'], 'action': 'browser_restart_loop'}
+                            error_type="BET_FAILED",
+                            error_message=f"Bet slip {bet_slip['slip_number']} failed - attempting browser restart and retry",
+                            context={
+                                'bet_number': bet_slip['slip_number'],
+                                'total_bets': total_bets,
+                                'successful_so_far': successful,
+                                'action': 'browser_restart_retry'
+                            }
                         )
                         error_tracker.save_to_file()
-                        
-                        # Keep trying with browser restarts
+                    
+                        # Save progress at this bet (so we resume HERE if script crashes)
+                        await save_checkpoint(i)
+                    
+                        # Retry loop with browser restarts
                         max_browser_retries = 5
                         bet_placed = False
-                        
+                    
                         for browser_retry in range(max_browser_retries):
                             print(f"\n🔄 Browser restart attempt {browser_retry + 1}/{max_browser_retries}...")
-                            
+                        
                             try:
+                                # Restart browser completely
                                 restart_result = await restart_browser_fresh(p, old_browser=browser, old_page=page)
                                 if restart_result:
                                     page = restart_result["page"]
                                     browser = restart_result["browser"]
-                                    
+                                    print(f"  ✅ Browser restarted successfully")
+                                
+                                    # Navigate to soccer page
                                     await page.goto('https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=15000)
                                     await page.wait_for_timeout(2000)
                                     await close_all_modals(page)
+                                
+                                    # Wait before retry
+                                    print(f"  Waiting 10 seconds before retry...")
                                     await page.wait_for_timeout(10000)
-                                    
+                                
+                                    # Retry the bet
                                     retry_success = await place_bet_slip(page, bet_slip, amount_per_slip, match_cache, outcome_button_cache)
-                                    
+                                
                                     if retry_success == True:
                                         successful += 1
                                         bet_placed = True
-                                        print(f"\n✅ [SUCCESS] Bet {bet_slip['slip_number']} placed!")
-                                        
-                                        with open(progress_file, 'w') as f:
-                                            json.dump({
-                                                'last_completed_bet': i + 1,
-                                                'last_successful_bet': i,
-                                                'successful': successful,
-                                                'failed': 0,
-                                                'match_fingerprint': current_match_fingerprint,
-                                                'timestamp': datetime.now().isoformat(),
-                                                'matches_data': matches,
-                                                'cumulative_runtime_seconds': cumulative_runtime_seconds + (time.time() - script_start_time),
-                                                'outcome_button_cache': outcome_button_cache
-                                            }, f)
-                                        break
-                            except Exception as e:
-                                print(f"  ❌ Exception: {e}")
-                            
+                                        print(f"\n✅ [SUCCESS] Bet {bet_slip['slip_number']} placed after browser restart!")
+                                    
+                                        # Save progress
+                                        await save_checkpoint(i + 1)
+                                    
+                                        break  # Exit retry loop on success
+                                    else:
+                                        print(f"  ❌ Retry {browser_retry + 1} failed - will try again...")
+                                else:
+                                    print(f"  ❌ Browser restart failed - will try again...")
+                            except Exception as restart_err:
+                                print(f"  ❌ Exception during retry: {restart_err}")
+                        
+                            # Wait before next retry
                             if browser_retry < max_browser_retries - 1:
-                                wait_time = 15 * (browser_retry + 1)
-                                print(f"  Waiting {wait_time}s...")
+                                wait_time = 15 * (browser_retry + 1)  # Increasing wait: 15s, 30s, 45s, 60s
+                                print(f"  Waiting {wait_time}s before next attempt...")
                                 await asyncio.sleep(wait_time)
-                        
+                    
                         if not bet_placed:
-                            print(f"\n⛔ All retries exhausted - saving progress and exiting")
-                            
-                            with open(progress_file, 'w') as f:
-                                json.dump({
-                                    'last_completed_bet': i,
-                                    'last_successful_bet': i - 1 if i > 0 else -1,
-                                    'successful': successful,
-                                    'failed': 0,
-                                    'match_fingerprint': current_match_fingerprint,
-                                    'timestamp': datetime.now().isoformat(),
-                                    'matches_data': matches,
-                                    'cumulative_runtime_seconds': cumulative_runtime_seconds + (time.time() - script_start_time),
-                                    'outcome_button_cache': outcome_button_cache
-                                }, f)
-                            
+                            # All retries exhausted - save progress and exit for manual intervention
+                            print(f"\n{'='*60}")
+                            print(f"⛔ ALL RETRY ATTEMPTS EXHAUSTED")
+                            print(f"{'='*60}")
+                            print(f"Bet {bet_slip['slip_number']} could not be placed after {max_browser_retries} browser restarts")
+                            print(f"Progress saved - run script again to retry this bet")
+                            print(f"{'='*60}")
+                        
+                            error_tracker.add_error(
+                                error_type="BET_FAILED",
+                                error_message=f"Bet {bet_slip['slip_number']} failed after {max_browser_retries} browser restart attempts",
+                                context={
+                                    'bet_number': bet_slip['slip_number'],
+                                    'retry_attempts': max_browser_retries,
+                                    'action': 'requires_manual_intervention'
+                                }
+                            )
                             error_tracker.display_summary()
                             error_tracker.save_to_file()
-                            
+                        
                             try:
                                 await browser.close()
                             except:
                                 pass
-                            
+                        
                             import sys
                             sys.exit(1)
-                        
-                        if i < len(bet_slips) - 1:
+                    
+                        # Wait between bets after successful retry
+                        if i < total_bets - 1:
                             await wait_between_bets(page, seconds=5, add_random=True)
                 
-                else:
-                    # Bet failed - DO NOT SKIP, retry with browser restart
-                    print(f"\n❌ [FAILED] Bet slip {bet_slip['slip_number']} failed!")
-                    print(f"\n{'='*60}")
-                    print(f"🔄 ALL BETS ARE IMPORTANT - RETRYING WITH BROWSER RESTART")
-                    print(f"{'='*60}")
-                    
-                    # Track the failure
-                    error_tracker.add_error(
-                        error_type="BET_FAILED",
-                        error_message=f"Bet slip {bet_slip['slip_number']} failed - attempting browser restart and retry",
-                        context={
-                            'bet_number': bet_slip['slip_number'],
-                            'total_bets': len(bet_slips),
-                            'successful_so_far': successful,
-                            'action': 'browser_restart_retry'
-                        }
-                    )
-                    error_tracker.save_to_file()
-                    
-                    # Save progress at this bet (so we resume HERE if script crashes)
-                    with open(progress_file, 'w') as f:
-                        json.dump({
-                            'last_completed_bet': i,  # Resume FROM this bet
-                            'last_successful_bet': i - 1 if i > 0 else -1,
-                            'successful': successful,
-                            'failed': 0,  # Reset failed count
-                            'match_fingerprint': current_match_fingerprint,
-                            'timestamp': datetime.now().isoformat(),
-                            'matches_data': matches,
-                            'cumulative_runtime_seconds': cumulative_runtime_seconds + (time.time() - script_start_time),
-                            'outcome_button_cache': outcome_button_cache
-                        }, f)
-                    
-                    # Retry loop with browser restarts
-                    max_browser_retries = 5
-                    bet_placed = False
-                    
-                    for browser_retry in range(max_browser_retries):
-                        print(f"\n🔄 Browser restart attempt {browser_retry + 1}/{max_browser_retries}...")
-                        
-                        try:
-                            # Restart browser completely
-                            restart_result = await restart_browser_fresh(p, old_browser=browser, old_page=page)
-                            if restart_result:
-                                page = restart_result["page"]
-                                browser = restart_result["browser"]
-                                print(f"  ✅ Browser restarted successfully")
-                                
-                                # Navigate to soccer page
-                                await page.goto('https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=15000)
-                                await page.wait_for_timeout(2000)
-                                await close_all_modals(page)
-                                
-                                # Wait before retry
-                                print(f"  Waiting 10 seconds before retry...")
-                                await page.wait_for_timeout(10000)
-                                
-                                # Retry the bet
-                                retry_success = await place_bet_slip(page, bet_slip, amount_per_slip, match_cache, outcome_button_cache)
-                                
-                                if retry_success == True:
-                                    successful += 1
-                                    bet_placed = True
-                                    print(f"\n✅ [SUCCESS] Bet {bet_slip['slip_number']} placed after browser restart!")
-                                    
-                                    # Save progress
-                                    with open(progress_file, 'w') as f:
-                                        json.dump({
-                                            'last_completed_bet': i + 1,
-                                            'last_successful_bet': i,
-                                            'successful': successful,
-                                            'failed': 0,
-                                            'match_fingerprint': current_match_fingerprint,
-                                            'timestamp': datetime.now().isoformat(),
-                                            'matches_data': matches,
-                                            'cumulative_runtime_seconds': cumulative_runtime_seconds + (time.time() - script_start_time),
-                                            'outcome_button_cache': outcome_button_cache
-                                        }, f)
-                                    
-                                    break  # Exit retry loop on success
-                                else:
-                                    print(f"  ❌ Retry {browser_retry + 1} failed - will try again...")
-                            else:
-                                print(f"  ❌ Browser restart failed - will try again...")
-                        except Exception as restart_err:
-                            print(f"  ❌ Exception during retry: {restart_err}")
-                        
-                        # Wait before next retry
-                        if browser_retry < max_browser_retries - 1:
-                            wait_time = 15 * (browser_retry + 1)  # Increasing wait: 15s, 30s, 45s, 60s
-                            print(f"  Waiting {wait_time}s before next attempt...")
-                            await asyncio.sleep(wait_time)
-                    
-                    if not bet_placed:
-                        # All retries exhausted - save progress and exit for manual intervention
+                    await asyncio.sleep(2)
+                
+                except Exception as e:
+                    error_str = str(e)
+                
+                    # Check if this is a Playwright memory/object collection error
+                    is_memory_error = "'dict' object has no attribute '_object'" in error_str or \
+                                      "object has been collected" in error_str or \
+                                      "unbounded heap growth" in error_str or \
+                                      "Target page, context or browser has been closed" in error_str
+                
+                    if is_memory_error:
                         print(f"\n{'='*60}")
-                        print(f"⛔ ALL RETRY ATTEMPTS EXHAUSTED")
+                        print(f"⚠️ PLAYWRIGHT MEMORY ERROR DETECTED")
                         print(f"{'='*60}")
-                        print(f"Bet {bet_slip['slip_number']} could not be placed after {max_browser_retries} browser restarts")
-                        print(f"Progress saved - run script again to retry this bet")
-                        print(f"{'='*60}")
-                        
+                        print(f"Error: {error_str[:150]}...")
+                        print(f"\n🔄 Attempting recovery with fresh browser...")
+                    
+                        # Track the memory error
                         error_tracker.add_error(
-                            error_type="BET_FAILED",
-                            error_message=f"Bet {bet_slip['slip_number']} failed after {max_browser_retries} browser restart attempts",
+                            error_type='MEMORY_ERROR',
+                            error_message=f'Playwright memory corruption detected: {error_str[:150]}',
                             context={
                                 'bet_number': bet_slip['slip_number'],
-                                'retry_attempts': max_browser_retries,
-                                'action': 'requires_manual_intervention'
+                                'action': 'attempting_recovery'
                             }
                         )
-                        error_tracker.display_summary()
-                        error_tracker.save_to_file()
-                        
-                        try:
-                            await browser.close()
-                        except:
-                            pass
-                        
-                        import sys
-                        sys.exit(1)
-                    
-                    # Wait between bets after successful retry
-                    if i < len(bet_slips) - 1:
-                        await wait_between_bets(page, seconds=5, add_random=True)
-                
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                error_str = str(e)
-                
-                # Check if this is a Playwright memory/object collection error
-                is_memory_error = "'dict' object has no attribute '_object'" in error_str or \
-                                  "object has been collected" in error_str or \
-                                  "unbounded heap growth" in error_str or \
-                                  "Target page, context or browser has been closed" in error_str
-                
-                if is_memory_error:
-                    print(f"\n{'='*60}")
-                    print(f"⚠️ PLAYWRIGHT MEMORY ERROR DETECTED")
-                    print(f"{'='*60}")
-                    print(f"Error: {error_str[:150]}...")
-                    print(f"\n🔄 Attempting recovery with fresh browser...")
-                    
-                    # Track the memory error
-                    error_tracker.add_error(
-                        error_type='MEMORY_ERROR',
-                        error_message=f'Playwright memory corruption detected: {error_str[:150]}',
-                        context={
-                            'bet_number': bet_slip['slip_number'],
-                            'action': 'attempting_recovery'
-                        }
-                    )
-                    
-                    # Force garbage collection
-                    gc.collect()
                     
-                    # Try to restart browser and recover
-                    try:
-                        restart_result = await restart_browser_fresh(p, old_browser=browser, old_page=page)
-                        if restart_result:
-                            page = restart_result["page"]
-                            browser = restart_result["browser"]
-                            
-                            # Clear and rebuild cache
-                            outcome_button_cache.clear()
-                            print(f"  [RECOVERY] Re-caching outcome buttons...")
-                            for match_idx, match in enumerate(matches[:num_matches], 1):
-                                match_url = match.get('url')
-                                if match_url:
-                                    try:
-                                        await page.goto(match_url, wait_until='domcontentloaded', timeout=15000)
-                                        await page.wait_for_timeout(1000)
-                                        await close_all_modals(page)
-                                        for selector in ['div.grid.p-1 > div.flex.items-center.justify-between.h-12', 'div[price]']:
-                                            buttons = await page.query_selector_all(selector)
-                                            if len(buttons) >= 3:
-                                                outcome_button_cache[match_url] = selector
-                                                break
-                                    except:
-                                        pass
+                        # Try to restart browser and recover
+                        try:
+                            restart_result = await restart_browser_fresh(p, old_browser=browser, old_page=page)
+                            if restart_result:
+                                page = restart_result["page"]
+                                browser = restart_result["browser"]
+                                # The old page/browser proxies only became unreachable with the rebinding above
+                                gc.collect(generation=0)
                             
-                            await page.goto('https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=15000)
-                            await close_all_modals(page)
+                                # Selectors are strings, so they survive the restart - only probe cold entries
+                                probed, cached = await recache_outcome_buttons(
+                                    page, matches, num_matches, outcome_button_cache, phase='recovery'
+                                )
+                                print(f"  [RECOVERY] Probed {probed} uncached match pages, {cached}/{num_matches} matches cached")
                             
-                            print(f"\n✅ RECOVERY SUCCESSFUL - Retrying bet {bet_slip['slip_number']}...")
+                                print(f"\n✅ RECOVERY SUCCESSFUL - Retrying bet {bet_slip['slip_number']}...")
                             
-                            # Log successful recovery
-                            error_tracker.add_error(
-                                error_type='RECOVERY_SUCCESS',
-                                error_message=f'Browser restart recovery successful for bet {bet_slip["slip_number"]}',
-                                context={
-                                    'bet_number': bet_slip['slip_number'],
-                                    'cached_selectors_rebuilt': len(outcome_button_cache),
-                                    'reason': 'memory_corruption_recovery'
-                                }
-                            )
-                            error_tracker.save_to_file()
+                                # Log successful recovery
+                                error_tracker.add_error(
+                                    error_type='RECOVERY_SUCCESS',
+                                    error_message=f'Browser restart recovery successful for bet {bet_slip["slip_number"]}',
+                                    context={
+                                        'bet_number': bet_slip['slip_number'],
+                                        'cached_selectors': cached,
+                                        'selectors_probed': probed,
+                                        'reason': 'memory_corruption_recovery'
+                                    }
+                                )
+                                error_tracker.save_to_file()
                             
-                            # Retry the failed bet with fresh browser
-                            retry_success = await place_bet_slip(page, bet_slip, amount_per_slip, match_cache, outcome_button_cache)
+                                # Retry the failed bet with fresh browser
+                                retry_success = await place_bet_slip(page, bet_slip, amount_per_slip, match_cache, outcome_button_cache)
                             
-                            if retry_success == True:
-                                successful += 1
-                                print(f"\n[SUCCESS] Bet slip {bet_slip['slip_number']} placed after browser restart!")
+                                if retry_success == True:
+                                    successful += 1
+                                    print(f"\n[SUCCESS] Bet slip {bet_slip['slip_number']} placed after browser restart!")
                                 
-                                # Save progress
-                                with open(progress_file, 'w') as f:
-                                    json.dump({
-                                        'last_completed_bet': i + 1,
-                                        'last_successful_bet': i,
-                                        'successful': successful,
-                                        'failed': 0,
-                                        'match_fingerprint': current_match_fingerprint,
-                                        'timestamp': datetime.now().isoformat(),
-                                        'matches_data': matches,
-                                        'cumulative_runtime_seconds': cumulative_runtime_seconds + (time.time() - script_start_time),
-                                        'outcome_button_cache': outcome_button_cache
-                                    }, f)
+                                    # Save progress
+                                    await save_checkpoint(i + 1)
                                 
-                                # Continue to next bet
-                                if i < len(bet_slips) - 1:
-                                    await wait_between_bets(page, seconds=5, add_random=True)
-                                continue  # Skip to next iteration of the loop
+                                    # Continue to next bet
+                                    if i < total_bets - 1:
+                                        await wait_between_bets(page, seconds=5, add_random=True)
+                                    continue  # Skip to next iteration of the loop
+                                else:
+                                    print(f"\n❌ Retry after browser restart also failed")
+                                    error_tracker.add_error(
+                                        error_type='RECOVERY_RETRY_FAILED',
+                                        error_message=f'Bet {bet_slip["slip_number"]} still failed after browser restart recovery',
+                                        context={
+                                            'bet_number': bet_slip['slip_number'],
+                                            'recovery_attempted': True,
+                                            'retry_result': 'failed'
+                                        }
+                                    )
+                                    error_tracker.save_to_file()
+                                    # Fall through to exit
                             else:
-                                print(f"\n❌ Retry after browser restart also failed")
+                                print(f"\n❌ Browser restart failed")
                                 error_tracker.add_error(
-                                    error_type='RECOVERY_RETRY_FAILED',
-                                    error_message=f'Bet {bet_slip["slip_number"]} still failed after browser restart recovery',
+                                    error_type='RECOVERY_BROWSER_RESTART_FAILED',
+                                    error_message=f'Browser restart failed during recovery for bet {bet_slip["slip_number"]}',
                                     context={
                                         'bet_number': bet_slip['slip_number'],
-                                        'recovery_attempted': True,
-                                        'retry_result': 'failed'
+                                        'recovery_stage': 'browser_restart'
                                     }
                                 )
                                 error_tracker.save_to_file()
-                                # Fall through to exit
-                        else:
-                            print(f"\n❌ Browser restart failed")
+                        except Exception as restart_err:
+                            print(f"\n❌ Recovery failed: {restart_err}")
                             error_tracker.add_error(
-                                error_type='RECOVERY_BROWSER_RESTART_FAILED',
-                                error_message=f'Browser restart failed during recovery for bet {bet_slip["slip_number"]}',
+                                error_type='RECOVERY_EXCEPTION',
+                                error_message=f'Recovery exception for bet {bet_slip["slip_number"]}: {str(restart_err)[:150]}',
                                 context={
                                     'bet_number': bet_slip['slip_number'],
-                                    'recovery_stage': 'browser_restart'
-                                }
+                                    'error_details': str(restart_err)
+                                },
+                                exception=restart_err
                             )
                             error_tracker.save_to_file()
-                    except Exception as restart_err:
-                        print(f"\n❌ Recovery failed: {restart_err}")
-                        error_tracker.add_error(
-                            error_type='RECOVERY_EXCEPTION',
-                            error_message=f'Recovery exception for bet {bet_slip["slip_number"]}: {str(restart_err)[:150]}',
-                            context={
-                                'bet_number': bet_slip['slip_number'],
-                                'error_details': str(restart_err)
-                            },
-                            exception=restart_err
-                        )
-                        error_tracker.save_to_file()
                     
-                    # If we get here, single recovery attempt failed
-                    # Try multiple browser restart attempts for this bet
-                    print(f"\n⚠️ First recovery attempt failed - trying additional retries...")
+                        # If we get here, single recovery attempt failed
+                        # Try multiple browser restart attempts for this bet
+                        print(f"\n⚠️ First recovery attempt failed - trying additional retries...")
                     
-                    max_additional_retries = 4  # We already tried once above
-                    bet_placed = False
+                        max_additional_retries = 4  # We already tried once above
+                        bet_placed = False
                     
-                    for additional_retry in range(max_additional_retries):
-                        retry_num = additional_retry + 2  # We already did attempt 1
-                        print(f"\n🔄 Browser restart attempt {retry_num}/5...")
+                        for additional_retry in range(max_additional_retries):
+                            retry_num = additional_retry + 2  # We already did attempt 1
+                            print(f"\n🔄 Browser restart attempt {retry_num}/5...")
                         
-                        try:
-                            gc.collect()
-                            restart_result = await restart_browser_fresh(p, old_browser=browser, old_page=page)
-                            if restart_result:
-                                page = restart_result["page"]
-                                browser = restart_result["browser"]
+                            try:
+                                gc.collect()
+                                restart_result = await restart_browser_fresh(p, old_browser=browser, old_page=page)
+                                if restart_result:
+                                    page = restart_result["page"]
+                                    browser = restart_result["browser"]
                                 
-                                await page.goto('https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=15000)
-                                await page.wait_for_timeout(2000)
-                                await close_all_modals(page)
-                                await page.wait_for_timeout(10000)
+                                    await page.goto('https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=15000)
+                                    await page.wait_for_timeout(2000)
+                                    await close_all_modals(page)
+                                    await page.wait_for_timeout(10000)
                                 
-                                retry_success = await place_bet_slip(page, bet_slip, amount_per_slip, match_cache, outcome_button_cache)
+                                    retry_success = await place_bet_slip(page, bet_slip, amount_per_slip, match_cache, outcome_button_cache)
                                 
-                                if retry_success == True:
-                                    successful += 1
-                                    bet_placed = True
-                                    print(f"\n✅ [SUCCESS] Bet {bet_slip['slip_number']} placed after recovery!")
+                                    if retry_success == True:
+                                        successful += 1
+                                        bet_placed = True
+                                        print(f"\n✅ [SUCCESS] Bet {bet_slip['slip_number']} placed after recovery!")
                                     
-                                    with open(progress_file, 'w') as f:
-                                        json.dump({
-                                            'last_completed_bet': i + 1,
-                                            'last_successful_bet': i,
-                                            'successful': successful,
-                                            'failed': 0,
-                                            'match_fingerprint': current_match_fingerprint,
-                                            'timestamp': datetime.now().isoformat(),
-                                            'matches_data': matches,
-                                            'cumulative_runtime_seconds': cumulative_runtime_seconds + (time.time() - script_start_time),
-                                            'outcome_button_cache': outcome_button_cache
-                                        }, f)
-                                    break
-                        except Exception as retry_err:
-                            print(f"  ❌ Retry {retry_num} exception: {retry_err}")
+                                        await save_checkpoint(i + 1)
+                                        break
+                            except Exception as retry_err:
+                                print(f"  ❌ Retry {retry_num} exception: {retry_err}")
                         
-                        if additional_retry < max_additional_retries - 1:
-                            wait_time = 15 * (additional_retry + 1)
-                            print(f"  Waiting {wait_time}s...")
-                            await asyncio.sleep(wait_time)
+                            if additional_retry < max_additional_retries - 1:
+                                wait_time = 15 * (additional_retry + 1)
+                                print(f"  Waiting {wait_time}s...")
+                                await asyncio.sleep(wait_time)
                     
-                    if bet_placed:
-                        # Success - continue to next bet
-                        if i < len(bet_slips) - 1:
-                            await wait_between_bets(page, seconds=5, add_random=True)
-                        continue
+                        if bet_placed:
+                            # Success - continue to next bet
+                            if i < total_bets - 1:
+                                await wait_between_bets(page, seconds=5, add_random=True)
+                            continue
                     
-                    # All retries exhausted - save progress and exit
-                    print(f"\n⛔ PLAYWRIGHT MEMORY ERROR - All {5} retries exhausted")
-                    print(f"   Saving progress and exiting for manual intervention...")
+                        # All retries exhausted - save progress and exit
+                        print(f"\n⛔ PLAYWRIGHT MEMORY ERROR - All {5} retries exhausted")
+                        print(f"   Saving progress and exiting for manual intervention...")
                     
-                    error_tracker.add_error(
-                        error_type='MEMORY_ERROR',
-                        error_message=f'Playwright memory corruption - all retries exhausted for bet {bet_slip["slip_number"]}',
-                        context={
-                            'bet_number': bet_slip['slip_number'],
-                            'successful_so_far': successful,
-                            'action': 'exiting_for_manual_retry'
-                        }
-                    )
-                    error_tracker.save_to_file()
+                        error_tracker.add_error(
+                            error_type='MEMORY_ERROR',
+                            error_message=f'Playwright memory corruption - all retries exhausted for bet {bet_slip["slip_number"]}',
+                            context={
+                                'bet_number': bet_slip['slip_number'],
+                                'successful_so_far': successful,
+                                'action': 'exiting_for_manual_retry'
+                            }
+                        )
+                        error_tracker.save_to_file()
                     
-                    with open(progress_file, 'w') as f:
-                        json.dump({
-                            'last_completed_bet': i,
-                            'last_successful_bet': i - 1 if i > 0 else -1,
-                            'successful': successful,
-                            'failed': 0,
-                            'match_fingerprint': current_match_fingerprint,
-                            'timestamp': datetime.now().isoformat(),
-                            'matches_data': matches,
-                            'cumulative_runtime_seconds': cumulative_runtime_seconds + (time.time() - script_start_time),
-                            'outcome_button_cache': outcome_button_cache
-                        }, f)
+                        await save_checkpoint(i)
                     
-                    error_tracker.display_summary()
+                        error_tracker.display_summary()
                     
-                    try:
-                        await browser.close()
-                    except:
-                        pass
+                        try:
+                            await browser.close()
+                        except:
+                            pass
                     
-                    import sys
-                    sys.exit(1)
+                        import sys
+                        sys.exit(1)
                 
-                # Regular exception handling - try browser restart loop
-                print(f"\n[ERROR] Exception on slip {bet_slip['slip_number']}: {e}")
-                print(f"\n🔄 ALL BETS ARE IMPORTANT - Attempting browser restart...")
+                    # Regular exception handling - try browser restart loop
+                    print(f"\n[ERROR] Exception on slip {bet_slip['slip_number']}: {e}")
+                    print(f"\n🔄 ALL BETS ARE IMPORTANT - Attempting browser restart...")
                 
-                error_tracker.add_error(
-                    error_type="EXCEPTION",
-                    error_message=f"Exception during bet {bet_slip['slip_number']} - attempting browser restart",
-                    context={'bet_number': bet_slip['slip_number'], 'action': 'browser_restart_loop'},
-                    exception=e
-                )
-                error_tracker.save_to_file()
+                    error_tracker.add_error(
+                        error_type="EXCEPTION",
+                        error_message=f"Exception during bet {bet_slip['slip_number']} - attempting browser restart",
+                        context={'bet_number': bet_slip['slip_number'], 'action': 'browser_restart_loop'},
+                        exception=e
+                    )
+                    error_tracker.save_to_file()
                 
-                # Save progress at this bet
-                with open(progress_file, 'w') as f:
-                    json.dump({
-                        'last_completed_bet': i,
-                        'last_successful_bet': i - 1 if i > 0 else -1,
-                        'successful': successful,
-                        'failed': 0,
-                        'match_fingerprint': current_match_fingerprint,
-                        'timestamp': datetime.now().isoformat(),
-                        'matches_data': matches,
-                        'cumulative_runtime_seconds': cumulative_runtime_seconds + (time.time() - script_start_time),
-                        'outcome_button_cache': outcome_button_cache
-                    }, f)
+                    # Save progress at this bet
+                    await save_checkpoint(i)
                 
-                # Browser restart retry loop
-                max_browser_retries = 5
-                bet_placed = False
+                    # Browser restart retry loop
+                    max_browser_retries = 5
+                    bet_placed = False
                 
-                for browser_retry in range(max_browser_retries):
-                    print(f"\n🔄 Browser restart attempt {browser_retry + 1}/{max_browser_retries}...")
+                    for browser_retry in range(max_browser_retries):
+                        print(f"\n🔄 Browser restart attempt {browser_retry + 1}/{max_browser_retries}...")
                     
-                    try:
-                        restart_result = await restart_browser_fresh(p, old_browser=browser, old_page=page)
-                        if restart_result:
-                            page = restart_result["page"]
-                            browser = restart_result["browser"]
+                        try:
+                            restart_result = await restart_browser_fresh(p, old_browser=browser, old_page=page)
+                            if restart_result:
+                                page = restart_result["page"]
+                                browser = restart_result["browser"]
                             
-                            await page.goto('https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=15000)
-                            await page.wait_for_timeout(2000)
-                            await close_all_modals(page)
-                            await page.wait_for_timeout(10000)
+                                await page.goto('https://new.betway.co.za/sport/soccer/upcoming', wait_until='domcontentloaded', timeout=15000)
+                                await page.wait_for_timeout(2000)
+                                await close_all_modals(page)
+                                await page.wait_for_timeout(10000)
                             
-                            retry_success = await place_bet_slip(page, bet_slip, amount_per_slip, match_cache, outcome_button_cache)
+                                retry_success = await place_bet_slip(page, bet_slip, amount_per_slip, match_cache, outcome_button_cache)
                             
-                            if retry_success == True:
-                                successful += 1
-                                bet_placed = True
-                                print(f"\n✅ [SUCCESS] Bet {bet_slip['slip_number']} placed!")
+                                if retry_success == True:
+                                    successful += 1
+                                    bet_placed = True
+                                    print(f"\n✅ [SUCCESS] Bet {bet_slip['slip_number']} placed!")
                                 
-                                with open(progress_file, 'w') as f:
-                                    json.dump({
-                                        'last_completed_bet': i + 1,
-                                        'last_successful_bet': i,
-                                        'successful': successful,
-                                        'failed': 0,
-                                        'match_fingerprint': current_match_fingerprint,
-                                        'timestamp': datetime.now().isoformat(),
-                                        'matches_data': matches,
-                                        'cumulative_runtime_seconds': cumulative_runtime_seconds + (time.time() - script_start_time),
-                                        'outcome_button_cache': outcome_button_cache
-                                    }, f)
-                                break
-                    except Exception as restart_err:
-                        print(f"  ❌ Exception: {restart_err}")
+                                    await save_checkpoint(i + 1)
+                                    break
+                        except Exception as restart_err:
+                            print(f"  ❌ Exception: {restart_err}")
                     
-                    if browser_retry < max_browser_retries - 1:
-                        wait_time = 15 * (browser_retry + 1)
-                        print(f"  Waiting {wait_time}s...")
-                        await asyncio.sleep(wait_time)
+                        if browser_retry < max_browser_retries - 1:
+                            wait_time = 15 * (browser_retry + 1)
+                            print(f"  Waiting {wait_time}s...")
+                            await asyncio.sleep(wait_time)
                 
-                if not bet_placed:
-                    print(f"\n⛔ All retries exhausted - saving progress and exiting")
+                    if not bet_placed:
+                        print(f"\n⛔ All retries exhausted - saving progress and exiting")
                     
-                    error_tracker.display_summary()
-                    error_tracker.save_to_file()
+                        error_tracker.display_summary()
+                        error_tracker.save_to_file()
                     
-                    try:
-                        await browser.close()
-                    except:
-                        pass
+                        try:
+                            await browser.close()
+                        except:
+                            pass
                     
-                    import sys
-                    sys.exit(1)
+                        import sys
+                        sys.exit(1)
                 
-                # Wait between bets
-                if i < len(bet_slips) - 1:
-                    await wait_between_bets(page, seconds=5, add_random=True)
+                    # Wait between bets
+                    if i < total_bets - 1:
+                        await wait_between_bets(page, seconds=5, add_random=True)
+        finally:
+            # Runs on sys.exit and on unexpected exceptions too, so a queued checkpoint is never lost
+            await stop_checkpoints()
         
         # Note: Retry loop removed - all bets now retry until success during main loop
         # If we reach this point, all bets were placed successfully
@@ -5819,7 +6498,7 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
         print("\n" + "="*60)
         print(f"🏁 FINAL RESULTS")
         print("="*60)
-        print(f"✅ All bets placed successfully: {successful}/{len(bet_slips)}")
+        print(f"✅ All bets placed successfully: {successful}/{total_bets}")
         print(f"💰 Total amount wagered: R{successful * amount_per_slip:.2f}")
         print(f"📊 Success rate: 100%")
         print("="*60)
@@ -5827,9 +6506,9 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
         # Log script completion
         error_tracker.add_error(
             error_type='SCRIPT_COMPLETED',
-            error_message=f'Betting session completed: {successful}/{len(bet_slips)} successful - ALL BETS PLACED',
+            error_message=f'Betting session completed: {successful}/{total_bets} successful - ALL BETS PLACED',
             context={
-                'total_bets': len(bet_slips),
+                'total_bets': total_bets,
                 'successful': successful,
                 'amount_wagered': successful * amount_per_slip,
                 'completion_status': 'success'
@@ -5845,7 +6524,7 @@ async def main_async(num_matches=None, amount_per_slip=None, min_gap_hours=2.0):
         # Clean up progress file - all bets are now successful
         if os.path.exists(progress_file):
             try:
-                os.remove(progress_file)
+                clear_progress(progress_file)
                 print("\n✅ [CLEANUP] Progress file removed - all bets completed successfully!")
             except:
                 pass
@@ -5955,10 +6634,13 @@ def main():
 
 def main_with_auto_retry():
     """
-    Wrapper that automatically restarts the script as a NEW PROCESS when it crashes.
-    This is the correct solution for Playwright memory corruption errors because:
+    Wrapper that automatically restarts the script when it crashes.
+    The first IN_PROCESS_ATTEMPTS runs happen in this interpreter: main_async starts a fresh
+    Playwright driver and browser each time, which is what a Playwright memory error needs,
+    without paying for a new interpreter and the imports. After that it falls back to a NEW
+    PROCESS per attempt, in case the interpreter itself is what keeps failing:
     1. A fresh process has clean memory state
-    2. Progress is saved to file, so new process resumes from where it left off
+    2. Progress is saved to file, so every attempt resumes from where the last one left off
     3. Uses subprocess to spawn completely isolated Python process
     
     IMPORTANT: This wrapper catches ALL crashes including:
@@ -5975,6 +6657,7 @@ def main_with_auto_retry():
     import signal
     
     MAX_RETRIES = 5  # Maximum number of automatic restarts
+    IN_PROCESS_ATTEMPTS = 3  # First run + 2 retries in this process, then one subprocess per retry
     RETRY_DELAY = 15  # Seconds to wait before restarting
     # Timeout is for TOTAL runtime, not inactivity. Each bet can take 2+ min with delays.
     # For 243 bets at ~2min each = ~8 hours. Set to 200 hours to handle week-long operations.
@@ -5993,13 +6676,41 @@ def main_with_auto_retry():
         main()
         return
     
+    def run_in_process():
+        """Run main() in this interpreter and return the exit code a subprocess would have had."""
+        global error_tracker
+        error_tracker = ErrorTracker()  # New session per attempt, as a new process would start
+        try:
+            main()
+            return 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                return e.code or 0
+            return 1
+        except Exception as e:
+            traceback.print_exc()
+            error_tracker.add_error(
+                error_type="EXCEPTION",
+                error_message=f"Main function crashed with: {str(e)[:200]}",
+                context={'mode': 'in-process'},
+                exception=e
+            )
+            error_tracker.display_summary()
+            error_tracker.save_to_file()
+            return 1
+        finally:
+            # The async_playwright() exit already stopped the driver and its browsers; what is
+            # left of the old connection's objects (some frozen by gc.freeze) is garbage now
+            gc.unfreeze()
+            gc.collect()
+    
     total_start_time = time_module.time()
     retry_count = 0
     
     print(f"\n{'='*60}")
     print(f"🚀 AUTO-RETRY WRAPPER ACTIVE")
     print(f"{'='*60}")
-    print(f"   Max retries: {MAX_RETRIES}")
+    print(f"   Max retries: {MAX_RETRIES} (first {IN_PROCESS_ATTEMPTS - 1} in-process)")
     print(f"   Retry delay: {RETRY_DELAY}s")
     print(f"   ⚠️  SUBPROCESS TIMEOUT: {SUBPROCESS_TIMEOUT}s ({SUBPROCESS_TIMEOUT//60} min)")
     print(f"   ⚠️  This was previously 420s (7min) causing hangs - NOW FIXED")
@@ -6018,7 +6729,10 @@ def main_with_auto_retry():
             elapsed_secs = int(elapsed_total % 60)
             print(f"🔄 AUTO-RESTART ATTEMPT {retry_count}/{MAX_RETRIES}")
             print(f"   Total elapsed time: {elapsed_mins}m {elapsed_secs}s")
-            print(f"   Spawning fresh Python process...")
+            if retry_count < IN_PROCESS_ATTEMPTS:
+                print(f"   Relaunching the browser in this process...")
+            else:
+                print(f"   Spawning fresh Python process...")
             print(f"   Will resume from last saved progress...")
         else:
             print(f"🚀 STARTING BETWAY AUTOMATION (Attempt 1)")
@@ -6030,18 +6744,25 @@ def main_with_auto_retry():
         
         exit_code = None
         error_reason = None
+        in_process = retry_count < IN_PROCESS_ATTEMPTS
+        
+        # The child shares the console - get our buffered lines out before its output
+        sys.stdout.flush()
         
         try:
-            # Run as subprocess - this is a COMPLETELY NEW Python process
-            # Use timeout to prevent infinite hangs
-            result = subprocess.run(
-                cmd,
-                cwd=os.getcwd(),
-                timeout=SUBPROCESS_TIMEOUT,
-                # Don't capture output - let it print directly to console
-            )
-            
-            exit_code = result.returncode
+            if in_process:
+                exit_code = run_in_process()
+            else:
+                # Run as subprocess - this is a COMPLETELY NEW Python process
+                # Use timeout to prevent infinite hangs
+                result = subprocess.run(
+                    cmd,
+                    cwd=os.getcwd(),
+                    timeout=SUBPROCESS_TIMEOUT,
+                    # Don't capture output - let it print directly to console
+                )
+                
+                exit_code = result.returncode
             
         except subprocess.TimeoutExpired:
             # Process hung - need to restart
@@ -6099,6 +6820,14 @@ def main_with_auto_retry():
                 'exit_code': exit_code
             })
         
+        # An unreadable progress log fails identically on every attempt - don't retry it
+        if exit_code == EXIT_PROGRESS_UNREADABLE:
+            print(f"\n{'='*60}")
+            print(f"❌ PROGRESS LOG UNREADABLE - not retrying")
+            print(f"   Fix or delete bet_progress.json and its .log, then run again")
+            print(f"{'='*60}\n")
+            return
+        
         # Check result
         if exit_code == 0:
             # Success!
@@ -6122,7 +6851,7 @@ def main_with_auto_retry():
             wrapper_crashes.append({
                 'attempt': retry_count,
                 'error_type': crash_error_type,
-                'error_message': f'Subprocess exited with code {exit_code}',
+                'error_message': f"{'Attempt' if in_process else 'Subprocess'} exited with code {exit_code}",
                 'timestamp': datetime.now().isoformat(),
                 'exit_code': exit_code,
                 'attempt_duration': int(attempt_elapsed)
@@ -6144,6 +6873,7 @@ def main_with_auto_retry():
             # Force garbage collection in parent process too
             gc.collect()
             
+            sys.stdout.flush()
             time_module.sleep(RETRY_DELAY)
         else:
             elapsed_total = time_module.time() - total_start_time